@@ -1,5 +1,9 @@
+import asyncio
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable
 from datetime import UTC, datetime
+from typing import TypeVar
 
 from app.schemas.application import Application
 from app.schemas.listing import Listing
@@ -25,6 +29,8 @@ ZERO_REQUIRED_SKILL_COVERAGE = 1.0
 
 MATCH_SCORE_EMPTY_VALUE = 0.0
 
+T = TypeVar('T')
+
 
 class ApplicationAnalysisClient(ABC):
   async def generate_analysis(
@@ -33,25 +39,49 @@ class ApplicationAnalysisClient(ABC):
     application: Application,
     resume: Resume,
   ) -> ApplicationAnalysis:
-    skills_comparison = await self.get_skills_comparison(
-      listing=listing,
-      application=application,
-      resume=resume,
-    )
-    content_quality = await self.get_content_quality(
-      listing=listing,
-      application=application,
-      resume=resume,
-    )
+    stage_timings: dict[str, float] = {}
+
+    # Skills comparison and content quality are independent, so they run side by side; only
+    # the suggestions need the match score both of them feed into
+    tasks = [
+      asyncio.create_task(
+        self._time_stage(
+          stage_timings,
+          'skills_comparison',
+          self.get_skills_comparison(listing=listing, application=application, resume=resume),
+        )
+      ),
+      asyncio.create_task(
+        self._time_stage(
+          stage_timings,
+          'content_quality',
+          self.get_content_quality(listing=listing, application=application, resume=resume),
+        )
+      ),
+    ]
+    try:
+      skills_comparison, content_quality = await asyncio.gather(*tasks)
+    except BaseException:
+      # One failed stage fails the analysis, so stop spending model calls on the other
+      for task in tasks:
+        task.cancel()
+      await asyncio.gather(*tasks, return_exceptions=True)
+      raise
+
     match_score = self.compute_match_score(
       skills_comparison=skills_comparison,
       content_quality=content_quality,
     )
-    ai_suggestions = await self.get_ai_suggestions(
-      listing=listing,
-      application=application,
-      resume=resume,
-      match_score=match_score,
+    ai_suggestions = await self._time_stage(
+      stage_timings,
+      'ai_suggestions',
+      self.get_ai_suggestions(
+        listing=listing,
+        application=application,
+        resume=resume,
+        match_score=match_score,
+        content_quality=content_quality,
+      ),
     )
 
     return ApplicationAnalysis(
@@ -61,8 +91,16 @@ class ApplicationAnalysisClient(ABC):
       skills_comparison=skills_comparison,
       content_quality=content_quality,
       ai_suggestions=ai_suggestions,
+      stage_timings=stage_timings,
     )
 
+  async def _time_stage(self, timings: dict[str, float], stage: str, work: Awaitable[T]) -> T:
+    started = time.perf_counter()
+    try:
+      return await work
+    finally:
+      timings[stage] = round(time.perf_counter() - started, 3)
+
   @abstractmethod
   async def get_skills_comparison(
     self,
@@ -90,6 +128,7 @@ class ApplicationAnalysisClient(ABC):
     application: Application,
     resume: Resume,
     match_score: float,
+    content_quality: list[ContentQualitySection],
   ) -> AISuggestions:
     """Generate holistic AI summary and unit-level suggestions for a listing+resume pair."""
     pass
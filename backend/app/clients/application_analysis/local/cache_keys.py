@@ -0,0 +1,22 @@
+from app.schemas.listing import Listing
+from app.utils.hash import hash_json_value, hash_trimmed_text
+
+
+def content_quality_scope_hash(requirement_texts: list[str], lexical_terms: list[str]) -> str:
+  # Unit scores depend on every requirement and lexical term, so any change rescores all units
+  return hash_json_value({'requirements': requirement_texts, 'lexical_terms': lexical_terms})
+
+
+def required_skill_scope_hash(listing: Listing) -> str:
+  # Skills are left out so adding one to the listing only scores the new skill
+  return hash_json_value(
+    {
+      'title': listing.title,
+      'description': listing.description,
+      'requirements': listing.requirements,
+    }
+  )
+
+
+def resume_skill_scope_hash(resume_text: str) -> str:
+  return hash_trimmed_text(resume_text)
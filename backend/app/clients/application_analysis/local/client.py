@@ -1,12 +1,20 @@
+import asyncio
+import logging
+from collections.abc import Callable
 from typing import Annotated
-from uuid import UUID
 
 from fastapi import Depends
 
 from app.clients.model import ModelClient, get_model_client
+from app.managers import run_in_db_thread
+from app.repositories import AnalysisCacheRepository
+from app.repositories.analysis_cache_repository import AnalysisCacheKind
 from app.schemas.application import Application
 from app.schemas.listing import Listing
 from app.schemas.resume import Resume
+from app.services.config import get_settings
+from app.services.config.schemas import AppConfig
+from app.utils.auth_context import is_authorized
 from app.utils.deduplication import deduplicate_by
 from app.utils.errors import ServiceError
 from app.utils.hash import hash_trimmed_text
@@ -27,10 +35,15 @@ from .ai_suggestions import (
   map_suggestions_response,
 )
 from .analysis_text import build_listing_analysis_text, build_resume_analysis_text
+from .cache_keys import (
+  content_quality_scope_hash,
+  required_skill_scope_hash,
+  resume_skill_scope_hash,
+)
 from .content_quality import (
   build_lexical_terms,
   build_requirement_texts,
-  calculate_content_quality_score,
+  calculate_content_quality_scores,
 )
 from .prompts import (
   AI_SUGGESTIONS_PROMPT,
@@ -38,18 +51,25 @@ from .prompts import (
   SKILL_RESUME_SCORE_PROMPT,
 )
 from .schemas import AISuggestionsResponse
-from .skills_comparison import score_skills_from_prompt
+from .skills_comparison import blend_skill_scores, normalize_skill, score_skills_from_prompt
 from .text_units import extract_section_text_units
 
+logger = logging.getLogger(__name__)
+
 
 class LocalApplicationAnalysisClient(ApplicationAnalysisClient):
   def __init__(
     self,
     llm_client: Annotated[ModelClient, Depends(get_model_client)],
+    settings: Annotated[AppConfig, Depends(get_settings)],
+    analysis_cache_repository: Annotated[AnalysisCacheRepository, Depends()],
   ) -> None:
     self.llm_client = llm_client
-    # Reuse content-quality scores locally without coupling the base client to this optimization.
-    self._content_quality_cache: dict[tuple[UUID, UUID, str], list[ContentQualitySection]] = {}
+    # Every stage of an analysis shares these slots, so running stages concurrently never
+    # sends more model requests at once than configured
+    self._llm_slots = asyncio.Semaphore(settings.model.analysis_concurrency)
+    self.settings = settings
+    self.analysis_cache_repository = analysis_cache_repository
 
   async def get_skills_comparison(
     self,
@@ -61,30 +81,45 @@ class LocalApplicationAnalysisClient(ApplicationAnalysisClient):
     listing_text = build_listing_analysis_text(listing)
     resume_text = build_resume_analysis_text(resume)
 
-    required_prompt = SKILL_REQUIRED_SCORE_PROMPT.format(
-      application_name=application.name,
-      listing_title=listing.title,
-      skills=to_bullets(skills),
-      source_text=listing_text,
+    model_id = self._llm_model_id()
+    skill_keys = [normalize_skill(skill) for skill in skills]
+    required_scope_hash = required_skill_scope_hash(listing)
+    resume_scope_hash = resume_skill_scope_hash(resume_text)
+    # Both lookups finish before any model request goes out, so the two scoring requests are
+    # always issued in the same order
+    required_cached, resume_cached = await asyncio.gather(
+      self._get_cached_scores('required_skill', model_id, required_scope_hash, skill_keys),
+      self._get_cached_scores('resume_skill', model_id, resume_scope_hash, skill_keys),
     )
-    resume_prompt = SKILL_RESUME_SCORE_PROMPT.format(
-      application_name=application.name,
-      skills=to_bullets(skills),
-      source_text=resume_text,
-    )
-
-    required_scores = await score_skills_from_prompt(
-      llm_client=self.llm_client,
-      skills=skills,
-      source_text=listing_text,
-      prompt=required_prompt,
-    )
-    resume_scores = await score_skills_from_prompt(
-      llm_client=self.llm_client,
-      skills=skills,
-      source_text=resume_text,
-      prompt=resume_prompt,
+    required_llm_scores, resume_llm_scores = await asyncio.gather(
+      self._complete_skill_scores(
+        'required_skill',
+        model_id,
+        required_scope_hash,
+        skills,
+        required_cached,
+        lambda missing_skills: SKILL_REQUIRED_SCORE_PROMPT.format(
+          application_name=application.name,
+          listing_title=listing.title,
+          skills=to_bullets(missing_skills),
+          source_text=listing_text,
+        ),
+      ),
+      self._complete_skill_scores(
+        'resume_skill',
+        model_id,
+        resume_scope_hash,
+        skills,
+        resume_cached,
+        lambda missing_skills: SKILL_RESUME_SCORE_PROMPT.format(
+          application_name=application.name,
+          skills=to_bullets(missing_skills),
+          source_text=resume_text,
+        ),
+      ),
     )
+    required_scores = blend_skill_scores(skills, listing_text, required_llm_scores)
+    resume_scores = blend_skill_scores(skills, resume_text, resume_llm_scores)
 
     return [
       SkillComparisonRow(
@@ -101,55 +136,68 @@ class LocalApplicationAnalysisClient(ApplicationAnalysisClient):
     application: Application,
     resume: Resume,
   ) -> list[ContentQualitySection]:
-    cache_key = (
-      listing.id,
-      application.id,
-      resume.create_hash(),
-    )
-
-    if cache_key in self._content_quality_cache:
-      return self._content_quality_cache[cache_key]
-
     requirement_texts = build_requirement_texts(listing)
     if not requirement_texts:
       raise ServiceError('Add requirements to the listing before running content analysis.')
 
     lexical_terms = build_lexical_terms(listing)
-    requirement_embeddings = await self.llm_client.embed(requirement_texts)
-    section_summaries: list[ContentQualitySection] = []
-
-    for section in resume.sections:
-      section_units = extract_section_text_units(section)
-      if not section_units:
-        continue
-
-      unit_embeddings = await self.llm_client.embed([text for _, text in section_units])
-      scored_units: list[ContentQualityScore] = []
-
-      for (unit_id, text), unit_embedding in zip(section_units, unit_embeddings, strict=True):
-        score = calculate_content_quality_score(
-          text=text,
-          unit_embedding=unit_embedding,
-          requirement_embeddings=requirement_embeddings,
-          lexical_terms=lexical_terms,
+    sections = [
+      (section, section_units)
+      for section in resume.sections
+      if (section_units := extract_section_text_units(section))
+    ]
+    unit_texts_by_hash = {
+      hash_trimmed_text(text): text for _, units in sections for _, text in units
+    }
+
+    model_id = self._embedding_model_id()
+    scope_hash = content_quality_scope_hash(requirement_texts, lexical_terms)
+    scores_by_hash = await self._get_cached_scores(
+      'content_quality', model_id, scope_hash, list(unit_texts_by_hash)
+    )
+
+    # Only units whose text changed since the last analysis need embedding and scoring. The
+    # requirements and those units are embedded in one batched round, then every unit is scored
+    # against the requirements in a single matrix multiply.
+    missing = {
+      unit_hash: text
+      for unit_hash, text in unit_texts_by_hash.items()
+      if unit_hash not in scores_by_hash
+    }
+    if missing:
+      async with self._llm_slots:
+        requirement_embeddings, unit_embeddings = await self.llm_client.embed_groups(
+          [requirement_texts, list(missing.values())]
+        )
+      new_scores = dict(
+        zip(
+          missing,
+          calculate_content_quality_scores(
+            texts=list(missing.values()),
+            unit_embeddings=unit_embeddings,
+            requirement_embeddings=requirement_embeddings,
+            lexical_terms=lexical_terms,
+          ),
+          strict=True,
         )
-        scored_units.append(
+      )
+      scores_by_hash.update(new_scores)
+      await self._cache_scores('content_quality', model_id, scope_hash, new_scores)
+
+    return [
+      ContentQualitySection(
+        section_id=section.id,
+        scores=[
           ContentQualityScore(
             unit_id=unit_id,
-            unit_hash=hash_trimmed_text(text),
-            score=score,
+            unit_hash=(unit_hash := hash_trimmed_text(text)),
+            score=scores_by_hash[unit_hash],
           )
-        )
-
-      section_summaries.append(
-        ContentQualitySection(
-          section_id=section.id,
-          scores=scored_units,
-        )
+          for unit_id, text in section_units
+        ],
       )
-
-    self._content_quality_cache[cache_key] = section_summaries
-    return section_summaries
+      for section, section_units in sections
+    ]
 
   async def get_ai_suggestions(
     self,
@@ -157,6 +205,7 @@ class LocalApplicationAnalysisClient(ApplicationAnalysisClient):
     application: Application,
     resume: Resume,
     match_score: float,
+    content_quality: list[ContentQualitySection],
   ) -> AISuggestions:
     max_suggestions = compute_suggestion_budget(match_score)
     if max_suggestions <= 0:
@@ -164,11 +213,6 @@ class LocalApplicationAnalysisClient(ApplicationAnalysisClient):
         summary=DEFAULT_EMPTY_SUGGESTIONS_SUMMARY,
       )
 
-    content_quality = await self.get_content_quality(
-      listing=listing,
-      application=application,
-      resume=resume,
-    )
     quality_score_by_unit_id, unit_hash_by_unit_id = build_content_quality_lookups(content_quality)
     unit_rows = build_suggestion_unit_rows(resume, quality_score_by_unit_id)
 
@@ -187,10 +231,11 @@ class LocalApplicationAnalysisClient(ApplicationAnalysisClient):
       max_suggestions=max_suggestions,
       units_json=to_json_string(unit_rows),
     )
-    suggestions_response = await self.llm_client.call_structured(
-      input=prompt,
-      response_model=AISuggestionsResponse,
-    )
+    async with self._llm_slots:
+      suggestions_response = await self.llm_client.call_structured(
+        input=prompt,
+        response_model=AISuggestionsResponse,
+      )
 
     return map_suggestions_response(
       suggestions_response,
@@ -198,6 +243,71 @@ class LocalApplicationAnalysisClient(ApplicationAnalysisClient):
       max_suggestions=max_suggestions,
     )
 
+  async def _complete_skill_scores(
+    self,
+    kind: AnalysisCacheKind,
+    model_id: str,
+    scope_hash: str,
+    skills: list[str],
+    cached: dict[str, float],
+    build_prompt: Callable[[list[str]], str],
+  ) -> dict[str, int]:
+    llm_scores = {key: int(score) for key, score in cached.items()}
+
+    # Only skills the model has not scored against this text before need a request
+    missing_skills = [skill for skill in skills if normalize_skill(skill) not in llm_scores]
+    if not missing_skills:
+      return llm_scores
+
+    async with self._llm_slots:
+      new_scores = await score_skills_from_prompt(
+        llm_client=self.llm_client,
+        skills=missing_skills,
+        prompt=build_prompt(missing_skills),
+      )
+    await self._cache_scores(kind, model_id, scope_hash, dict(new_scores))
+    return {**llm_scores, **new_scores}
+
+  def _llm_model_id(self) -> str:
+    # Signed-in requests go to the cloud service, which picks its own models
+    if is_authorized():
+      return 'cloud'
+    return f'{self.settings.model.provider}:{self.settings.model.llm}'
+
+  def _embedding_model_id(self) -> str:
+    if is_authorized():
+      return 'cloud'
+    return f'{self.settings.model.provider}:{self.settings.model.embedding}'
+
+  async def _get_cached_scores(
+    self,
+    kind: AnalysisCacheKind,
+    model_id: str,
+    scope_hash: str,
+    item_keys: list[str],
+  ) -> dict[str, float]:
+    try:
+      return await run_in_db_thread(
+        self.analysis_cache_repository.get_scores, kind, model_id, scope_hash, item_keys
+      )
+    except ServiceError:
+      logger.warning('Could not read cached %s scores', kind, exc_info=True)
+      return {}
+
+  async def _cache_scores(
+    self,
+    kind: AnalysisCacheKind,
+    model_id: str,
+    scope_hash: str,
+    scores: dict[str, float],
+  ) -> None:
+    try:
+      await run_in_db_thread(
+        self.analysis_cache_repository.put_scores, kind, model_id, scope_hash, scores
+      )
+    except ServiceError:
+      logger.warning('Could not cache %s scores', kind, exc_info=True)
+
 
 def build_analysis_skill_targets(listing: Listing) -> list[str]:
   terms = listing.skills + [keyword.word for keyword in listing.keywords]
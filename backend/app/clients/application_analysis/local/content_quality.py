@@ -1,6 +1,7 @@
 from app.schemas.listing import Listing
-from app.utils.deduplication import cosine_similarity, deduplicate_by
+from app.utils.deduplication import deduplicate_by
 from app.utils.math import clamp
+from app.utils.similarity import max_similarities
 from app.utils.text import contains_phrase
 
 CONTENT_LEXICAL_WEIGHT = 0.2
@@ -31,15 +32,34 @@ def calculate_content_quality_score(
   requirement_embeddings: list[list[float]],
   lexical_terms: list[str],
 ) -> float:
-  lexical_hit = 1.0 if any(contains_phrase(text, term) for term in lexical_terms) else 0.0
+  return calculate_content_quality_scores(
+    texts=[text],
+    unit_embeddings=[unit_embedding],
+    requirement_embeddings=requirement_embeddings,
+    lexical_terms=lexical_terms,
+  )[0]
 
-  semantic_score = 0.0
-  for requirement_embedding in requirement_embeddings:
-    similarity = cosine_similarity(unit_embedding, requirement_embedding)
-    semantic_score = max(semantic_score, similarity)
 
-  return clamp(
-    (CONTENT_SEMANTIC_WEIGHT * semantic_score) + (CONTENT_LEXICAL_WEIGHT * lexical_hit),
-    0.0,
-    1.0,
-  )
+def calculate_content_quality_scores(
+  texts: list[str],
+  unit_embeddings: list[list[float]],
+  requirement_embeddings: list[list[float]],
+  lexical_terms: list[str],
+) -> list[float]:
+  """Score many units at once; every unit-to-requirement similarity comes from one matmul."""
+  if not texts:
+    return []
+
+  semantic_scores = max_similarities(unit_embeddings, requirement_embeddings)
+  scores = []
+  for text, semantic_score in zip(texts, semantic_scores, strict=True):
+    lexical_hit = 1.0 if any(contains_phrase(text, term) for term in lexical_terms) else 0.0
+    scores.append(
+      clamp(
+        (CONTENT_SEMANTIC_WEIGHT * max(semantic_score, 0.0))
+        + (CONTENT_LEXICAL_WEIGHT * lexical_hit),
+        0.0,
+        1.0,
+      )
+    )
+  return scores
@@ -11,18 +11,27 @@ KEYWORD_WEIGHT = 0.4
 async def score_skills_from_prompt(
   llm_client: ModelClient,
   skills: list[str],
-  source_text: str,
   prompt: str,
 ) -> dict[str, int]:
+  """Ask the model to score `skills`; returns its raw scores keyed by normalized skill."""
   llm_result = await llm_client.call_structured(
     input=prompt,
     response_model=SkillScoreResult,
   )
-  return calculate_hybrid_skill_scores(
-    skills=skills,
-    source_text=source_text,
-    llm_result=llm_result,
-  )
+  return parse_llm_skill_scores(skills, llm_result)
+
+
+def normalize_skill(skill: str) -> str:
+  return skill.lower().strip()
+
+
+def parse_llm_skill_scores(skills: list[str], llm_result: SkillScoreResult) -> dict[str, int]:
+  expected_skills = {normalize_skill(skill) for skill in skills}
+  scored_skills = {normalize_skill(row.skill) for row in llm_result.rows}
+  if expected_skills != scored_skills:
+    raise ServiceError('The AI response was incomplete. Try running the analysis again.')
+
+  return {normalize_skill(row.skill): int(clamp(row.score, 0.0, 100.0)) for row in llm_result.rows}
 
 
 def calculate_hybrid_skill_scores(
@@ -30,24 +39,28 @@ def calculate_hybrid_skill_scores(
   source_text: str,
   llm_result: SkillScoreResult,
 ) -> dict[str, int]:
-  expected_skills = {skill.lower().strip() for skill in skills}
-  scored_skills = {row.skill.lower().strip() for row in llm_result.rows}
-  if expected_skills != scored_skills:
-    raise ServiceError('The AI response was incomplete. Try running the analysis again.')
+  return blend_skill_scores(
+    skills=skills,
+    source_text=source_text,
+    llm_scores_by_skill=parse_llm_skill_scores(skills, llm_result),
+  )
+
 
-  llm_scores_by_skill = {
-    row.skill.lower().strip(): int(clamp(row.score, 0.0, 100.0)) for row in llm_result.rows
-  }
+def blend_skill_scores(
+  skills: list[str],
+  source_text: str,
+  llm_scores_by_skill: dict[str, int],
+) -> dict[str, int]:
   keyword_counts_by_skill: dict[str, int] = {}
   for skill in skills:
-    key = skill.lower().strip()
+    key = normalize_skill(skill)
     keyword_counts_by_skill[key] = len(find_phrase_matches(source_text, skill))
 
   max_count = max(keyword_counts_by_skill.values()) if keyword_counts_by_skill else 0
 
   hybrid_scores: dict[str, int] = {}
   for skill in skills:
-    key = skill.lower().strip()
+    key = normalize_skill(skill)
     keyword_count = keyword_counts_by_skill[key]
     keyword_score = (keyword_count / max_count) if max_count > 0 else 0.0
     llm_component = llm_scores_by_skill[key] / 100
@@ -4,6 +4,7 @@ import httpx
 from fastapi import Depends
 from pydantic import BaseModel
 
+from app.managers import model_clients
 from app.services.config import get_settings
 from app.services.config.schemas import AppConfig
 from app.utils.auth_context import get_session_token
@@ -55,17 +56,17 @@ class CloudApiClient:
     else:
       json_payload = payload
 
+    client = model_clients.http(self._base_url, self._timeout, self.config.model)
     try:
-      async with httpx.AsyncClient(base_url=self._base_url, timeout=self._timeout) as client:
-        response = await client.request(
-          method=method,
-          url=path,
-          params=params,
-          json=json_payload,
-          content=text_payload,
-          headers=headers,
-        )
-        response.raise_for_status()
+      response = await client.request(
+        method=method,
+        url=path,
+        params=params,
+        json=json_payload,
+        content=text_payload,
+        headers=headers,
+      )
+      response.raise_for_status()
     except httpx.HTTPStatusError as exc:
       raise ServiceError('Atto cloud is unavailable right now. Please try again later.') from exc
     except httpx.RequestError as exc:
@@ -3,20 +3,37 @@ from typing import Annotated
 from fastapi import Depends
 
 from app.clients.cloud_api_client import CloudApiClient
+from app.managers import EmbeddingCache, get_connection_pool
 from app.services.config import get_settings
 from app.services.config.schemas import AppConfig
 from app.utils.auth_context import is_authorized
 
 from .base_client import ModelClient
+from .cached_client import CachedModelClient
 from .cloud_client import CloudModelClient
 from .gemini_client import GeminiModelClient
 from .openai_client import OpenAIModelClient
 
 
+def with_embedding_cache(client: ModelClient, config: AppConfig, model_key: str) -> ModelClient:
+  """Serve repeat embeddings from the on-disk cache, unless the cache is turned off."""
+  if config.model.embedding_cache_size <= 0:
+    return client
+
+  cache = EmbeddingCache(
+    get_connection_pool(config.paths.db_path, config.database),
+    max_entries=config.model.embedding_cache_size,
+  )
+  return CachedModelClient(client, cache, model_key)
+
+
 def get_local_model_client(config: AppConfig) -> ModelClient:
   if config.model.provider == 'gemini':
-    return GeminiModelClient(config)
-  return OpenAIModelClient(config)
+    client: ModelClient = GeminiModelClient(config)
+  else:
+    client = OpenAIModelClient(config)
+
+  return with_embedding_cache(client, config, f'{config.model.provider}:{config.model.embedding}')
 
 
 def get_model_client(
@@ -24,9 +41,17 @@ def get_model_client(
   config: Annotated[AppConfig, Depends(get_settings)],
 ) -> ModelClient:
   if is_authorized():
-    return CloudModelClient(cloud_api_client)
+    # The cloud service picks its own embedding model, so its vectors get a separate key
+    return with_embedding_cache(CloudModelClient(cloud_api_client), config, 'cloud')
 
   return get_local_model_client(config)
 
 
-__all__ = ['CloudModelClient', 'ModelClient', 'get_local_model_client', 'get_model_client']
+__all__ = [
+  'CachedModelClient',
+  'CloudModelClient',
+  'ModelClient',
+  'get_local_model_client',
+  'get_model_client',
+  'with_embedding_cache',
+]
@@ -1,5 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import TypeVar
+from typing import ClassVar, TypeVar
 
 from pydantic import BaseModel
 
@@ -7,6 +8,9 @@ T = TypeVar('T', bound=BaseModel)
 
 
 class ModelClient(ABC):
+  # Most texts the provider accepts in one embedding request; None means no known limit
+  max_embedding_batch_size: ClassVar[int | None] = None
+
   def model_provider_error_message(self, provider: str, status_code: int | None = None) -> str:
     if status_code == 401:
       return f'{provider} rejected your API key. Check that it was copied correctly.'
@@ -34,6 +38,38 @@ class ModelClient(ABC):
     """
     pass
 
+  async def embed_batched(self, texts: list[str]) -> list[list[float]]:
+    """
+    Embed any number of texts with as few concurrent requests as the provider allows.
+
+    Repeated texts are embedded once. The distinct texts are split into batches of at most
+    `max_embedding_batch_size`, sent at the same time, and scattered back in input order.
+    """
+    distinct = list(dict.fromkeys(texts))
+    if not distinct:
+      return []
+
+    size = self.max_embedding_batch_size or len(distinct)
+    batches = [distinct[start : start + size] for start in range(0, len(distinct), size)]
+    results = await asyncio.gather(*(self.embed(batch) for batch in batches))
+
+    embeddings = {
+      text: embedding
+      for batch, batch_embeddings in zip(batches, results, strict=True)
+      for text, embedding in zip(batch, batch_embeddings, strict=True)
+    }
+    return [embeddings[text] for text in texts]
+
+  async def embed_groups(self, groups: list[list[str]]) -> list[list[list[float]]]:
+    """Embed several lists of texts in one batched round, returning one list per group."""
+    embeddings = await self.embed_batched([text for group in groups for text in group])
+    results: list[list[list[float]]] = []
+    start = 0
+    for group in groups:
+      results.append(embeddings[start : start + len(group)])
+      start += len(group)
+    return results
+
   @abstractmethod
   async def call_structured(
     self,
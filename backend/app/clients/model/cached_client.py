@@ -0,0 +1,74 @@
+import logging
+from typing import TypeVar
+
+from pydantic import BaseModel
+
+from app.managers import EmbeddingCache, embedding_text_hash, run_in_db_thread
+from app.utils.errors import ServiceError
+
+from .base_client import ModelClient
+
+T = TypeVar('T', bound=BaseModel)
+
+logger = logging.getLogger(__name__)
+
+
+class CachedModelClient(ModelClient):
+  """
+  Wraps a model client so embeddings are served from the embedding cache when possible.
+
+  A batch is looked up in one query and only the texts that miss are sent to the provider,
+  split into the provider's batch size. LLM calls are passed through unchanged. If the cache
+  cannot be read or written, embeddings come from the provider as if it were empty.
+  """
+
+  def __init__(self, client: ModelClient, cache: EmbeddingCache, model_key: str) -> None:
+    self.client = client
+    self.cache = cache
+    self.model_key = model_key
+
+  async def embed(self, texts: list[str]) -> list[list[float]]:
+    if not texts:
+      return []
+
+    text_hashes = [embedding_text_hash(text) for text in texts]
+    try:
+      embeddings = await run_in_db_thread(self.cache.get_many, self.model_key, text_hashes)
+    except ServiceError:
+      logger.warning('Could not read cached embeddings', exc_info=True)
+      embeddings = {}
+
+    # Embed each distinct missing text once, even if it repeats within the batch
+    missing = {
+      text_hash: text
+      for text_hash, text in zip(text_hashes, texts, strict=True)
+      if text_hash not in embeddings
+    }
+    if missing:
+      new_embeddings = dict(
+        zip(missing, await self.client.embed_batched(list(missing.values())), strict=True)
+      )
+      embeddings.update(new_embeddings)
+      try:
+        await run_in_db_thread(self.cache.put_many, self.model_key, new_embeddings)
+      except ServiceError:
+        logger.warning('Could not cache embeddings', exc_info=True)
+
+    return [embeddings[text_hash] for text_hash in text_hashes]
+
+  async def embed_batched(self, texts: list[str]) -> list[list[float]]:
+    # embed() already looks the whole list up at once and batches the misses
+    return await self.embed(texts)
+
+  async def call_structured(
+    self,
+    input: str,
+    response_model: type[T],
+  ) -> T:
+    return await self.client.call_structured(input, response_model)
+
+  async def call_unstructured(
+    self,
+    input: str,
+  ) -> str:
+    return await self.client.call_unstructured(input)
@@ -12,6 +12,9 @@ T = TypeVar('T', bound=BaseModel)
 
 
 class CloudModelClient(ModelClient):
+  # Keeps each request to the cloud service, and its response, reasonably small
+  max_embedding_batch_size = 100
+
   def __init__(self, api_client: CloudApiClient) -> None:
     self._api_client = api_client
 
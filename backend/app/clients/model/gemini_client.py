@@ -5,6 +5,7 @@ from google import genai
 from google.genai import errors as gemini_errors
 from pydantic import BaseModel
 
+from app.managers import model_clients
 from app.services.config import get_settings
 from app.services.config.schemas import AppConfig
 from app.utils.errors import ServiceError
@@ -15,21 +16,21 @@ T = TypeVar('T', bound=BaseModel)
 
 
 class GeminiModelClient(ModelClient):
+  # batchEmbedContents accepts up to 100 requests per call
+  max_embedding_batch_size = 100
+
   def __init__(
     self,
     config: Annotated[AppConfig, Depends(get_settings)],
   ) -> None:
     self.config = config
-    self._client = None
 
   @property
   def client(self) -> genai.Client:
     if not self.config.model.api_key.strip():
       raise ServiceError('Add your Gemini API key in Settings before using AI features.')
 
-    if self._client is None:
-      self._client = genai.Client(api_key=self.config.model.api_key)
-    return self._client
+    return model_clients.gemini(self.config.model.api_key, self.config.model)
 
   async def embed(self, texts: list[str]) -> list[list[float]]:
     try:
@@ -11,6 +11,7 @@ from openai import (
 )
 from pydantic import BaseModel
 
+from app.managers import model_clients
 from app.services.config import get_settings
 from app.services.config.schemas import AppConfig
 from app.utils.errors import ServiceError
@@ -21,21 +22,21 @@ T = TypeVar('T', bound=BaseModel)
 
 
 class OpenAIModelClient(ModelClient):
+  # The embeddings endpoint accepts up to 2048 inputs per request
+  max_embedding_batch_size = 2048
+
   def __init__(
     self,
     config: Annotated[AppConfig, Depends(get_settings)],
   ) -> None:
     self.config = config
-    self._client = None
 
   @property
   def client(self) -> AsyncOpenAI:
     if not self.config.model.api_key.strip():
       raise ServiceError('Add your OpenAI API key in Settings before using AI features.')
 
-    if self._client is None:
-      self._client = AsyncOpenAI(api_key=self.config.model.api_key)
-    return self._client
+    return model_clients.openai(self.config.model.api_key, self.config.model)
 
   async def embed(self, texts: list[str]) -> list[list[float]]:
     try:
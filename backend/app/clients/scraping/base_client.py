@@ -13,8 +13,8 @@ from .schemas import (
 
 class ScrapingClient(ABC):
   @abstractmethod
-  async def crawl(self, url: HttpUrl) -> CrawlResult:
-    """Fetch a single URL."""
+  async def crawl(self, url: HttpUrl, screenshot: bool = False) -> CrawlResult:
+    """Fetch a single URL, optionally capturing a screenshot of the rendered page."""
     pass
 
   @abstractmethod
@@ -0,0 +1,35 @@
+from urllib.parse import urlsplit
+
+from pydantic import HttpUrl
+
+# How long crawled pages stay fresh, by source. Salary and review aggregators change slowly;
+# news moves quickly. Other sites use the configured default.
+SOURCE_CACHE_TTL_HOURS = {
+  'glassdoor.com': 24 * 7,
+  'levels.fyi': 24 * 7,
+  'payscale.com': 24 * 7,
+  'comparably.com': 24 * 7,
+  'indeed.com': 24 * 3,
+  'news.google.com': 3,
+  'bloomberg.com': 6,
+  'cnbc.com': 6,
+  'reuters.com': 6,
+  'techcrunch.com': 6,
+}
+
+VALIDATOR_HEADERS = ('etag', 'last-modified')
+
+
+def crawl_cache_ttl_seconds(url: HttpUrl, default_hours: float) -> float:
+  host = (urlsplit(str(url)).hostname or '').lower()
+  for domain, hours in SOURCE_CACHE_TTL_HOURS.items():
+    if host == domain or host.endswith(f'.{domain}'):
+      return hours * 3600
+  return default_hours * 3600
+
+
+def cache_validators(headers: dict[str, str] | None) -> tuple[str | None, str | None]:
+  """Extract the ETag and Last-Modified response headers, if the origin sent them."""
+  normalized = {key.lower(): value for key, value in (headers or {}).items()}
+  etag, last_modified = (normalized.get(name) for name in VALIDATOR_HEADERS)
+  return etag, last_modified
@@ -0,0 +1,84 @@
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+# Fewer words than this after pruning means the plain HTTP response is missing the content
+MIN_CONTENT_WORDS = 150
+# A page asking for JavaScript is only treated as a shell if it has little text of its own;
+# plenty of server-rendered pages carry a <noscript> notice for analytics
+JS_NOTICE_MAX_WORDS = 400
+
+JS_REQUIRED_NOTICES = (
+  'enable javascript',
+  'javascript is required',
+  'javascript is disabled',
+  'requires javascript',
+  'turn on javascript',
+)
+# Client-rendered apps ship an empty mount point that the bundle fills in
+EMPTY_MOUNT_POINT = re.compile(
+  r'<div[^>]*\bid=["\'](?:root|app|__next|__nuxt|svelte)["\'][^>]*>\s*</div>', re.IGNORECASE
+)
+
+EscalationReason = Literal['robots', 'http_error', 'not_html', 'js_shell', 'too_short']
+
+
+def looks_like_js_shell(html: str, word_count: int) -> bool:
+  if EMPTY_MOUNT_POINT.search(html):
+    return True
+  lowered = html.lower()
+  return word_count < JS_NOTICE_MAX_WORDS and any(
+    notice in lowered for notice in JS_REQUIRED_NOTICES
+  )
+
+
+def insufficiency_reason(html: str, markdown: str) -> EscalationReason | None:
+  """Why a plain HTTP fetch is not good enough to skip the browser, or None if it is."""
+  word_count = len(markdown.split())
+  if looks_like_js_shell(html, word_count):
+    return 'js_shell'
+  if word_count < MIN_CONTENT_WORDS:
+    return 'too_short'
+  return None
+
+
+@dataclass
+class FetchTierStats:
+  """Process-wide counts of which fetch tier served each crawl."""
+
+  http: int = 0
+  browser: int = 0
+  escalations: Counter[str] = field(default_factory=Counter)
+  _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+  def record_win(self, tier: Literal['http', 'browser']) -> None:
+    with self._lock:
+      setattr(self, tier, getattr(self, tier) + 1)
+
+  def record_escalation(self, reason: EscalationReason) -> None:
+    with self._lock:
+      self.escalations[reason] += 1
+
+  def reset(self) -> None:
+    with self._lock:
+      self.http = self.browser = 0
+      self.escalations.clear()
+
+  @property
+  def http_win_rate(self) -> float:
+    total = self.http + self.browser
+    return self.http / total if total else 0.0
+
+  def snapshot(self) -> dict[str, Any]:
+    with self._lock:
+      return {
+        'http': self.http,
+        'browser': self.browser,
+        'http_win_rate': self.http_win_rate,
+        'escalations': dict(self.escalations),
+      }
+
+
+fetch_tier_stats = FetchTierStats()
@@ -1,24 +1,44 @@
 import asyncio
+import logging
 from typing import Annotated, Any, cast
 
-from crawl4ai import AsyncWebCrawler, BrowserConfig, SEOFilter
+import httpx
 from crawl4ai import CrawlResult as Crawl4aiResult
+from crawl4ai import SEOFilter
 from crawl4ai.async_configs import CrawlerRunConfig
 from crawl4ai.content_filter_strategy import PruningContentFilter
+from crawl4ai.content_scraping_strategy import LXMLWebScrapingStrategy
 from crawl4ai.deep_crawling import BestFirstCrawlingStrategy
 from crawl4ai.deep_crawling.filters import ContentRelevanceFilter, FilterChain
 from crawl4ai.deep_crawling.scorers import KeywordRelevanceScorer
 from crawl4ai.markdown_generation_strategy import DefaultMarkdownGenerator
+from crawl4ai.utils import RobotsParser
 from ddgs import DDGS
 from fastapi import Depends
 from pydantic import HttpUrl
 
+from app.managers import (
+  CrawlCache,
+  CrawlCacheEntry,
+  browser_pools,
+  crawl_cache_stats,
+  crawl_schedulers,
+  get_connection_pool,
+  is_browser_crash,
+  page_fetcher,
+  run_in_db_thread,
+)
 from app.services.config import get_settings
 from app.services.config.schemas import AppConfig
 from app.utils.deduplication import deduplicate_by
 from app.utils.errors import ServiceError
+from app.utils.hash import hash_json_value
+from app.utils.images import compress_base64_image
+from app.utils.url import normalize_url
 
 from .base_client import ScrapingClient
+from .cache_policy import cache_validators, crawl_cache_ttl_seconds
+from .fetch_tiers import fetch_tier_stats, insufficiency_reason
 from .schemas import (
   CrawlFn,
   CrawlResult,
@@ -29,6 +49,8 @@ from .schemas import (
   Timelimit,
 )
 
+logger = logging.getLogger(__name__)
+
 # Excluded tags for HTML content cleaning
 BASIC_EXCLUDED_TAGS = [
   'script',
@@ -44,6 +66,11 @@ BASIC_EXCLUDED_TAGS = [
   'image',
 ]
 
+# Cache variants for single-page crawls; deep crawls use one per parameter set
+PAGE_CACHE_VARIANT = 'page'
+SCREENSHOT_CACHE_VARIANT = 'page:screenshot'
+REVALIDATION_TIMEOUT_SECONDS = 10.0
+
 AGGRESSIVE_EXCLUDED_TAGS = BASIC_EXCLUDED_TAGS + [
   'map',
   'area',
@@ -57,6 +84,16 @@ AGGRESSIVE_EXCLUDED_TAGS = BASIC_EXCLUDED_TAGS + [
 ]
 
 
+_robots_parser: RobotsParser | None = None
+
+
+def get_robots_parser() -> RobotsParser:
+  global _robots_parser
+  if _robots_parser is None:
+    _robots_parser = RobotsParser()
+  return _robots_parser
+
+
 class LocalScrapingClient(ScrapingClient):
   def __init__(self, config: Annotated[AppConfig, Depends(get_settings)]):
     self.config = config
@@ -93,26 +130,182 @@ class LocalScrapingClient(ScrapingClient):
       ),
     }
 
+  @property
+  def crawl_cache(self) -> CrawlCache | None:
+    if self.config.ingestion.crawl_cache_ttl_hours <= 0:
+      return None
+
+    return CrawlCache(
+      get_connection_pool(self.config.paths.db_path, self.config.database),
+      max_bytes=self.config.ingestion.crawl_cache_max_mb * 1024 * 1024,
+    )
+
+  async def _read_crawl_cache(self, url: HttpUrl, variant: str) -> list[CrawlResult] | None:
+    cache = self.crawl_cache
+    if cache is None:
+      return None
+
+    entry = await run_in_db_thread(cache.get, str(normalize_url(url)), variant)
+    if entry is None:
+      return None
+
+    if not entry.is_fresh:
+      if not entry.can_revalidate or not await self._is_unmodified(url, entry):
+        crawl_cache_stats.record('misses')
+        return None
+      ttl = crawl_cache_ttl_seconds(url, self.config.ingestion.crawl_cache_ttl_hours)
+      await run_in_db_thread(cache.renew, entry, ttl)
+
+    return [CrawlResult.model_validate(result) for result in entry.results]
+
+  async def _write_crawl_cache(
+    self,
+    url: HttpUrl,
+    variant: str,
+    results: list[CrawlResult],
+    headers: dict[str, str] | None = None,
+  ) -> None:
+    cache = self.crawl_cache
+    if cache is None:
+      return
+
+    etag, last_modified = cache_validators(headers)
+    await run_in_db_thread(
+      cache.put,
+      str(normalize_url(url)),
+      variant,
+      [result.model_dump(mode='json') for result in results],
+      ttl_seconds=crawl_cache_ttl_seconds(url, self.config.ingestion.crawl_cache_ttl_hours),
+      etag=etag,
+      last_modified=last_modified,
+    )
+
+  async def _is_unmodified(self, url: HttpUrl, entry: CrawlCacheEntry) -> bool:
+    """Ask the origin whether a cached page changed, using its ETag/Last-Modified validators."""
+    headers = {}
+    if entry.etag:
+      headers['If-None-Match'] = entry.etag
+    if entry.last_modified:
+      headers['If-Modified-Since'] = entry.last_modified
+
+    try:
+      response = await page_fetcher.client.get(
+        str(url), headers=headers, timeout=REVALIDATION_TIMEOUT_SECONDS
+      )
+    except httpx.HTTPError:
+      return False
+
+    return response.status_code == httpx.codes.NOT_MODIFIED
+
   async def _crawl(
     self,
     url: HttpUrl,
     config: CrawlerRunConfig,
   ) -> Crawl4aiResult | list[Crawl4aiResult]:
-    browser_config = BrowserConfig(
-      enable_stealth=self.config.ingestion.web_respect_level == 'permissive',
-      verbose=self.config.experimental.debug_mode,
-    )
+    pool = await browser_pools.get_pool(self.config)
 
-    async with AsyncWebCrawler(config=browser_config) as crawler:
-      result = await crawler.arun(str(url), config=config)
+    async with pool.lease() as lease:
+      result = await lease.crawler.arun(str(url), config=config)
 
       # TODO: Remove this function once crawl4ai fixes type hints.
       # See: https://github.com/unclecode/crawl4ai/issues/1543 and https://github.com/unclecode/crawl4ai/pull/1716
       # crawl4ai.arun() returns RunManyReturn but should be properly typed as CrawlResult.
-      return cast(Crawl4aiResult | list[Crawl4aiResult], result)
+      result = cast(Crawl4aiResult | list[Crawl4aiResult], result)
+
+      pages = result if isinstance(result, list) else [result]
+      lease.record_pages(len(pages) or 1)
+      # crawl4ai reports a dead browser as a failed result rather than raising
+      if any(is_browser_crash(page.error_message) for page in pages if not page.success):
+        lease.discard()
+
+      return result
+
+  def _html_to_markdown(self, url: str, html: str) -> str:
+    """Clean and convert fetched HTML the same way the browser tier does."""
+    crawl_config = self.base_crawl_config
+    scraped = LXMLWebScrapingStrategy().scrap(
+      url,
+      html,
+      excluded_tags=crawl_config['excluded_tags'],
+      remove_forms=crawl_config['remove_forms'],
+      exclude_external_links=crawl_config['exclude_external_links'],
+    )
+    markdown = crawl_config['markdown_generator'].generate_markdown(
+      input_html=scraped.cleaned_html, base_url=url
+    )
+    return markdown.fit_markdown or ''
+
+  async def _fetch_without_browser(self, url: HttpUrl) -> tuple[CrawlResult, dict[str, str]] | None:
+    """
+    Fetch a page over plain HTTP, for server-rendered pages that need no JavaScript.
+
+    Returns:
+      The crawl result and response headers, or None if the page needs the browser.
+    """
+    if (
+      self.config.ingestion.web_respect_level == 'strict'
+      and not await get_robots_parser().can_fetch(str(url))
+    ):
+      fetch_tier_stats.record_escalation('robots')
+      return None
 
-  async def crawl(self, url: HttpUrl) -> CrawlResult:
-    config = CrawlerRunConfig(**self.base_crawl_config, screenshot=True)
+    try:
+      response = await page_fetcher.get(str(url))
+    except httpx.HTTPError:
+      fetch_tier_stats.record_escalation('http_error')
+      return None
+
+    if not response.is_success:
+      fetch_tier_stats.record_escalation('http_error')
+      return None
+    if 'html' not in response.headers.get('content-type', ''):
+      fetch_tier_stats.record_escalation('not_html')
+      return None
+
+    html = response.text
+    # Parsing and pruning are CPU-bound, keep them off the event loop
+    markdown = await asyncio.to_thread(self._html_to_markdown, str(response.url), html)
+    if reason := insufficiency_reason(html, markdown):
+      fetch_tier_stats.record_escalation(reason)
+      return None
+
+    fetch_tier_stats.record_win('http')
+    return CrawlResult(url=url, content=markdown), dict(response.headers)
+
+  async def _compress_screenshot(self, screenshot: str) -> str | None:
+    try:
+      return await asyncio.to_thread(
+        compress_base64_image,
+        screenshot,
+        self.config.ingestion.screenshot_format,
+        self.config.ingestion.screenshot_quality,
+        self.config.ingestion.screenshot_max_width,
+      )
+    except (OSError, ValueError):
+      logger.warning('Could not compress screenshot', exc_info=True)
+      return None
+
+  async def crawl(self, url: HttpUrl, screenshot: bool = False) -> CrawlResult:
+    screenshot = screenshot and self.config.ingestion.screenshot_mode != 'off'
+    variant = SCREENSHOT_CACHE_VARIANT if screenshot else PAGE_CACHE_VARIANT
+    cached = await self._read_crawl_cache(url, variant)
+    if cached:
+      return cached[0]
+
+    # A server-rendered page is worth more fast than with a screenshot, so screenshot crawls try
+    # HTTP first too and come back without one when the browser is not needed
+    if self.config.ingestion.http_first_fetch and (
+      fetched := await self._fetch_without_browser(url)
+    ):
+      crawl_result, headers = fetched
+      await self._write_crawl_cache(url, variant, [crawl_result], headers)
+      return crawl_result
+
+    config = CrawlerRunConfig(
+      **self.base_crawl_config,
+      screenshot=screenshot,
+      force_viewport_screenshot=self.config.ingestion.screenshot_mode == 'viewport',
+    )
 
     try:
       result = await self._crawl(url, config)
@@ -123,7 +316,7 @@ class LocalScrapingClient(ScrapingClient):
           'Atto could not read that page. Check the URL, or paste the job description manually.'
         )
 
-      return CrawlResult(
+      crawl_result = CrawlResult(
         url=url, content=result.markdown.fit_markdown, screenshot=result.screenshot
       )
     except Exception as e:
@@ -131,6 +324,12 @@ class LocalScrapingClient(ScrapingClient):
         'Atto could not read that page. Check the URL, or paste the job description manually.'
       ) from e
 
+    fetch_tier_stats.record_win('browser')
+    if crawl_result.screenshot:
+      crawl_result.screenshot = await self._compress_screenshot(crawl_result.screenshot)
+    await self._write_crawl_cache(url, variant, [crawl_result], result.response_headers)
+    return crawl_result
+
   async def deep_crawl(
     self,
     url: HttpUrl,
@@ -139,6 +338,18 @@ class LocalScrapingClient(ScrapingClient):
     include_external: bool = False,
     keywords: list[str] | None = None,
   ) -> list[CrawlResult]:
+    variant = 'deep:' + hash_json_value(
+      {
+        'max_depth': max_depth,
+        'max_pages': max_pages,
+        'include_external': include_external,
+        'keywords': keywords,
+      }
+    )
+    cached = await self._read_crawl_cache(url, variant)
+    if cached is not None:
+      return cached
+
     filter_chain = FilterChain([])
     url_scorer = None
 
@@ -174,13 +385,17 @@ class LocalScrapingClient(ScrapingClient):
             screenshot=result.screenshot,
           )
         )
-
-      return crawl_summaries
     except ServiceError:
       raise
     except Exception as e:
       raise ServiceError('Atto could not finish researching this page. Try again later.') from e
 
+    # Deep crawls span many pages with no single validator, so they are only reused until
+    # they expire
+    if crawl_summaries:
+      await self._write_crawl_cache(url, variant, crawl_summaries)
+    return crawl_summaries
+
   async def search(
     self,
     query: str,
@@ -252,22 +467,52 @@ class LocalScrapingClient(ScrapingClient):
       return []
 
     search_results = deduplicate_by(search_results, key_selector=lambda result: result.url)
-
-    crawl_results = await asyncio.gather(
-      *[crawl_fn(result.url) for result in search_results],
-      return_exceptions=True,
-    )
-
-    results: list[CrawlResult] = []
-
-    for search_result, crawl_result in zip(search_results, crawl_results, strict=True):
-      if isinstance(crawl_result, CrawlResult):
-        results.append(crawl_result)
-      elif isinstance(crawl_result, list):
-        results.extend(crawl_result)
-      else:
-        # If crawling fails, we can still include the search result content as a fallback.
-        results.append(CrawlResult(url=search_result.url, content=search_result.body))
+    scheduler = crawl_schedulers.get_scheduler(self.config)
+
+    async def crawl_ranked(
+      rank: int, search_result: SearchResult
+    ) -> tuple[int, CrawlResult | list[CrawlResult] | Exception]:
+      try:
+        crawl_result = await scheduler.run(
+          str(search_result.url), lambda: crawl_fn(search_result.url), priority=rank
+        )
+      except Exception as e:
+        # One unreadable page should not sink the search; its snippet is used instead
+        logger.warning('Could not crawl search result %s', search_result.url, exc_info=True)
+        return rank, e
+      return rank, crawl_result
+
+    # Crawls are admitted in search-rank order, so the best results tend to arrive first
+    tasks = [
+      asyncio.create_task(crawl_ranked(rank, result)) for rank, result in enumerate(search_results)
+    ]
+
+    crawled: dict[int, list[CrawlResult]] = {}
+    fallbacks: dict[int, CrawlResult] = {}
+    try:
+      for next_done in asyncio.as_completed(tasks):
+        rank, crawl_result = await next_done
+        if isinstance(crawl_result, CrawlResult):
+          crawled[rank] = [crawl_result]
+        elif isinstance(crawl_result, list):
+          crawled[rank] = crawl_result
+        else:
+          # If crawling fails, we can still include the search result content as a fallback.
+          search_result = search_results[rank]
+          fallbacks[rank] = CrawlResult(url=search_result.url, content=search_result.body)
+
+        # Stop as soon as enough pages have been crawled instead of fetching pages that would
+        # be truncated away
+        if sum(len(pages) for pages in crawled.values()) >= max_results:
+          break
+    finally:
+      for task in tasks:
+        task.cancel()
+      # Wait for cancelled crawls to unwind so they hand back browser leases and scheduler slots
+      await asyncio.gather(*tasks, return_exceptions=True)
+
+    results = [page for rank in sorted(crawled) for page in crawled[rank]]
+    results.extend(fallbacks[rank] for rank in sorted(fallbacks))
 
     # TODO: Arbitrary truncation for now, consider using crawl_result Crawl4aiResult derived
     # relevance scores for better pruning in the future.
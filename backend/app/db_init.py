@@ -1,71 +1,73 @@
+import argparse
 import sqlite3
 from pathlib import Path
 
+from app.managers import apply_storage_profile
+from app.migrations import run_migrations
 from app.services.config import ConfigService, get_settings
+from app.services.config.schemas import DatabasePrefs
 
 
-def create_tables(db_path: str | None = None) -> None:
-  resolved_db_path = Path(db_path or get_settings(ConfigService()).paths.db_path)
+def _resolve_db_path(
+  db_path: str | None, prefs: DatabasePrefs | None
+) -> tuple[Path, DatabasePrefs]:
+  if db_path is None:
+    settings = get_settings(ConfigService())
+    db_path = settings.paths.db_path
+    prefs = prefs or settings.database
+
+  return Path(db_path), prefs or DatabasePrefs()
+
+
+def create_tables(db_path: str | None = None, prefs: DatabasePrefs | None = None) -> None:
+  """Create the database if needed and migrate it to the latest schema version."""
+  resolved_db_path, prefs = _resolve_db_path(db_path, prefs)
   resolved_db_path.parent.mkdir(parents=True, exist_ok=True)
 
-  with sqlite3.connect(resolved_db_path) as db:
-    db.execute("""
-      CREATE TABLE IF NOT EXISTS listings (
-        id TEXT PRIMARY KEY,
-        url TEXT NOT NULL UNIQUE,
-        title TEXT NOT NULL,
-        company TEXT NOT NULL,
-        domain TEXT NOT NULL,
-        location TEXT,
-        description TEXT NOT NULL,
-        notes TEXT,
-        research JSON,
-        posted_date TEXT,
-        salary JSON,
-        skills TEXT,
-        requirements TEXT,
-        keywords JSON
-      )
-    """)
-
-    db.execute("""
-      CREATE TABLE IF NOT EXISTS resumes (
-        id TEXT PRIMARY KEY,
-        template_id TEXT NOT NULL,
-        sections JSON NOT NULL
-      )
-    """)
-
-    db.execute("""
-      CREATE TABLE IF NOT EXISTS applications (
-        id TEXT PRIMARY KEY,
-        listing_id TEXT NOT NULL,
-        name TEXT NOT NULL,
-        resume_id TEXT NOT NULL,
-        analysis JSON,
-        current_status TEXT NOT NULL,
-        last_status_at TEXT NOT NULL,
-        FOREIGN KEY (listing_id) REFERENCES listings (id) ON DELETE CASCADE,
-        FOREIGN KEY (resume_id) REFERENCES resumes (id) ON DELETE CASCADE
-      )
-    """)
-
-    db.execute("""
-      CREATE TABLE IF NOT EXISTS status_events (
-        id TEXT PRIMARY KEY,
-        application_id TEXT NOT NULL,
-        status TEXT NOT NULL,
-        date TEXT NOT NULL,
-        notes TEXT,
-        payload JSON,
-        FOREIGN KEY (application_id) REFERENCES applications (id) ON DELETE CASCADE
-      )
-    """)
-
-    db.commit()
-
-  print(f'Database tables created successfully at {resolved_db_path}')
+  db = sqlite3.connect(resolved_db_path)
+  try:
+    apply_storage_profile(db, prefs)
+    schema_version = run_migrations(db)
+  finally:
+    db.close()
+
+  print(f'Database at {resolved_db_path} is at schema version {schema_version}')
+
+
+def rebuild_search_index(db_path: str | None = None, prefs: DatabasePrefs | None = None) -> None:
+  """
+  Rebuild the listing full-text index from the listings table.
+
+  Triggers keep the index in sync during normal use; this repairs it after the database was
+  edited with the triggers missing, or after a VACUUM renumbered listing rowids.
+  """
+  resolved_db_path, prefs = _resolve_db_path(db_path, prefs)
+  create_tables(str(resolved_db_path), prefs)
+
+  db = sqlite3.connect(resolved_db_path)
+  try:
+    apply_storage_profile(db, prefs)
+    with db:
+      db.execute("INSERT INTO listings_fts (listings_fts) VALUES ('rebuild')")
+      # Merge the freshly written segments so the first searches are not slowed down by them
+      db.execute("INSERT INTO listings_fts (listings_fts) VALUES ('optimize')")
+    indexed_count = db.execute('SELECT COUNT(*) FROM listings').fetchone()[0]
+  finally:
+    db.close()
+
+  print(f'Rebuilt the search index for {indexed_count} listings')
 
 
 if __name__ == '__main__':
-  create_tables()
+  parser = argparse.ArgumentParser(description='Create or migrate the Atto database.')
+  parser.add_argument(
+    '--rebuild-search-index',
+    action='store_true',
+    help='Rebuild the listing full-text search index after migrating.',
+  )
+  args = parser.parse_args()
+
+  if args.rebuild_search_index:
+    rebuild_search_index()
+  else:
+    create_tables()
@@ -12,6 +12,13 @@ from app.exception_handlers import (
   service_error_exception_handler,
   validation_error_exception_handler,
 )
+from app.managers import (
+  browser_pools,
+  connection_pools,
+  db_executor,
+  model_clients,
+  page_fetcher,
+)
 from app.middleware.auth import auth_context_middleware
 from app.middleware.logging import exception_logging_middleware
 from app.repositories import ResumeRepository
@@ -19,13 +26,16 @@ from app.routers import (
   application_router,
   config_router,
   dashboard_router,
+  diagnostics_router,
   listing_router,
   paper_mode_router,
   profile_router,
   resume_router,
+  screenshot_router,
   template_router,
 )
 from app.services.config import ConfigService, get_settings
+from app.services.listing import research_queue
 from app.utils.errors import (
   ApplicationError,
   DuplicateError,
@@ -38,10 +48,25 @@ from app.utils.errors import (
 @asynccontextmanager
 async def lifespan(app: FastAPI):
   settings = get_settings(ConfigService())
+  app.state.connection_pools = connection_pools
+  app.state.model_clients = model_clients
+  app.state.browser_pools = browser_pools
+  db_executor.start(settings.database.pool_size)
+  connection_pools.get_pool(settings.paths.db_path, settings.database).warm_up()
+
   resume_repository = ResumeRepository(settings=settings)
   resume_repository.ensure_default_global_resume_exists()
+  await research_queue.resume(settings)
   yield
 
+  await research_queue.close()
+
+  await browser_pools.close()
+  await page_fetcher.aclose()
+  await model_clients.aclose()
+  db_executor.shutdown()
+  connection_pools.close_all()
+
 
 def create_app() -> FastAPI:
   app = FastAPI(lifespan=lifespan, debug=ConfigService().settings.experimental.debug_mode)
@@ -49,10 +74,12 @@ def create_app() -> FastAPI:
   app.include_router(application_router, prefix='/api')
   app.include_router(config_router, prefix='/api')
   app.include_router(dashboard_router, prefix='/api')
+  app.include_router(diagnostics_router, prefix='/api')
   app.include_router(listing_router, prefix='/api')
   app.include_router(paper_mode_router, prefix='/api')
   app.include_router(profile_router, prefix='/api')
   app.include_router(resume_router, prefix='/api')
+  app.include_router(screenshot_router, prefix='/api')
   app.include_router(template_router, prefix='/api')
 
   app.add_exception_handler(NotFoundError, not_found_exception_handler)
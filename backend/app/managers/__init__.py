@@ -0,0 +1,70 @@
+from .browser_pool import (
+  BrowserLease,
+  BrowserPool,
+  BrowserPoolManager,
+  browser_pools,
+  is_browser_crash,
+)
+from .connection_pool import (
+  ConnectionPool,
+  ConnectionPoolManager,
+  apply_storage_profile,
+  connection_pools,
+  get_connection_pool,
+)
+from .crawl_cache import CrawlCache, CrawlCacheEntry, CrawlCacheStats, crawl_cache_stats
+from .crawl_scheduler import (
+  CrawlScheduler,
+  CrawlSchedulerManager,
+  PrioritySlots,
+  crawl_schedulers,
+)
+from .db_executor import DatabaseExecutor, db_executor, run_in_db_thread
+from .embedding_cache import EmbeddingCache, embedding_text_hash
+from .model_clients import ModelClientRegistry, model_clients
+from .page_fetcher import PageFetcher, page_fetcher
+from .task_events import TaskEventBroker, task_events
+from .task_store import (
+  MemoryTaskStore,
+  SQLiteTaskStore,
+  TaskStore,
+  TaskStoreManager,
+  task_stores,
+)
+
+__all__ = [
+  'BrowserLease',
+  'BrowserPool',
+  'BrowserPoolManager',
+  'ConnectionPool',
+  'ConnectionPoolManager',
+  'CrawlCache',
+  'CrawlCacheEntry',
+  'CrawlCacheStats',
+  'CrawlScheduler',
+  'CrawlSchedulerManager',
+  'DatabaseExecutor',
+  'EmbeddingCache',
+  'MemoryTaskStore',
+  'ModelClientRegistry',
+  'PageFetcher',
+  'PrioritySlots',
+  'SQLiteTaskStore',
+  'TaskEventBroker',
+  'TaskStore',
+  'TaskStoreManager',
+  'apply_storage_profile',
+  'browser_pools',
+  'connection_pools',
+  'crawl_cache_stats',
+  'crawl_schedulers',
+  'db_executor',
+  'embedding_text_hash',
+  'get_connection_pool',
+  'is_browser_crash',
+  'model_clients',
+  'page_fetcher',
+  'run_in_db_thread',
+  'task_events',
+  'task_stores',
+]
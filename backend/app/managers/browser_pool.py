@@ -0,0 +1,168 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+
+from crawl4ai import AsyncWebCrawler, BrowserConfig
+
+from app.services.config.schemas import AppConfig
+from app.utils.errors import ServiceError
+
+logger = logging.getLogger(__name__)
+
+# Playwright error fragments that mean the browser process itself is gone, as opposed to a
+# single page failing to load
+BROWSER_CRASH_MARKERS = (
+  'target closed',
+  'browser has been closed',
+  'browser closed',
+  'connection closed',
+  'has been disconnected',
+)
+
+
+def is_browser_crash(error: BaseException | str | None) -> bool:
+  if not error:
+    return False
+  message = str(error).lower()
+  return any(marker in message for marker in BROWSER_CRASH_MARKERS)
+
+
+class BrowserLease:
+  """A browser checked out of the pool for one crawl."""
+
+  def __init__(self, crawler: AsyncWebCrawler) -> None:
+    self.crawler = crawler
+    self.pages = 0
+    self.healthy = True
+
+  def record_pages(self, count: int = 1) -> None:
+    self.pages += count
+
+  def discard(self) -> None:
+    """Mark the browser as broken so it is shut down instead of returned to the pool."""
+    self.healthy = False
+
+
+class BrowserPool:
+  """
+  A bounded set of long-lived headless browsers shared by every crawl.
+
+  At most `size` browsers run at once, which bounds peak memory. Each crawl gets its own page
+  in a leased browser. Browsers are restarted after `recycle_after_pages` pages to shed leaked
+  memory, and any browser that crashes is replaced on the next lease.
+  """
+
+  def __init__(self, browser_config: BrowserConfig, size: int, recycle_after_pages: int) -> None:
+    self.browser_config = browser_config
+    self.size = size
+    self.recycle_after_pages = recycle_after_pages
+    self._idle: list[BrowserLease] = []
+    self._semaphore = asyncio.Semaphore(size)
+    self._closed = False
+    self.launched = 0
+
+  @property
+  def idle(self) -> int:
+    return len(self._idle)
+
+  @asynccontextmanager
+  async def lease(self) -> AsyncIterator[BrowserLease]:
+    """
+    Lease a browser for the duration of the block, starting one if none are idle.
+
+    Raises:
+      ServiceError: If the pool is closed or a browser cannot be started.
+    """
+    async with self._semaphore:
+      if self._closed:
+        raise ServiceError('Atto is shutting down. Try again in a moment.')
+
+      lease = self._idle.pop() if self._idle else await self._launch()
+      try:
+        yield lease
+      except Exception as e:
+        if is_browser_crash(e):
+          lease.discard()
+        raise
+      finally:
+        if self._closed or not lease.healthy or lease.pages >= self.recycle_after_pages:
+          await self._shutdown(lease)
+        else:
+          self._idle.append(lease)
+
+  async def close(self) -> None:
+    """Shut down idle browsers. Browsers still leased are shut down when released."""
+    self._closed = True
+    idle, self._idle = self._idle, []
+    for lease in idle:
+      await self._shutdown(lease)
+
+  async def _launch(self) -> BrowserLease:
+    crawler = AsyncWebCrawler(config=self.browser_config)
+    try:
+      await crawler.start()
+    except Exception as e:
+      with suppress(Exception):
+        await crawler.close()
+      raise ServiceError('Atto could not start its web browser. Try again in a moment.') from e
+
+    self.launched += 1
+    return BrowserLease(crawler)
+
+  async def _shutdown(self, lease: BrowserLease) -> None:
+    try:
+      await lease.crawler.close()
+    except Exception:
+      # A crashed browser often fails to close cleanly; it is being replaced either way
+      logger.debug('Browser did not shut down cleanly', exc_info=True)
+
+
+def build_browser_config(config: AppConfig) -> BrowserConfig:
+  return BrowserConfig(
+    headless=config.ingestion.headless,
+    enable_stealth=config.ingestion.web_respect_level == 'permissive',
+    verbose=config.experimental.debug_mode,
+  )
+
+
+class BrowserPoolManager:
+  """
+  Process-wide browser pool. Changing browser settings replaces the pool; the old one
+  finishes its in-flight crawls and then shuts down.
+  """
+
+  def __init__(self) -> None:
+    self._pool: BrowserPool | None = None
+    self._key: tuple | None = None
+    self._lock = asyncio.Lock()
+
+  async def get_pool(self, config: AppConfig) -> BrowserPool:
+    key = (
+      config.ingestion.headless,
+      config.ingestion.web_respect_level == 'permissive',
+      config.experimental.debug_mode,
+      config.ingestion.browser_pool_size,
+      config.ingestion.browser_recycle_after_pages,
+    )
+    async with self._lock:
+      if self._pool is None or self._key != key:
+        previous = self._pool
+        self._pool = BrowserPool(
+          build_browser_config(config),
+          size=config.ingestion.browser_pool_size,
+          recycle_after_pages=config.ingestion.browser_recycle_after_pages,
+        )
+        self._key = key
+        if previous is not None:
+          await previous.close()
+      return self._pool
+
+  async def close(self) -> None:
+    async with self._lock:
+      pool, self._pool, self._key = self._pool, None, None
+    if pool is not None:
+      await pool.close()
+
+
+browser_pools = BrowserPoolManager()
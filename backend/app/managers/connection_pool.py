@@ -0,0 +1,251 @@
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from app.services.config.schemas import DatabasePrefs
+from app.utils.errors import ServiceError
+
+DEFAULT_ACQUIRE_TIMEOUT_SECONDS = 30.0
+BYTES_PER_MB = 1024 * 1024
+KIB_PER_MB = 1024
+
+
+def apply_storage_profile(conn: sqlite3.Connection, prefs: DatabasePrefs) -> None:
+  """
+  Apply the configured storage profile to a connection.
+
+  The journal mode is persisted in the database file; every other pragma only lasts for
+  the lifetime of the connection, so this must run on every new connection.
+  """
+  conn.execute(f'PRAGMA journal_mode = {prefs.journal_mode.upper()}')
+  conn.execute(f'PRAGMA synchronous = {prefs.synchronous.upper()}')
+  conn.execute(f'PRAGMA mmap_size = {prefs.mmap_size_mb * BYTES_PER_MB}')
+  # Negative cache sizes are in KiB rather than pages
+  conn.execute(f'PRAGMA cache_size = {-prefs.cache_size_mb * KIB_PER_MB}')
+  conn.execute(f'PRAGMA temp_store = {prefs.temp_store.upper()}')
+  conn.execute(f'PRAGMA busy_timeout = {prefs.busy_timeout_ms}')
+  conn.execute(f'PRAGMA wal_autocheckpoint = {prefs.wal_autocheckpoint_pages}')
+
+
+class ConnectionPool:
+  """
+  Long-lived SQLite connections for a single database file.
+
+  Connections are leased to one caller (thread or task) at a time and returned to the pool
+  afterwards, so the page cache and prepared statement cache survive between queries instead
+  of being thrown away by a connect/close per query.
+  """
+
+  def __init__(
+    self,
+    db_path: str,
+    prefs: DatabasePrefs | None = None,
+    max_size: int | None = None,
+    acquire_timeout: float = DEFAULT_ACQUIRE_TIMEOUT_SECONDS,
+  ) -> None:
+    self.db_path = db_path
+    self.prefs = prefs or DatabasePrefs()
+    self.max_size = max_size or self.prefs.pool_size
+    self.acquire_timeout = acquire_timeout
+    self._last_checkpoint_at = time.monotonic()
+    # LIFO so the most recently used (warmest) connection is handed out first
+    self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+    self._size = 0
+    self._lock = threading.Lock()
+    self._closed = False
+
+  @property
+  def size(self) -> int:
+    return self._size
+
+  @property
+  def idle(self) -> int:
+    return self._idle.qsize()
+
+  def acquire(self) -> sqlite3.Connection:
+    """
+    Lease a connection from the pool, opening a new one if the pool is not yet full.
+
+    Raises:
+      ServiceError: If the pool is closed or no connection frees up in time.
+    """
+    if self._closed:
+      raise ServiceError('The database is closing. Try again in a moment.')
+
+    try:
+      return self._idle.get_nowait()
+    except queue.Empty:
+      pass
+
+    with self._lock:
+      can_open = self._size < self.max_size
+      if can_open:
+        self._size += 1
+
+    if can_open:
+      try:
+        return self._connect()
+      except sqlite3.Error as e:
+        with self._lock:
+          self._size -= 1
+        raise ServiceError() from e
+
+    try:
+      return self._idle.get(timeout=self.acquire_timeout)
+    except queue.Empty as e:
+      raise ServiceError('Atto is busy right now. Try again in a moment.') from e
+
+  def release(self, conn: sqlite3.Connection) -> None:
+    """Return a leased connection. Uncommitted work left on it is rolled back."""
+    try:
+      if conn.in_transaction:
+        conn.rollback()
+    except sqlite3.Error:
+      self._discard(conn)
+      return
+
+    if self._closed:
+      self._discard(conn)
+      return
+
+    self._maybe_checkpoint(conn)
+    self._idle.put(conn)
+
+  @contextmanager
+  def connection(self) -> Iterator[sqlite3.Connection]:
+    """Lease a connection for the duration of the block."""
+    conn = self.acquire()
+    try:
+      yield conn
+    finally:
+      self.release(conn)
+
+  def warm_up(self, count: int = 1) -> None:
+    """
+    Open connections ahead of the first request and load the schema into each of them.
+    """
+    leased = []
+    try:
+      for _ in range(min(count, self.max_size)):
+        conn = self.acquire()
+        leased.append(conn)
+        conn.execute('SELECT name FROM sqlite_master').fetchall()
+    finally:
+      for conn in leased:
+        self.release(conn)
+
+  def health_check(self) -> bool:
+    """Check that a connection can be leased and can run a trivial query."""
+    try:
+      with self.connection() as conn:
+        conn.execute('SELECT 1').fetchone()
+      return True
+    except (ServiceError, sqlite3.Error):
+      return False
+
+  def checkpoint(self, mode: str = 'PASSIVE') -> None:
+    """Copy WAL pages back into the database file. No-op outside WAL mode."""
+    if self.prefs.journal_mode != 'wal':
+      return
+
+    with self.connection() as conn:
+      conn.execute(f'PRAGMA wal_checkpoint({mode})').fetchone()
+    self._last_checkpoint_at = time.monotonic()
+
+  def close(self) -> None:
+    """Close idle connections. Connections still leased are closed when released."""
+    if self._closed:
+      return
+
+    # Truncate the WAL so the database file is self-contained while Atto is not running
+    try:
+      self.checkpoint('TRUNCATE')
+    except (ServiceError, sqlite3.Error):
+      pass
+
+    self._closed = True
+    while True:
+      try:
+        conn = self._idle.get_nowait()
+      except queue.Empty:
+        break
+      self._discard(conn)
+
+  def _connect(self) -> sqlite3.Connection:
+    # Leases can move between threads (e.g. a transaction spanning awaits), but a
+    # connection is only ever used by its current leaseholder.
+    conn = sqlite3.connect(self.db_path, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    apply_storage_profile(conn, self.prefs)
+    return conn
+
+  def _maybe_checkpoint(self, conn: sqlite3.Connection) -> None:
+    """Run a passive checkpoint on a returning connection once the interval has elapsed."""
+    interval = self.prefs.checkpoint_interval_seconds
+    if self.prefs.journal_mode != 'wal' or interval <= 0:
+      return
+    if time.monotonic() - self._last_checkpoint_at < interval:
+      return
+
+    self._last_checkpoint_at = time.monotonic()
+    try:
+      # PASSIVE never waits on readers or writers, so it is safe on the request path
+      conn.execute('PRAGMA wal_checkpoint(PASSIVE)').fetchone()
+    except sqlite3.Error:
+      pass
+
+  def _discard(self, conn: sqlite3.Connection) -> None:
+    try:
+      conn.close()
+    except sqlite3.Error:
+      pass
+    with self._lock:
+      self._size -= 1
+
+
+class ConnectionPoolManager:
+  """Process-wide registry of connection pools, one per database file."""
+
+  def __init__(self) -> None:
+    self._pools: dict[str, ConnectionPool] = {}
+    self._lock = threading.Lock()
+
+  def get_pool(self, db_path: str, prefs: DatabasePrefs | None = None) -> ConnectionPool:
+    """
+    Get the pool for a database file, creating it on first use.
+
+    The storage profile is captured when the pool is created, so changes to it apply after
+    a restart.
+    """
+    key = os.path.abspath(db_path)
+    with self._lock:
+      pool = self._pools.get(key)
+      if pool is None:
+        pool = ConnectionPool(db_path, prefs)
+        self._pools[key] = pool
+      return pool
+
+  def close_pool(self, db_path: str) -> None:
+    """Close and forget the pool for a database file, e.g. before the file is deleted."""
+    with self._lock:
+      pool = self._pools.pop(os.path.abspath(db_path), None)
+    if pool is not None:
+      pool.close()
+
+  def close_all(self) -> None:
+    with self._lock:
+      pools = list(self._pools.values())
+      self._pools.clear()
+    for pool in pools:
+      pool.close()
+
+
+connection_pools = ConnectionPoolManager()
+
+
+def get_connection_pool(db_path: str, prefs: DatabasePrefs | None = None) -> ConnectionPool:
+  return connection_pools.get_pool(db_path, prefs)
@@ -0,0 +1,230 @@
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from app.utils.errors import ServiceError
+
+from .connection_pool import ConnectionPool
+
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+
+
+@dataclass
+class CrawlCacheEntry:
+  url_key: str
+  variant: str
+  # JSON-compatible crawl results, as stored
+  results: list[dict[str, Any]]
+  etag: str | None
+  last_modified: str | None
+  expires_at: float
+
+  @property
+  def is_fresh(self) -> bool:
+    return time.time() < self.expires_at
+
+  @property
+  def can_revalidate(self) -> bool:
+    return bool(self.etag or self.last_modified)
+
+
+@dataclass
+class CrawlCacheStats:
+  """Process-wide lookup counters, shared by every CrawlCache instance."""
+
+  hits: int = 0
+  revalidated: int = 0
+  misses: int = 0
+  stores: int = 0
+  evictions: int = 0
+  _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+  def record(self, counter: str, amount: int = 1) -> None:
+    with self._lock:
+      setattr(self, counter, getattr(self, counter) + amount)
+
+  def reset(self) -> None:
+    with self._lock:
+      self.hits = self.revalidated = self.misses = self.stores = self.evictions = 0
+
+  @property
+  def hit_rate(self) -> float:
+    lookups = self.hits + self.revalidated + self.misses
+    return (self.hits + self.revalidated) / lookups if lookups else 0.0
+
+
+crawl_cache_stats = CrawlCacheStats()
+
+
+class CrawlCache:
+  """
+  On-disk cache of crawled page content, keyed by normalized URL.
+
+  Entries expire after a per-source TTL. Expired entries that carry an ETag or Last-Modified
+  validator can be revalidated and renewed instead of re-crawled. Once the stored payloads
+  exceed `max_bytes`, the least recently used entries are evicted.
+  """
+
+  def __init__(self, pool: ConnectionPool, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+    self.pool = pool
+    self.max_bytes = max_bytes
+
+  def get(self, url_key: str, variant: str) -> CrawlCacheEntry | None:
+    """
+    Look up an entry, fresh or expired, and mark it as recently used.
+
+    Lookups are counted as hits only when the entry is fresh; callers record revalidations
+    and misses for expired entries once they know the outcome.
+    """
+    try:
+      with self.pool.connection() as conn:
+        row = conn.execute(
+          """
+          SELECT payload, etag, last_modified, expires_at
+          FROM crawl_cache
+          WHERE url_key = ? AND variant = ?
+          """,
+          (url_key, variant),
+        ).fetchone()
+        if row is not None:
+          conn.execute(
+            'UPDATE crawl_cache SET last_used_at = ? WHERE url_key = ? AND variant = ?',
+            (time.time(), url_key, variant),
+          )
+          conn.commit()
+    except sqlite3.Error as e:
+      raise ServiceError() from e
+
+    if row is None:
+      crawl_cache_stats.record('misses')
+      return None
+
+    entry = CrawlCacheEntry(
+      url_key=url_key,
+      variant=variant,
+      results=json.loads(row['payload']),
+      etag=row['etag'],
+      last_modified=row['last_modified'],
+      expires_at=row['expires_at'],
+    )
+    if entry.is_fresh:
+      crawl_cache_stats.record('hits')
+    return entry
+
+  def put(
+    self,
+    url_key: str,
+    variant: str,
+    results: list[dict[str, Any]],
+    ttl_seconds: float,
+    etag: str | None = None,
+    last_modified: str | None = None,
+  ) -> None:
+    """Store crawl results, then evict the least recently used entries over the size budget."""
+    payload = json.dumps(results)
+    now = time.time()
+    try:
+      with self.pool.connection() as conn:
+        conn.execute(
+          """
+          INSERT OR REPLACE INTO crawl_cache (
+            url_key, variant, payload, etag, last_modified,
+            fetched_at, expires_at, last_used_at, size_bytes
+          )
+          VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+          """,
+          (
+            url_key,
+            variant,
+            payload,
+            etag,
+            last_modified,
+            now,
+            now + ttl_seconds,
+            now,
+            len(payload.encode()),
+          ),
+        )
+        evicted = self._evict(conn)
+        conn.commit()
+    except sqlite3.Error as e:
+      raise ServiceError() from e
+
+    crawl_cache_stats.record('stores')
+    if evicted:
+      crawl_cache_stats.record('evictions', evicted)
+
+  def renew(self, entry: CrawlCacheEntry, ttl_seconds: float) -> None:
+    """Extend an expired entry after the origin confirmed it is unchanged."""
+    now = time.time()
+    try:
+      with self.pool.connection() as conn:
+        conn.execute(
+          """
+          UPDATE crawl_cache
+          SET expires_at = ?, last_used_at = ?
+          WHERE url_key = ? AND variant = ?
+          """,
+          (now + ttl_seconds, now, entry.url_key, entry.variant),
+        )
+        conn.commit()
+    except sqlite3.Error as e:
+      raise ServiceError() from e
+
+    entry.expires_at = now + ttl_seconds
+    crawl_cache_stats.record('revalidated')
+
+  def stats(self) -> dict[str, float]:
+    """Lookup counters for this process plus the current size of the cache."""
+    try:
+      with self.pool.connection() as conn:
+        entries, size_bytes = conn.execute(
+          'SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM crawl_cache'
+        ).fetchone()
+    except sqlite3.Error as e:
+      raise ServiceError() from e
+
+    return {
+      'hits': crawl_cache_stats.hits,
+      'revalidated': crawl_cache_stats.revalidated,
+      'misses': crawl_cache_stats.misses,
+      'stores': crawl_cache_stats.stores,
+      'evictions': crawl_cache_stats.evictions,
+      'hit_rate': crawl_cache_stats.hit_rate,
+      'entries': entries,
+      'size_bytes': size_bytes,
+    }
+
+  def clear(self) -> None:
+    try:
+      with self.pool.connection() as conn:
+        conn.execute('DELETE FROM crawl_cache')
+        conn.commit()
+    except sqlite3.Error as e:
+      raise ServiceError() from e
+
+  def _evict(self, conn: sqlite3.Connection) -> int:
+    # Keep the most recently used entries whose running total fits in the budget
+    cursor = conn.execute(
+      """
+      DELETE FROM crawl_cache
+      WHERE (url_key, variant) IN (
+        SELECT url_key, variant
+        FROM (
+          SELECT
+            url_key,
+            variant,
+            SUM(size_bytes) OVER (
+              ORDER BY last_used_at DESC, url_key, variant
+            ) AS running_bytes
+          FROM crawl_cache
+        )
+        WHERE running_bytes > ?
+      )
+      """,
+      (self.max_bytes,),
+    )
+    return cursor.rowcount
@@ -0,0 +1,122 @@
+import asyncio
+import heapq
+import itertools
+import time
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+from urllib.parse import urlsplit
+
+from app.services.config.schemas import AppConfig
+
+T = TypeVar('T')
+
+
+class PrioritySlots:
+  """A semaphore that wakes waiters lowest priority value first, then first come first served."""
+
+  def __init__(self, size: int) -> None:
+    self._available = size
+    self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+    self._counter = itertools.count()
+
+  async def acquire(self, priority: int = 0) -> None:
+    if self._available > 0 and not self._waiters:
+      self._available -= 1
+      return
+
+    waiter = asyncio.get_running_loop().create_future()
+    heapq.heappush(self._waiters, (priority, next(self._counter), waiter))
+    try:
+      await waiter
+    except asyncio.CancelledError:
+      # The slot was handed over just before cancellation, so pass it on
+      if waiter.done() and not waiter.cancelled():
+        self.release()
+      raise
+
+  def release(self) -> None:
+    while self._waiters:
+      _, _, waiter = heapq.heappop(self._waiters)
+      if not waiter.done():
+        waiter.set_result(None)
+        return
+    self._available += 1
+
+
+class _HostState:
+  def __init__(self, concurrency: int) -> None:
+    self.slots = asyncio.Semaphore(concurrency)
+    self.next_start = 0.0
+    self.active = 0
+
+
+class CrawlScheduler:
+  """
+  Admission control for outbound crawls.
+
+  Caps the number of crawls in flight across the whole app, limits how many run against a
+  single host at once, and spaces consecutive requests to the same host by `per_host_delay`
+  seconds. When crawls queue up, lower `priority` values (e.g. better search ranks) go first.
+  """
+
+  def __init__(self, concurrency: int, per_host_concurrency: int, per_host_delay: float) -> None:
+    self.concurrency = concurrency
+    self.per_host_concurrency = per_host_concurrency
+    self.per_host_delay = per_host_delay
+    self._slots = PrioritySlots(concurrency)
+    self._hosts: dict[str, _HostState] = {}
+
+  async def run(self, url: str, fn: Callable[[], Awaitable[T]], priority: int = 0) -> T:
+    host = urlsplit(url).hostname or ''
+    state = self._hosts.get(host)
+    if state is None:
+      state = self._hosts[host] = _HostState(self.per_host_concurrency)
+
+    state.active += 1
+    try:
+      async with state.slots:
+        await self._acquire_turn(state, priority)
+        try:
+          return await fn()
+        finally:
+          self._slots.release()
+    finally:
+      state.active -= 1
+      if state.active == 0 and time.monotonic() >= state.next_start:
+        self._hosts.pop(host, None)
+
+  async def _acquire_turn(self, state: _HostState, priority: int) -> None:
+    # The host's start time is only reserved once a global slot is held; reserving it while
+    # queued for a slot would let crawls to one host pile up and then start back to back
+    while True:
+      delay = state.next_start - time.monotonic()
+      if delay > 0:
+        await asyncio.sleep(delay)
+      await self._slots.acquire(priority)
+      if time.monotonic() >= state.next_start:
+        state.next_start = time.monotonic() + self.per_host_delay
+        return
+      # Another crawl to this host started while this one waited for the slot
+      self._slots.release()
+
+
+class CrawlSchedulerManager:
+  """Process-wide crawl scheduler, replaced when the crawl settings change."""
+
+  def __init__(self) -> None:
+    self._scheduler: CrawlScheduler | None = None
+    self._key: tuple | None = None
+
+  def get_scheduler(self, config: AppConfig) -> CrawlScheduler:
+    key = (
+      config.ingestion.crawl_concurrency,
+      config.ingestion.crawl_per_host_concurrency,
+      config.ingestion.crawl_per_host_delay_seconds,
+    )
+    if self._scheduler is None or self._key != key:
+      self._scheduler = CrawlScheduler(*key)
+      self._key = key
+    return self._scheduler
+
+
+crawl_schedulers = CrawlSchedulerManager()
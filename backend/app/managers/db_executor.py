@@ -0,0 +1,74 @@
+import asyncio
+import contextvars
+import functools
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import ParamSpec, TypeVar
+
+from app.services.config.schemas import DatabasePrefs
+
+P = ParamSpec('P')
+T = TypeVar('T')
+
+
+class DatabaseExecutor:
+  """
+  Dedicated, bounded thread pool for blocking SQLite work.
+
+  Keeping database calls off the default executor means a burst of slow queries cannot starve
+  other blocking work (file IO, PDF rendering). Sizing it to the connection pool stops it from
+  running more queries at once than there are connections, but a worker can still wait for one
+  while code outside the executor, such as a sync route, holds a lease.
+  """
+
+  def __init__(self, max_workers: int | None = None) -> None:
+    self.max_workers = max_workers or DatabasePrefs().pool_size
+    self._executor: ThreadPoolExecutor | None = None
+    self._lock = threading.Lock()
+
+  def start(self, max_workers: int | None = None) -> None:
+    """(Re)size the executor. Work already submitted finishes on the previous threads."""
+    with self._lock:
+      previous = self._executor
+      if max_workers is not None:
+        self.max_workers = max_workers
+      self._executor = self._create_executor()
+    if previous is not None:
+      previous.shutdown(wait=False)
+
+  async def run(self, fn: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs) -> T:
+    """
+    Run a blocking callable on a database thread and await its result.
+
+    The caller's context is copied into the worker, so context variables such as the session
+    token are visible to the callable. Each call leases its own connection; statements that
+    must commit together belong in one call, see `DatabaseRepository.run_in_transaction()`.
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, fn, *args, **kwargs)
+    return await loop.run_in_executor(self._get_executor(), call)
+
+  def shutdown(self) -> None:
+    with self._lock:
+      executor, self._executor = self._executor, None
+    if executor is not None:
+      executor.shutdown(wait=True)
+
+  def _get_executor(self) -> ThreadPoolExecutor:
+    with self._lock:
+      if self._executor is None:
+        self._executor = self._create_executor()
+      return self._executor
+
+  def _create_executor(self) -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='atto-db')
+
+
+db_executor = DatabaseExecutor()
+
+
+async def run_in_db_thread(fn: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs) -> T:
+  """Await a blocking repository call without stalling the event loop."""
+  return await db_executor.run(fn, *args, **kwargs)
@@ -0,0 +1,129 @@
+import sqlite3
+import time
+
+import numpy as np
+
+from app.utils.errors import ServiceError
+from app.utils.hash import sha256_hex
+
+from .connection_pool import ConnectionPool
+
+DEFAULT_MAX_ENTRIES = 50_000
+# Embedding vectors are stored as packed float32, the precision providers return them in
+EMBEDDING_DTYPE = np.float32
+# Hits refresh last_used_at at most this often, so most reads never take the write lock
+TOUCH_INTERVAL_SECONDS = 3600
+
+
+def embedding_text_hash(text: str) -> str:
+  return sha256_hex(text)
+
+
+class EmbeddingCache:
+  """
+  Content-addressed store of embedding vectors, keyed by text hash and embedding model.
+
+  Entries record when they were last read so the least recently used ones are evicted once
+  the cache grows past `max_entries`.
+  """
+
+  def __init__(self, pool: ConnectionPool, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+    self.pool = pool
+    self.max_entries = max_entries
+
+  def get_many(self, model_key: str, text_hashes: list[str]) -> dict[str, list[float]]:
+    """
+    Look up a batch of embeddings in one query and mark the hits as recently used.
+
+    Recency is tracked coarsely: only hits not marked within `TOUCH_INTERVAL_SECONDS` are
+    updated, in one statement, and a read whose hits are all recent writes nothing.
+
+    Returns:
+      Embeddings by text hash. Misses are absent.
+    """
+    if not text_hashes:
+      return {}
+
+    unique_hashes = list(dict.fromkeys(text_hashes))
+    placeholders = ','.join('?' * len(unique_hashes))
+    try:
+      with self.pool.connection() as conn:
+        rows = conn.execute(
+          f"""
+          SELECT text_hash, embedding, last_used_at
+          FROM embedding_cache
+          WHERE model_key = ? AND text_hash IN ({placeholders})
+          """,
+          (model_key, *unique_hashes),
+        ).fetchall()
+        now = time.time()
+        stale = [
+          row['text_hash'] for row in rows if row['last_used_at'] < now - TOUCH_INTERVAL_SECONDS
+        ]
+        if stale:
+          conn.execute(
+            f"""
+            UPDATE embedding_cache
+            SET last_used_at = ?
+            WHERE model_key = ? AND text_hash IN ({','.join('?' * len(stale))})
+            """,
+            (now, model_key, *stale),
+          )
+          conn.commit()
+    except sqlite3.Error as e:
+      raise ServiceError() from e
+
+    return {
+      row['text_hash']: np.frombuffer(row['embedding'], dtype=EMBEDDING_DTYPE).tolist()
+      for row in rows
+    }
+
+  def put_many(self, model_key: str, embeddings: dict[str, list[float]]) -> None:
+    """Store embeddings by text hash, then evict the least recently used overflow."""
+    if not embeddings:
+      return
+
+    now = time.time()
+    try:
+      with self.pool.connection() as conn:
+        conn.executemany(
+          """
+          INSERT OR REPLACE INTO embedding_cache (model_key, text_hash, embedding, last_used_at)
+          VALUES (?, ?, ?, ?)
+          """,
+          [
+            (model_key, text_hash, np.asarray(vector, dtype=EMBEDDING_DTYPE).tobytes(), now)
+            for text_hash, vector in embeddings.items()
+          ],
+        )
+        self._evict(conn)
+        conn.commit()
+    except sqlite3.Error as e:
+      raise ServiceError() from e
+
+  def clear(self) -> None:
+    try:
+      with self.pool.connection() as conn:
+        conn.execute('DELETE FROM embedding_cache')
+        conn.commit()
+    except sqlite3.Error as e:
+      raise ServiceError() from e
+
+  def _evict(self, conn: sqlite3.Connection) -> None:
+    overflow = conn.execute('SELECT COUNT(*) FROM embedding_cache').fetchone()[0]
+    overflow -= self.max_entries
+    if overflow <= 0:
+      return
+
+    conn.execute(
+      """
+      DELETE FROM embedding_cache
+      WHERE (model_key, text_hash) IN (
+        SELECT model_key, text_hash
+        FROM embedding_cache
+        ORDER BY last_used_at ASC
+        LIMIT ?
+      )
+      """,
+      (overflow,),
+    )
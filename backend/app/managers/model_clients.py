@@ -0,0 +1,116 @@
+import asyncio
+import threading
+import time
+from typing import Any
+
+import httpx
+from google import genai
+from google.genai import types as genai_types
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+from app.services.config.schemas import ModelPrefs
+from app.utils.hash import sha256_hex
+
+# Longer than any provider request runs, so a retired client is idle by the time it is closed
+RETIRED_CLIENT_GRACE_SECONDS = 15 * 60
+
+
+def _http_limits(prefs: ModelPrefs) -> httpx.Limits:
+  return httpx.Limits(
+    max_connections=prefs.max_connections,
+    max_keepalive_connections=prefs.keepalive_connections,
+    keepalive_expiry=prefs.keepalive_expiry_seconds,
+  )
+
+
+def _pool_key(prefs: ModelPrefs) -> tuple[int, int, float]:
+  return prefs.max_connections, prefs.keepalive_connections, prefs.keepalive_expiry_seconds
+
+
+class ModelClientRegistry:
+  """
+  Process-wide SDK and HTTP clients, one per provider, credential and pool configuration.
+
+  Sharing them keeps TLS sessions and keep-alive connections warm across requests, so
+  consecutive model calls skip the connection handshake. API keys are hashed before being used
+  as registry keys.
+  """
+
+  def __init__(self) -> None:
+    self._clients: dict[tuple, tuple[Any, httpx.AsyncClient]] = {}
+    # Invalidated clients may still be serving in-flight requests, so each is closed once its
+    # grace period has passed, or on shutdown
+    self._retired: list[tuple[httpx.AsyncClient, float]] = []
+    self._closing: set[asyncio.Task] = set()
+    self._lock = threading.Lock()
+
+  def openai(self, api_key: str, prefs: ModelPrefs) -> AsyncOpenAI:
+    key = ('openai', sha256_hex(api_key), _pool_key(prefs))
+    with self._lock:
+      self._close_expired()
+      if key not in self._clients:
+        http_client = DefaultAsyncHttpxClient(limits=_http_limits(prefs))
+        self._clients[key] = (AsyncOpenAI(api_key=api_key, http_client=http_client), http_client)
+      return self._clients[key][0]
+
+  def gemini(self, api_key: str, prefs: ModelPrefs) -> genai.Client:
+    key = ('gemini', sha256_hex(api_key), _pool_key(prefs))
+    with self._lock:
+      self._close_expired()
+      if key not in self._clients:
+        http_client = httpx.AsyncClient(limits=_http_limits(prefs))
+        client = genai.Client(
+          api_key=api_key,
+          http_options=genai_types.HttpOptions(httpx_async_client=http_client),
+        )
+        self._clients[key] = (client, http_client)
+      return self._clients[key][0]
+
+  def http(self, base_url: str, timeout: float, prefs: ModelPrefs) -> httpx.AsyncClient:
+    """Shared HTTP client for a base URL, e.g. the Atto cloud service."""
+    key = ('http', base_url, timeout, _pool_key(prefs))
+    with self._lock:
+      self._close_expired()
+      if key not in self._clients:
+        http_client = httpx.AsyncClient(
+          base_url=base_url, timeout=timeout, limits=_http_limits(prefs)
+        )
+        self._clients[key] = (http_client, http_client)
+      return self._clients[key][0]
+
+  def invalidate(self) -> None:
+    """Drop every client so the next request builds one from the current settings."""
+    with self._lock:
+      retired_at = time.monotonic()
+      self._retired.extend((http_client, retired_at) for _, http_client in self._clients.values())
+      self._clients.clear()
+
+  def _close_expired(self) -> None:
+    """Start closing retired clients past their grace period. Callers must hold the lock."""
+    cutoff = time.monotonic() - RETIRED_CLIENT_GRACE_SECONDS
+    if not any(retired_at <= cutoff for _, retired_at in self._retired):
+      return
+    try:
+      loop = asyncio.get_running_loop()
+    except RuntimeError:
+      # Off the event loop there is nothing to close on; a later lookup or shutdown will
+      return
+
+    expired = [http_client for http_client, retired_at in self._retired if retired_at <= cutoff]
+    self._retired = [entry for entry in self._retired if entry[1] > cutoff]
+    for http_client in expired:
+      task = loop.create_task(http_client.aclose())
+      self._closing.add(task)
+      task.add_done_callback(self._closing.discard)
+
+  async def aclose(self) -> None:
+    self.invalidate()
+    with self._lock:
+      retired, self._retired = self._retired, []
+      closing = list(self._closing)
+    await asyncio.gather(*closing, return_exceptions=True)
+    for http_client, _ in retired:
+      await http_client.aclose()
+
+
+model_clients = ModelClientRegistry()
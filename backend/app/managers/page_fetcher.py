@@ -0,0 +1,44 @@
+import threading
+
+import httpx
+
+# Identify honestly; sites that only serve real browsers fall through to the browser tier
+USER_AGENT = 'Mozilla/5.0 (compatible; Atto/1.0; +https://github.com/AustinKong/atto)'
+FETCH_TIMEOUT_SECONDS = 15.0
+FETCH_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=30)
+
+
+class PageFetcher:
+  """
+  Shared HTTP client for fetching pages without a browser.
+
+  One pooled client keeps connections to frequently crawled sites alive across crawls.
+  """
+
+  def __init__(self) -> None:
+    self._client: httpx.AsyncClient | None = None
+    self._lock = threading.Lock()
+
+  @property
+  def client(self) -> httpx.AsyncClient:
+    with self._lock:
+      if self._client is None:
+        self._client = httpx.AsyncClient(
+          follow_redirects=True,
+          timeout=FETCH_TIMEOUT_SECONDS,
+          limits=FETCH_LIMITS,
+          headers={'User-Agent': USER_AGENT, 'Accept': 'text/html,application/xhtml+xml'},
+        )
+      return self._client
+
+  async def get(self, url: str, headers: dict[str, str] | None = None) -> httpx.Response:
+    return await self.client.get(url, headers=headers)
+
+  async def aclose(self) -> None:
+    with self._lock:
+      client, self._client = self._client, None
+    if client is not None:
+      await client.aclose()
+
+
+page_fetcher = PageFetcher()
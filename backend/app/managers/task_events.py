@@ -0,0 +1,58 @@
+import asyncio
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from app.schemas.task_status import TaskStatusEntry
+
+TaskKey = tuple[str, str]
+Subscriber = tuple[asyncio.AbstractEventLoop, asyncio.Queue[TaskStatusEntry]]
+
+
+class TaskEventBroker:
+  """
+  In-process pub/sub for task status changes.
+
+  Task runners publish every status they store; subscribers, such as server-sent event
+  streams, each get a queue on their own event loop. Publishing is thread-safe, so statuses
+  written from the database executor reach subscribers too.
+  """
+
+  def __init__(self) -> None:
+    self._subscribers: dict[TaskKey, set[Subscriber]] = {}
+    self._lock = threading.Lock()
+
+  def publish(self, namespace: str, key: str, entry: TaskStatusEntry) -> None:
+    with self._lock:
+      subscribers = list(self._subscribers.get((namespace, key), ()))
+
+    for loop, queue in subscribers:
+      try:
+        loop.call_soon_threadsafe(queue.put_nowait, entry)
+      except RuntimeError:
+        # The subscriber's loop has closed; it unsubscribes on its way out
+        continue
+
+  @contextmanager
+  def subscribe(self, namespace: str, key: str) -> Iterator[asyncio.Queue[TaskStatusEntry]]:
+    """Receive the statuses published for one task while the block is open."""
+    queue: asyncio.Queue[TaskStatusEntry] = asyncio.Queue()
+    subscriber = (asyncio.get_running_loop(), queue)
+    with self._lock:
+      self._subscribers.setdefault((namespace, key), set()).add(subscriber)
+    try:
+      yield queue
+    finally:
+      with self._lock:
+        subscribers = self._subscribers.get((namespace, key))
+        if subscribers is not None:
+          subscribers.discard(subscriber)
+          if not subscribers:
+            del self._subscribers[(namespace, key)]
+
+  def subscriber_count(self, namespace: str, key: str) -> int:
+    with self._lock:
+      return len(self._subscribers.get((namespace, key), ()))
+
+
+task_events = TaskEventBroker()
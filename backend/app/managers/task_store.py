@@ -0,0 +1,167 @@
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+from app.schemas.task_status import TaskStatusEntry
+from app.services.config.schemas import AppConfig
+from app.utils.errors import ServiceError
+
+from .connection_pool import ConnectionPool, get_connection_pool
+
+TaskKey = tuple[str, str]
+
+
+class TaskStore(ABC):
+  """Status of background tasks, by namespace and key, dropped `ttl_seconds` after updating."""
+
+  def __init__(self, ttl_seconds: float, max_entries: int) -> None:
+    self.ttl_seconds = ttl_seconds
+    self.max_entries = max_entries
+
+  @abstractmethod
+  def set(self, namespace: str, key: str, entry: TaskStatusEntry) -> None: ...
+
+  @abstractmethod
+  def get(self, namespace: str, key: str) -> TaskStatusEntry | None: ...
+
+  @abstractmethod
+  def delete(self, namespace: str, key: str) -> None: ...
+
+
+class MemoryTaskStore(TaskStore):
+  """Task statuses held in this process, evicting the least recently updated past the limit."""
+
+  def __init__(self, ttl_seconds: float, max_entries: int) -> None:
+    super().__init__(ttl_seconds, max_entries)
+    self._entries: OrderedDict[TaskKey, tuple[float, TaskStatusEntry]] = OrderedDict()
+    self._lock = threading.Lock()
+
+  def set(self, namespace: str, key: str, entry: TaskStatusEntry) -> None:
+    now = time.monotonic()
+    with self._lock:
+      self._entries[(namespace, key)] = (now + self.ttl_seconds, entry)
+      self._entries.move_to_end((namespace, key))
+      self._evict(now)
+
+  def get(self, namespace: str, key: str) -> TaskStatusEntry | None:
+    with self._lock:
+      item = self._entries.get((namespace, key))
+      if item is None:
+        return None
+      expires_at, entry = item
+      if expires_at <= time.monotonic():
+        del self._entries[(namespace, key)]
+        return None
+      return entry
+
+  def delete(self, namespace: str, key: str) -> None:
+    with self._lock:
+      self._entries.pop((namespace, key), None)
+
+  def __len__(self) -> int:
+    return len(self._entries)
+
+  def _evict(self, now: float) -> None:
+    # Entries are ordered by last update, so expired ones are at the front
+    while self._entries:
+      expires_at, _ = next(iter(self._entries.values()))
+      if expires_at > now and len(self._entries) <= self.max_entries:
+        break
+      self._entries.popitem(last=False)
+
+
+class SQLiteTaskStore(TaskStore):
+  """Task statuses in the database, so they survive restarts and are shared between workers."""
+
+  def __init__(self, pool: ConnectionPool, ttl_seconds: float, max_entries: int) -> None:
+    super().__init__(ttl_seconds, max_entries)
+    self.pool = pool
+
+  def set(self, namespace: str, key: str, entry: TaskStatusEntry) -> None:
+    now = time.time()
+    try:
+      with self.pool.connection() as conn:
+        conn.execute(
+          """
+          INSERT OR REPLACE INTO task_states (namespace, key, value, updated_at, expires_at)
+          VALUES (?, ?, ?, ?, ?)
+          """,
+          (namespace, key, entry.model_dump_json(), now, now + self.ttl_seconds),
+        )
+        conn.execute('DELETE FROM task_states WHERE expires_at <= ?', (now,))
+        conn.execute(
+          """
+          DELETE FROM task_states
+          WHERE (namespace, key) IN (
+            SELECT namespace, key
+            FROM task_states
+            ORDER BY updated_at DESC
+            LIMIT -1 OFFSET ?
+          )
+          """,
+          (self.max_entries,),
+        )
+        conn.commit()
+    except sqlite3.Error as e:
+      raise ServiceError() from e
+
+  def get(self, namespace: str, key: str) -> TaskStatusEntry | None:
+    try:
+      with self.pool.connection() as conn:
+        row = conn.execute(
+          'SELECT value FROM task_states WHERE namespace = ? AND key = ? AND expires_at > ?',
+          (namespace, key, time.time()),
+        ).fetchone()
+    except sqlite3.Error as e:
+      raise ServiceError() from e
+
+    return TaskStatusEntry.model_validate_json(row['value']) if row else None
+
+  def delete(self, namespace: str, key: str) -> None:
+    try:
+      with self.pool.connection() as conn:
+        conn.execute('DELETE FROM task_states WHERE namespace = ? AND key = ?', (namespace, key))
+        conn.commit()
+    except sqlite3.Error as e:
+      raise ServiceError() from e
+
+
+class TaskStoreManager:
+  """
+  Process-wide task store for the configured backend.
+
+  The in-memory store is kept while its limits are unchanged, so switching back and forth
+  between settings does not lose the status of running tasks.
+  """
+
+  def __init__(self) -> None:
+    self._memory: MemoryTaskStore | None = None
+    self._lock = threading.Lock()
+
+  def get_store(self, config: AppConfig) -> TaskStore:
+    prefs = config.database
+    ttl_seconds = prefs.task_ttl_hours * 3600
+    if prefs.task_store == 'sqlite':
+      return SQLiteTaskStore(
+        get_connection_pool(config.paths.db_path, prefs), ttl_seconds, prefs.task_max_entries
+      )
+
+    with self._lock:
+      store = self._memory
+      if (
+        store is None
+        or store.ttl_seconds != ttl_seconds
+        or store.max_entries != prefs.task_max_entries
+      ):
+        store = MemoryTaskStore(ttl_seconds, prefs.task_max_entries)
+        if self._memory is not None:
+          # Carry live statuses over to the resized store
+          for (namespace, key), (_, entry) in self._memory._entries.items():
+            store.set(namespace, key, entry)
+        self._memory = store
+      return store
+
+
+task_stores = TaskStoreManager()
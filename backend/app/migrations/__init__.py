@@ -0,0 +1,10 @@
+from .runner import LATEST_SCHEMA_VERSION, get_schema_version, run_migrations
+from .steps import MIGRATIONS, Migration
+
+__all__ = [
+  'LATEST_SCHEMA_VERSION',
+  'MIGRATIONS',
+  'Migration',
+  'get_schema_version',
+  'run_migrations',
+]
@@ -0,0 +1,61 @@
+import logging
+import sqlite3
+
+from app.utils.errors import ConfigurationError
+
+from .steps import MIGRATIONS, Migration
+
+logger = logging.getLogger(__name__)
+
+LATEST_SCHEMA_VERSION = MIGRATIONS[-1].version
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+  return conn.execute('PRAGMA user_version').fetchone()[0]
+
+
+def run_migrations(
+  conn: sqlite3.Connection,
+  migrations: list[Migration] = MIGRATIONS,
+) -> int:
+  """
+  Bring a database up to the latest schema version.
+
+  Each pending migration runs in its own transaction together with the `user_version`
+  bump, so an interrupted upgrade resumes from the last migration that completed.
+
+  Returns:
+    The schema version after migrating.
+
+  Raises:
+    ConfigurationError: If the database was created by a newer version of Atto.
+  """
+  current_version = get_schema_version(conn)
+  latest_version = migrations[-1].version if migrations else 0
+
+  if current_version > latest_version:
+    raise ConfigurationError(
+      'This database was created by a newer version of Atto. Update Atto to open it.'
+    )
+
+  for migration in migrations:
+    if migration.version <= current_version:
+      continue
+
+    logger.info('Applying database migration %s: %s', migration.version, migration.description)
+    try:
+      conn.execute('BEGIN')
+      for statement in migration.statements:
+        conn.execute(statement)
+      if migration.apply is not None:
+        migration.apply(conn)
+      # PRAGMA does not accept bound parameters; the version is always an int
+      conn.execute(f'PRAGMA user_version = {int(migration.version)}')
+      conn.commit()
+    except Exception:
+      conn.rollback()
+      raise
+
+    current_version = migration.version
+
+  return current_version
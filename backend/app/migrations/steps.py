@@ -0,0 +1,375 @@
+import sqlite3
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from app.utils.status_ordering import generate_latest_status_refresh_sql
+
+
+@dataclass(frozen=True)
+class Migration:
+  """
+  A single schema change, applied once when the database is older than `version`.
+
+  Steps must be idempotent (e.g. `IF NOT EXISTS`) so that databases created before the
+  migration engine existed, which report version 0, can be upgraded in place.
+  """
+
+  version: int
+  description: str
+  statements: tuple[str, ...] = ()
+  apply: Callable[[sqlite3.Connection], None] | None = field(default=None, compare=False)
+
+
+def _backfill_listing_latest_status(conn: sqlite3.Connection) -> None:
+  conn.execute(generate_latest_status_refresh_sql())
+
+
+# Append new migrations to the end with the next version number. Never edit or reorder a
+# migration that has shipped; existing databases have already recorded it as applied.
+MIGRATIONS: list[Migration] = [
+  Migration(
+    version=1,
+    description='Baseline schema',
+    statements=(
+      """
+      CREATE TABLE IF NOT EXISTS listings (
+        id TEXT PRIMARY KEY,
+        url TEXT NOT NULL UNIQUE,
+        title TEXT NOT NULL,
+        company TEXT NOT NULL,
+        domain TEXT NOT NULL,
+        location TEXT,
+        description TEXT NOT NULL,
+        notes TEXT,
+        research JSON,
+        posted_date TEXT,
+        salary JSON,
+        skills TEXT,
+        requirements TEXT,
+        keywords JSON
+      )
+      """,
+      """
+      CREATE TABLE IF NOT EXISTS resumes (
+        id TEXT PRIMARY KEY,
+        template_id TEXT NOT NULL,
+        sections JSON NOT NULL
+      )
+      """,
+      """
+      CREATE TABLE IF NOT EXISTS applications (
+        id TEXT PRIMARY KEY,
+        listing_id TEXT NOT NULL,
+        name TEXT NOT NULL,
+        resume_id TEXT NOT NULL,
+        analysis JSON,
+        current_status TEXT NOT NULL,
+        last_status_at TEXT NOT NULL,
+        FOREIGN KEY (listing_id) REFERENCES listings (id) ON DELETE CASCADE,
+        FOREIGN KEY (resume_id) REFERENCES resumes (id) ON DELETE CASCADE
+      )
+      """,
+      """
+      CREATE TABLE IF NOT EXISTS status_events (
+        id TEXT PRIMARY KEY,
+        application_id TEXT NOT NULL,
+        status TEXT NOT NULL,
+        date TEXT NOT NULL,
+        notes TEXT,
+        payload JSON,
+        FOREIGN KEY (application_id) REFERENCES applications (id) ON DELETE CASCADE
+      )
+      """,
+    ),
+  ),
+  Migration(
+    version=2,
+    description='Index application and status event lookups',
+    statements=(
+      # get_by_listing_id and the latest-event join from listings to applications
+      'CREATE INDEX IF NOT EXISTS idx_applications_listing_id ON applications (listing_id)',
+      # get_by_resume_id
+      'CREATE INDEX IF NOT EXISTS idx_applications_resume_id ON applications (resume_id)',
+      # Event aggregation per application, already ordered by date for the latest-event window
+      """
+      CREATE INDEX IF NOT EXISTS idx_status_events_application_id_date
+      ON status_events (application_id, date)
+      """,
+      # Dashboard date-range scans
+      """
+      CREATE INDEX IF NOT EXISTS idx_status_events_date_application_id
+      ON status_events (date, application_id)
+      """,
+    ),
+  ),
+  Migration(
+    version=3,
+    description='Full-text search index for listings',
+    statements=(
+      # External content table: the text lives in `listings` and is indexed by rowid. The
+      # prefix indexes keep search-as-you-type prefix queries off a full term scan.
+      """
+      CREATE VIRTUAL TABLE IF NOT EXISTS listings_fts USING fts5 (
+        title, company, domain, location, description, skills, requirements,
+        content = 'listings',
+        content_rowid = 'rowid',
+        tokenize = 'unicode61 remove_diacritics 2',
+        prefix = '2 3'
+      )
+      """,
+      """
+      CREATE TRIGGER IF NOT EXISTS listings_fts_after_insert AFTER INSERT ON listings BEGIN
+        INSERT INTO listings_fts (
+          rowid, title, company, domain, location, description, skills, requirements
+        )
+        VALUES (
+          new.rowid, new.title, new.company, new.domain, new.location, new.description,
+          new.skills, new.requirements
+        );
+      END
+      """,
+      """
+      CREATE TRIGGER IF NOT EXISTS listings_fts_after_delete AFTER DELETE ON listings BEGIN
+        INSERT INTO listings_fts (
+          listings_fts, rowid, title, company, domain, location, description, skills,
+          requirements
+        )
+        VALUES (
+          'delete', old.rowid, old.title, old.company, old.domain, old.location,
+          old.description, old.skills, old.requirements
+        );
+      END
+      """,
+      # Notes and research updates do not touch indexed columns, so skip the reindex for them
+      """
+      CREATE TRIGGER IF NOT EXISTS listings_fts_after_update
+      AFTER UPDATE OF title, company, domain, location, description, skills, requirements
+      ON listings BEGIN
+        INSERT INTO listings_fts (
+          listings_fts, rowid, title, company, domain, location, description, skills,
+          requirements
+        )
+        VALUES (
+          'delete', old.rowid, old.title, old.company, old.domain, old.location,
+          old.description, old.skills, old.requirements
+        );
+        INSERT INTO listings_fts (
+          rowid, title, company, domain, location, description, skills, requirements
+        )
+        VALUES (
+          new.rowid, new.title, new.company, new.domain, new.location, new.description,
+          new.skills, new.requirements
+        );
+      END
+      """,
+      # Index listings saved before this migration
+      "INSERT INTO listings_fts (listings_fts) VALUES ('rebuild')",
+    ),
+  ),
+  Migration(
+    version=4,
+    description='Materialize the latest status event per listing',
+    statements=(
+      # Maintained by ApplicationRepository in the same transaction as the event change, so
+      # listing pages join one row per listing instead of ranking the whole event history
+      """
+      CREATE TABLE IF NOT EXISTS listing_latest_status (
+        listing_id TEXT PRIMARY KEY,
+        application_id TEXT,
+        status TEXT NOT NULL,
+        date TEXT NOT NULL,
+        FOREIGN KEY (listing_id) REFERENCES listings (id) ON DELETE CASCADE
+      )
+      """,
+      # Status filters, and sorting by last status date
+      """
+      CREATE INDEX IF NOT EXISTS idx_listing_latest_status_status_date
+      ON listing_latest_status (status, date)
+      """,
+      'CREATE INDEX IF NOT EXISTS idx_listing_latest_status_date ON listing_latest_status (date)',
+    ),
+    apply=_backfill_listing_latest_status,
+  ),
+  Migration(
+    version=5,
+    description='Index listing sort keys for keyset pagination',
+    statements=(
+      # (sort key, id) pairs match the ORDER BY and seek predicate of list_all_by_cursor
+      'CREATE INDEX IF NOT EXISTS idx_listings_title_id ON listings (title, id)',
+      'CREATE INDEX IF NOT EXISTS idx_listings_company_id ON listings (company, id)',
+      """
+      CREATE INDEX IF NOT EXISTS idx_listings_posted_date_id
+      ON listings (COALESCE(posted_date, ''), id)
+      """,
+      """
+      CREATE INDEX IF NOT EXISTS idx_listing_latest_status_date_listing_id
+      ON listing_latest_status (date, listing_id)
+      """,
+    ),
+  ),
+  Migration(
+    version=6,
+    description='Embedding cache',
+    statements=(
+      # Keyed by sha256 of the text and the provider/model that embedded it
+      """
+      CREATE TABLE IF NOT EXISTS embedding_cache (
+        model_key TEXT NOT NULL,
+        text_hash TEXT NOT NULL,
+        embedding BLOB NOT NULL,
+        last_used_at REAL NOT NULL,
+        PRIMARY KEY (model_key, text_hash)
+      ) WITHOUT ROWID
+      """,
+      # Least recently used eviction
+      """
+      CREATE INDEX IF NOT EXISTS idx_embedding_cache_last_used_at
+      ON embedding_cache (last_used_at)
+      """,
+    ),
+  ),
+  Migration(
+    version=7,
+    description='Crawl cache',
+    statements=(
+      # Keyed by normalized URL. `variant` separates single-page crawls from deep crawls with
+      # different parameters, and `payload` is the JSON list of crawl results
+      """
+      CREATE TABLE IF NOT EXISTS crawl_cache (
+        url_key TEXT NOT NULL,
+        variant TEXT NOT NULL,
+        payload TEXT NOT NULL,
+        etag TEXT,
+        last_modified TEXT,
+        fetched_at REAL NOT NULL,
+        expires_at REAL NOT NULL,
+        last_used_at REAL NOT NULL,
+        size_bytes INTEGER NOT NULL,
+        PRIMARY KEY (url_key, variant)
+      ) WITHOUT ROWID
+      """,
+      # Least recently used eviction
+      """
+      CREATE INDEX IF NOT EXISTS idx_crawl_cache_last_used_at
+      ON crawl_cache (last_used_at)
+      """,
+    ),
+  ),
+  Migration(
+    version=8,
+    description='Research cache',
+    statements=(
+      # One row per research stage and normalized subject, e.g. sentiment for a company or
+      # salary for a company, title and location. `payload` is the stage result as JSON
+      """
+      CREATE TABLE IF NOT EXISTS research_cache (
+        stage TEXT NOT NULL,
+        cache_key TEXT NOT NULL,
+        payload TEXT NOT NULL,
+        generated_at REAL NOT NULL,
+        PRIMARY KEY (stage, cache_key)
+      ) WITHOUT ROWID
+      """,
+    ),
+  ),
+  Migration(
+    version=9,
+    description='Research job queue',
+    statements=(
+      # `company_key` is the normalized company name, so jobs for one company can be kept from
+      # running at the same time. Lower `priority` values run first.
+      """
+      CREATE TABLE IF NOT EXISTS research_jobs (
+        listing_id TEXT PRIMARY KEY,
+        batch_id TEXT NOT NULL,
+        company_key TEXT NOT NULL,
+        priority INTEGER NOT NULL DEFAULT 0,
+        status TEXT NOT NULL,
+        error TEXT,
+        attempts INTEGER NOT NULL DEFAULT 0,
+        enqueued_at REAL NOT NULL,
+        started_at REAL,
+        finished_at REAL,
+        FOREIGN KEY (listing_id) REFERENCES listings (id) ON DELETE CASCADE
+      )
+      """,
+      """
+      CREATE INDEX IF NOT EXISTS idx_research_jobs_status_priority
+      ON research_jobs (status, priority, enqueued_at)
+      """,
+      """
+      CREATE INDEX IF NOT EXISTS idx_research_jobs_batch_id
+      ON research_jobs (batch_id)
+      """,
+    ),
+  ),
+  Migration(
+    version=10,
+    description='Task states',
+    statements=(
+      # Status of background tasks such as research and analysis, as JSON, when the SQLite
+      # task store is selected
+      """
+      CREATE TABLE IF NOT EXISTS task_states (
+        namespace TEXT NOT NULL,
+        key TEXT NOT NULL,
+        value TEXT NOT NULL,
+        updated_at REAL NOT NULL,
+        expires_at REAL NOT NULL,
+        PRIMARY KEY (namespace, key)
+      ) WITHOUT ROWID
+      """,
+      """
+      CREATE INDEX IF NOT EXISTS idx_task_states_expires_at
+      ON task_states (expires_at)
+      """,
+      """
+      CREATE INDEX IF NOT EXISTS idx_task_states_updated_at
+      ON task_states (updated_at)
+      """,
+    ),
+  ),
+  Migration(
+    version=11,
+    description='Analysis cache',
+    statements=(
+      # Per-unit content quality scores and per-skill model scores, so re-analysis only
+      # recomputes units and skills that changed. scope_hash identifies the listing or resume
+      # content the score was computed against; item_key is a unit hash or normalized skill.
+      """
+      CREATE TABLE IF NOT EXISTS analysis_cache (
+        kind TEXT NOT NULL,
+        model_id TEXT NOT NULL,
+        scope_hash TEXT NOT NULL,
+        item_key TEXT NOT NULL,
+        score REAL NOT NULL,
+        updated_at REAL NOT NULL,
+        PRIMARY KEY (kind, model_id, scope_hash, item_key)
+      ) WITHOUT ROWID
+      """,
+      """
+      CREATE INDEX IF NOT EXISTS idx_analysis_cache_updated_at
+      ON analysis_cache (updated_at)
+      """,
+    ),
+  ),
+  Migration(
+    version=12,
+    description='Index + and # as part of listing search terms',
+    statements=(
+      # unicode61 splits on symbols, so "C++" and "C#" were indexed as "c". The triggers from
+      # version 3 refer to the table by name and keep working once it is recreated.
+      'DROP TABLE IF EXISTS listings_fts',
+      """
+      CREATE VIRTUAL TABLE IF NOT EXISTS listings_fts USING fts5 (
+        title, company, domain, location, description, skills, requirements,
+        content = 'listings',
+        content_rowid = 'rowid',
+        tokenize = 'unicode61 remove_diacritics 2 tokenchars ''+#''',
+        prefix = '2 3'
+      )
+      """,
+      "INSERT INTO listings_fts (listings_fts) VALUES ('rebuild')",
+    ),
+  ),
+]
@@ -1,13 +1,21 @@
+from .analysis_cache_repository import AnalysisCacheRepository
 from .application_repository import ApplicationRepository
 from .listing_repository import ListingRepository
 from .profile_repository import ProfileRepository
+from .research_cache_repository import ResearchCacheRepository
+from .research_job_repository import ResearchJobRepository
 from .resume_repository import ResumeRepository
+from .screenshot_repository import ScreenshotRepository
 from .template_repository import TemplateRepository
 
 __all__ = [
+  'AnalysisCacheRepository',
   'ApplicationRepository',
   'ListingRepository',
   'ProfileRepository',
+  'ResearchCacheRepository',
+  'ResearchJobRepository',
   'ResumeRepository',
+  'ScreenshotRepository',
   'TemplateRepository',
 ]
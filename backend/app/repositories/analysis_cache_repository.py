@@ -0,0 +1,71 @@
+import time
+from typing import Annotated, Literal
+
+from fastapi import Depends
+
+from app.repositories.base import DatabaseRepository
+from app.services.config import get_settings
+from app.services.config.schemas import AppConfig
+
+AnalysisCacheKind = Literal['content_quality', 'required_skill', 'resume_skill']
+
+# Scores not rewritten within this window are dropped the next time anything is stored
+ANALYSIS_CACHE_MAX_AGE_SECONDS = 90 * 24 * 3600
+
+
+class AnalysisCacheRepository(DatabaseRepository):
+  """Application analysis scores reused across requests while their inputs are unchanged."""
+
+  def __init__(self, settings: Annotated[AppConfig, Depends(get_settings)]):
+    super().__init__(settings)
+
+  def get_scores(
+    self,
+    kind: AnalysisCacheKind,
+    model_id: str,
+    scope_hash: str,
+    item_keys: list[str],
+  ) -> dict[str, float]:
+    """Return the stored scores for whichever of `item_keys` are cached."""
+    if not item_keys:
+      return {}
+
+    placeholders = ','.join('?' * len(item_keys))
+    rows = self.fetch_all(
+      f"""
+      SELECT item_key, score
+      FROM analysis_cache
+      WHERE kind = ? AND model_id = ? AND scope_hash = ? AND item_key IN ({placeholders})
+      """,
+      (kind, model_id, scope_hash, *item_keys),
+    )
+    return {row['item_key']: row['score'] for row in rows}
+
+  def put_scores(
+    self,
+    kind: AnalysisCacheKind,
+    model_id: str,
+    scope_hash: str,
+    scores: dict[str, float],
+  ) -> None:
+    if not scores:
+      return
+
+    now = time.time()
+    with self.transaction():
+      self.execute_many(
+        """
+        INSERT OR REPLACE INTO analysis_cache (
+          kind, model_id, scope_hash, item_key, score, updated_at
+        )
+        VALUES (?, ?, ?, ?, ?, ?)
+        """,
+        [(kind, model_id, scope_hash, key, score, now) for key, score in scores.items()],
+      )
+      self.execute(
+        'DELETE FROM analysis_cache WHERE updated_at < ?',
+        (now - ANALYSIS_CACHE_MAX_AGE_SECONDS,),
+      )
+
+  def clear(self) -> None:
+    self.execute('DELETE FROM analysis_cache')
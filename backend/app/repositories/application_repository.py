@@ -8,17 +8,18 @@ from fastapi import Depends
 from pydantic import TypeAdapter
 
 from app.repositories.base import DatabaseRepository
-from app.repositories.base.in_memory_kv_repository import InMemoryKVRepository
+from app.repositories.base.task_state_repository import TaskStateRepository
 from app.schemas.application import (
   Application,
   StatusEnum,
   StatusEvent,
   StatusEventSaved,
 )
-from app.schemas.task_status import TaskStatus, TaskStatusEntry
+from app.schemas.task_status import TaskStatus, TaskStatusEntry, advance_task_status
 from app.services.config import get_settings
 from app.services.config.schemas import AppConfig
 from app.utils.errors import NotFoundError, ValidationError
+from app.utils.status_ordering import generate_latest_status_refresh_sql
 
 event_adapter = TypeAdapter(StatusEvent)
 
@@ -61,12 +62,11 @@ APPLICATION_WITH_EVENTS_QUERY = """
 """
 
 
-class ApplicationRepository(DatabaseRepository, InMemoryKVRepository):
+class ApplicationRepository(DatabaseRepository, TaskStateRepository):
   ANALYSIS_TASK_NAMESPACE = 'application_analysis'
 
   def __init__(self, settings: Annotated[AppConfig, Depends(get_settings)]):
     DatabaseRepository.__init__(self, settings=settings)
-    InMemoryKVRepository.__init__(self)
 
   def get(self, application_id: UUID) -> Application:
     row = self.fetch_one(
@@ -165,6 +165,8 @@ class ApplicationRepository(DatabaseRepository, InMemoryKVRepository):
           ),
         )
 
+      self._sync_listing_latest_status(application.listing_id)
+
     return application
 
   def update_analysis(self, application_id: UUID, analysis_json: str | None) -> Application:
@@ -182,8 +184,10 @@ class ApplicationRepository(DatabaseRepository, InMemoryKVRepository):
   def set_analysis_status(
     self, application_id: UUID, status: TaskStatus, error: str | None = None
   ) -> None:
-    self.set_value(
-      self.ANALYSIS_TASK_NAMESPACE, str(application_id), TaskStatusEntry(status=status, error=error)
+    self.update_value(
+      self.ANALYSIS_TASK_NAMESPACE,
+      str(application_id),
+      lambda entry: advance_task_status(entry, status, error),
     )
 
   def get_analysis_status(self, application_id: UUID) -> TaskStatusEntry | None:
@@ -332,3 +336,11 @@ class ApplicationRepository(DatabaseRepository, InMemoryKVRepository):
         'UPDATE applications SET current_status = ?, last_status_at = ? WHERE id = ?',
         (current_status, last_status_at, str(application_id)),
       )
+
+      self._sync_listing_latest_status(app.listing_id)
+
+  def _sync_listing_latest_status(self, listing_id: UUID) -> None:
+    """Recompute the listing's row in listing_latest_status from its applications' events."""
+    with self.transaction():
+      self.execute('DELETE FROM listing_latest_status WHERE listing_id = ?', (str(listing_id),))
+      self.execute(generate_latest_status_refresh_sql('l.id = ?'), (str(listing_id),))
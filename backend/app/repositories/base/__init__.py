@@ -5,8 +5,7 @@ from .vector_repository import VectorRepository
 
 # TODO: We could move repositories/base/*_repository.py to clients/data_access/*_client.py
 # and use DI of db_repository = Annotated[DatabaseRepository, Depends(get_db_repository)]
-# to maintain parity with cloud codebase. This could also allow us to share connections
-# between requests (by adding the db in request.app.state)
+# to maintain parity with cloud codebase.
 __all__ = [
   'DatabaseRepository',
   'FileRepository',
@@ -1,15 +1,19 @@
 import sqlite3
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
 from contextlib import contextmanager
 from contextvars import ContextVar
-from typing import Annotated
+from typing import Annotated, ParamSpec, TypeVar
 
 from fastapi import Depends
 
+from app.managers import ConnectionPool, get_connection_pool, run_in_db_thread
 from app.services.config import get_settings
 from app.services.config.schemas import AppConfig
 from app.utils.errors import ServiceError
 
+P = ParamSpec('P')
+T = TypeVar('T')
+
 _db_ctx: ContextVar[sqlite3.Connection | None] = ContextVar('_db_ctx', default=None)
 
 
@@ -17,6 +21,11 @@ class DatabaseRepository:
   def __init__(self, settings: Annotated[AppConfig, Depends(get_settings)]):
     self.settings = settings
 
+  @property
+  def connection_pool(self) -> ConnectionPool:
+    # Resolved per call so repositories follow settings changes (e.g. entering paper mode)
+    return get_connection_pool(self.settings.paths.db_path, self.settings.database)
+
   @contextmanager
   def transaction(self) -> Iterator[sqlite3.Connection]:
     """
@@ -36,10 +45,9 @@ class DatabaseRepository:
     token = None
     conn = _db_ctx.get()
 
-    # If no connection exists in this context, create one
+    # If no connection exists in this context, lease one from the pool
     if conn is None:
-      conn = sqlite3.connect(self.settings.paths.db_path)
-      conn.row_factory = sqlite3.Row
+      conn = self.connection_pool.acquire()
       token = _db_ctx.set(conn)
 
     try:
@@ -53,19 +61,41 @@ class DatabaseRepository:
       raise
     finally:
       if token:
-        conn.close()
         _db_ctx.reset(token)
+        self.connection_pool.release(conn)
+
+  async def run_in_transaction(self, fn: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs) -> T:
+    """
+    Async counterpart of transaction(): run `fn` on a database thread inside one transaction.
+
+    A leased connection is never held across an await, so a unit of work that must commit
+    together goes in one synchronous callable. Calls it makes on any repository for the same
+    database join the transaction.
+
+    Example:
+    ```
+    def create_user() -> None:
+      users.execute("INSERT INTO users VALUES (?, ?)", (1, "Alice"))
+      logs.execute("INSERT INTO logs VALUES (?, ?)", (1, "Created user"))
+
+    await users.run_in_transaction(create_user)
+    ```
+    """
+
+    def run() -> T:
+      with self.transaction():
+        return fn(*args, **kwargs)
+
+    return await run_in_db_thread(run)
 
   def _get_conn(self):
-    """Internal helper to get the active connection or a new one."""
+    """Internal helper to get the active connection or lease one from the pool."""
     conn = _db_ctx.get()
     if conn is not None:
       return conn, False  # (connection, is_manual)
 
     # Fallback for one-off queries outside a transaction() block
-    one_off = sqlite3.connect(self.settings.paths.db_path)
-    one_off.row_factory = sqlite3.Row
-    return one_off, True
+    return self.connection_pool.acquire(), True
 
   def fetch_one(self, query: str, params: tuple = ()) -> sqlite3.Row | None:
     """
@@ -88,7 +118,7 @@ class DatabaseRepository:
       raise ServiceError() from e
     finally:
       if is_one_off:
-        conn.close()
+        self.connection_pool.release(conn)
 
   def fetch_all(self, query: str, params: tuple = ()) -> list[sqlite3.Row]:
     """
@@ -112,7 +142,7 @@ class DatabaseRepository:
       raise ServiceError() from e
     finally:
       if is_one_off:
-        conn.close()
+        self.connection_pool.release(conn)
 
   def execute(self, query: str, params: tuple = ()) -> sqlite3.Cursor:
     """
@@ -140,7 +170,7 @@ class DatabaseRepository:
       raise ServiceError() from e
     finally:
       if is_one_off:
-        conn.close()
+        self.connection_pool.release(conn)
 
   def execute_many(self, query: str, params_list: list[tuple]) -> None:
     """
@@ -164,4 +194,4 @@ class DatabaseRepository:
       raise ServiceError() from e
     finally:
       if is_one_off:
-        conn.close()
+        self.connection_pool.release(conn)
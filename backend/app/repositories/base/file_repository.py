@@ -84,6 +84,27 @@ class FileRepository:
     except Exception as e:
       raise ServiceError() from e
 
+  def write_bytes(self, filepath: Path, content: bytes) -> Path:
+    """
+    Writes raw bytes to a file and returns the filepath.
+
+    Args:
+      filepath: Full path to the file.
+      content: The bytes to write.
+
+    Returns:
+      The filepath of the written file.
+
+    Raises:
+      ServiceError: If writing the file fails.
+    """
+    try:
+      self._ensure_directory(filepath)
+      filepath.write_bytes(content)
+      return filepath
+    except Exception as e:
+      raise ServiceError() from e
+
   def delete(self, filepath: Path) -> None:
     """
     Deletes a file if it exists.
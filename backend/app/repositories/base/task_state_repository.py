@@ -0,0 +1,47 @@
+import threading
+from collections.abc import Callable
+
+from app.managers.task_events import task_events
+from app.managers.task_store import TaskStore, task_stores
+from app.schemas.task_status import TaskStatusEntry
+from app.services.config.schemas import AppConfig
+
+# Status updates read, modify and write an entry; callers run on several database threads
+_update_lock = threading.Lock()
+
+
+class TaskStateRepository:
+  """
+  Mixin for repositories that track background task status.
+
+  Statuses live in the task store selected in the database settings, in memory or in SQLite.
+  Every change is also published to in-process subscribers, such as progress streams. The
+  SQLite store blocks, so async callers go through `run_in_db_thread`.
+  """
+
+  settings: AppConfig
+
+  @property
+  def task_store(self) -> TaskStore:
+    # Resolved per call so repositories follow settings changes (e.g. entering paper mode)
+    return task_stores.get_store(self.settings)
+
+  def set_value(self, namespace: str, key: str, value: TaskStatusEntry) -> None:
+    self.task_store.set(namespace, key, value)
+    task_events.publish(namespace, key, value)
+
+  def update_value(
+    self,
+    namespace: str,
+    key: str,
+    update: Callable[[TaskStatusEntry | None], TaskStatusEntry],
+  ) -> None:
+    """Replace an entry with `update(current)`, without losing concurrent updates."""
+    with _update_lock:
+      self.set_value(namespace, key, update(self.get_value(namespace, key)))
+
+  def get_value(self, namespace: str, key: str) -> TaskStatusEntry | None:
+    return self.task_store.get(namespace, key)
+
+  def clear_value(self, namespace: str, key: str) -> None:
+    self.task_store.delete(namespace, key)
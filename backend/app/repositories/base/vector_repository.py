@@ -83,7 +83,7 @@ class VectorRepository:
     try:
       collection = self._get_collection(collection_name)
       ids = [str(uuid4()) for _ in documents]
-      embeddings = cast(list[Embedding], await self.model_client.embed(documents))
+      embeddings = cast(list[Embedding], await self.model_client.embed_batched(documents))
 
       collection.add(
         documents=documents,
@@ -4,23 +4,54 @@ from uuid import UUID
 
 from chromadb.api.types import Metadata
 from fastapi import Depends
-from pydantic import HttpUrl
+from pydantic import BaseModel, HttpUrl
 
 from app.clients.model import ModelClient, get_model_client
+from app.managers import run_in_db_thread
 from app.repositories.base import DatabaseRepository, VectorRepository
-from app.repositories.base.in_memory_kv_repository import InMemoryKVRepository
+from app.repositories.base.task_state_repository import TaskStateRepository
 from app.schemas.application import StatusEnum
 from app.schemas.listing import Listing, ListingSummary
-from app.schemas.task_status import TaskStatus, TaskStatusEntry
-from app.schemas.types import Page
+from app.schemas.task_status import TaskStatus, TaskStatusEntry, advance_task_status
+from app.schemas.types import CursorPage, Page
 from app.services.config import get_settings
 from app.services.config.schemas import AppConfig
-from app.utils.deduplication import fuzzy_text_similarity
-from app.utils.errors import NotFoundError
-from app.utils.status_ordering import generate_latest_event_sql
-
-
-class ListingRepository(DatabaseRepository, VectorRepository, InMemoryKVRepository):
+from app.utils.deduplication import fuzzy_text_similarities
+from app.utils.errors import NotFoundError, ValidationError
+from app.utils.hash import hash_json_value
+from app.utils.pagination import INVALID_CURSOR_MESSAGE, decode_cursor, encode_cursor
+from app.utils.text import to_fts_prefix_query
+
+ListingSortBy = Literal['title', 'company', 'posted_at', 'last_status_at']
+
+# Nullable columns are coalesced so they can take part in keyset comparisons. NULL and '' both
+# sort first, so the order matches sorting on the raw column. Each expression has a matching
+# (expression, id) index from migration 5.
+LISTING_SORT_EXPRESSIONS: dict[ListingSortBy, str] = {
+  'title': 'l.title',
+  'company': 'l.company',
+  'posted_at': "COALESCE(l.posted_date, '')",
+  'last_status_at': "COALESCE(ls.date, '')",
+}
+
+LISTING_SUMMARY_COLUMNS = """
+  l.id, l.url, l.title, l.company, l.domain, l.location, l.posted_date,
+  ls.date as last_status_at,
+  ls.status as current_status,
+  json_extract(a.analysis, '$.matchScore') as match_score
+"""
+
+LISTING_SUMMARY_JOINS = """
+  LEFT JOIN listing_latest_status ls ON ls.listing_id = l.id
+  LEFT JOIN applications a ON a.id = ls.application_id
+"""
+
+# bm25 column weights for listings_fts, in column order:
+# title, company, domain, location, description, skills, requirements
+LISTING_SEARCH_WEIGHTS = '10.0, 8.0, 2.0, 2.0, 1.0, 4.0, 1.0'
+
+
+class ListingRepository(DatabaseRepository, VectorRepository, TaskStateRepository):
   RESEARCH_TASK_NAMESPACE = 'listing_research'
 
   def __init__(
@@ -30,7 +61,6 @@ class ListingRepository(DatabaseRepository, VectorRepository, InMemoryKVReposito
   ):
     DatabaseRepository.__init__(self, settings=settings)
     VectorRepository.__init__(self, model_client=model_client, settings=settings)
-    InMemoryKVRepository.__init__(self)
 
   def get(self, listing_id) -> Listing:
     query = """
@@ -68,55 +98,22 @@ class ListingRepository(DatabaseRepository, VectorRepository, InMemoryKVReposito
     size,
     search: str | None = None,
     status: list[StatusEnum] | None = None,
-    sort_by: Literal['title', 'company', 'posted_at', 'last_status_at'] | None = None,
+    sort_by: ListingSortBy | None = None,
     sort_dir: Literal['asc', 'desc'] | None = None,
   ) -> Page[ListingSummary]:
     offset = (page - 1) * size
 
-    conditions = []
-    params = []
-
-    if search:
-      conditions.append('(l.title LIKE ? OR l.company LIKE ? OR l.domain LIKE ?)')
-      search_term = f'%{search}%'
-      params.extend([search_term, search_term, search_term])
-
-    if status:
-      placeholders = ', '.join('?' for _ in status)
-      conditions.append(f'le.status IN ({placeholders})')
-      params.extend([s.value for s in status])
-
-    where_clause = f'WHERE {" AND ".join(conditions)}' if conditions else ''
-
-    sort_map = {
-      'title': 'l.title',
-      'company': 'l.company',
-      'posted_at': 'l.posted_date',
-      'last_status_at': 'le.date',
-    }
-
-    if sort_by:
-      sql_sort_col = sort_map.get(sort_by, 'l.posted_date')
-      sql_sort_dir = 'ASC' if sort_dir == 'asc' else 'DESC'
-      order_by = f'{sql_sort_col} {sql_sort_dir}'
-    else:
-      order_by = 'l.id ASC'
-
-    latest_events_cte = generate_latest_event_sql()
+    search_cte, search_join, where_clause, params = self._build_listing_filters(search, status)
+    sort_expression, direction = self._resolve_listing_sort(sort_by, sort_dir, bool(search_join))
 
     query = f"""
-      {latest_events_cte}
-      SELECT 
-        l.id, l.url, l.title, l.company, l.domain, l.location, l.posted_date,
-        le.date as last_status_at,
-        le.status as current_status,
-        json_extract(a.analysis, '$.matchScore') as match_score
+      {search_cte}
+      SELECT {LISTING_SUMMARY_COLUMNS}
       FROM listings l
-      LEFT JOIN latest_events le ON l.id = le.listing_id AND le.rn = 1
-      LEFT JOIN applications a ON a.id = le.application_id
+      {search_join}
+      {LISTING_SUMMARY_JOINS}
       {where_clause}
-      GROUP BY l.id
-      ORDER BY {order_by}
+      ORDER BY {sort_expression} {direction}, l.id {direction}
       LIMIT ? OFFSET ?
     """
 
@@ -124,15 +121,7 @@ class ListingRepository(DatabaseRepository, VectorRepository, InMemoryKVReposito
 
     listings = [ListingSummary(**dict(row)) for row in rows]
 
-    count_query = f"""
-      {latest_events_cte}
-      SELECT COUNT(DISTINCT l.id)
-      FROM listings l
-      LEFT JOIN latest_events le ON l.id = le.listing_id AND le.rn = 1
-      {where_clause}
-    """
-    total_count = self.fetch_one(count_query, tuple(params))
-    total_count = total_count[0] if total_count else 0
+    total_count = self._count_listings(search_cte, search_join, where_clause, params)
 
     return Page(
       items=listings,
@@ -142,8 +131,148 @@ class ListingRepository(DatabaseRepository, VectorRepository, InMemoryKVReposito
       pages=(total_count + size - 1) // size,
     )
 
+  def list_all_by_cursor(
+    self,
+    size,
+    cursor: str | None = None,
+    search: str | None = None,
+    status: list[StatusEnum] | None = None,
+    sort_by: ListingSortBy | None = None,
+    sort_dir: Literal['asc', 'desc'] | None = None,
+    include_total: bool = False,
+  ) -> CursorPage[ListingSummary]:
+    """
+    Keyset-paginated variant of list_all.
+
+    Each page seeks past the last row of the previous one using the sort key and listing id,
+    so deep pages cost the same as the first. The total is only counted when asked for.
+
+    Raises:
+      ValidationError: If the cursor is malformed or was issued for a different query.
+    """
+    search_cte, search_join, where_clause, params = self._build_listing_filters(search, status)
+    sort_expression, direction = self._resolve_listing_sort(sort_by, sort_dir, bool(search_join))
+    # Cursors are only valid for the query that issued them
+    query_key = hash_json_value([search, sorted(s.value for s in status or []), sort_by, direction])
+
+    page_where_clause = where_clause
+    seek_params: list = []
+    if cursor:
+      position = decode_cursor(cursor)
+      if position.get('q') != query_key or 'v' not in position or 'id' not in position:
+        raise ValidationError(INVALID_CURSOR_MESSAGE)
+
+      comparison = '>' if direction == 'ASC' else '<'
+      joiner = 'AND' if where_clause else 'WHERE'
+      page_where_clause = f'{where_clause} {joiner} ({sort_expression}, l.id) {comparison} (?, ?)'
+      seek_params = [position['v'], position['id']]
+
+    query = f"""
+      {search_cte}
+      SELECT {LISTING_SUMMARY_COLUMNS}, {sort_expression} AS sort_value
+      FROM listings l
+      {search_join}
+      {LISTING_SUMMARY_JOINS}
+      {page_where_clause}
+      ORDER BY {sort_expression} {direction}, l.id {direction}
+      LIMIT ?
+    """
+
+    # Fetch one extra row to learn whether another page exists without counting
+    rows = self.fetch_all(query, tuple(params + seek_params + [size + 1]))
+    has_more = len(rows) > size
+    rows = rows[:size]
+
+    next_cursor = None
+    if has_more:
+      last = rows[-1]
+      next_cursor = encode_cursor({'q': query_key, 'v': last['sort_value'], 'id': last['id']})
+
+    total = None
+    if include_total:
+      total = self._count_listings(search_cte, search_join, where_clause, params)
+
+    items = []
+    for row in rows:
+      row_dict = dict(row)
+      row_dict.pop('sort_value')
+      items.append(ListingSummary(**row_dict))
+
+    return CursorPage(items=items, size=size, next_cursor=next_cursor, total=total)
+
+  def _build_listing_filters(
+    self,
+    search: str | None,
+    status: list[StatusEnum] | None,
+  ) -> tuple[str, str, str, list]:
+    """Build the search CTE, search join, WHERE clause and their parameters for listings."""
+    conditions = []
+    params = []
+    search_cte = ''
+    search_join = ''
+
+    fts_query = to_fts_prefix_query(search) if search else None
+    if fts_query:
+      # bm25 only works in the query that owns the MATCH, so materialize the ranked matches
+      # rather than letting SQLite flatten them into the outer join
+      search_cte = f"""
+      WITH search_results AS MATERIALIZED (
+        SELECT rowid, bm25(listings_fts, {LISTING_SEARCH_WEIGHTS}) AS rank
+        FROM listings_fts
+        WHERE listings_fts MATCH ?
+      )"""
+      search_join = 'JOIN search_results fts ON fts.rowid = l.rowid'
+      params.append(fts_query)
+    elif search and search.strip():
+      # Input with no words to index, e.g. "++", is matched literally instead
+      conditions.append('(l.title LIKE ? OR l.company LIKE ? OR l.domain LIKE ?)')
+      search_term = f'%{search.strip()}%'
+      params.extend([search_term, search_term, search_term])
+
+    if status:
+      placeholders = ', '.join('?' for _ in status)
+      conditions.append(f'ls.status IN ({placeholders})')
+      params.extend([s.value for s in status])
+
+    where_clause = f'WHERE {" AND ".join(conditions)}' if conditions else ''
+
+    return search_cte, search_join, where_clause, params
+
+  def _resolve_listing_sort(
+    self,
+    sort_by: ListingSortBy | None,
+    sort_dir: Literal['asc', 'desc'] | None,
+    is_search: bool,
+  ) -> tuple[str, str]:
+    """Resolve the SQL sort expression and direction. Ties are always broken by listing id."""
+    if sort_by:
+      return LISTING_SORT_EXPRESSIONS[sort_by], 'ASC' if sort_dir == 'asc' else 'DESC'
+    if is_search:
+      # Lower bm25 scores are better matches
+      return 'fts.rank', 'ASC'
+    return 'l.id', 'ASC'
+
+  def _count_listings(
+    self,
+    search_cte: str,
+    search_join: str,
+    where_clause: str,
+    params: list,
+  ) -> int:
+    count_query = f"""
+      {search_cte}
+      SELECT COUNT(*)
+      FROM listings l
+      {search_join}
+      LEFT JOIN listing_latest_status ls ON ls.listing_id = l.id
+      {where_clause}
+    """
+    total_count = self.fetch_one(count_query, tuple(params))
+    return total_count[0] if total_count else 0
+
   async def create(self, listing: Listing) -> Listing:
-    self.execute(
+    await run_in_db_thread(
+      self.execute,
       """
       INSERT INTO listings (
         id, url, title, company, domain, location, description, notes, research, posted_date,
@@ -235,10 +364,30 @@ class ListingRepository(DatabaseRepository, VectorRepository, InMemoryKVReposito
   def set_research_status(
     self, listing_id: UUID, status: TaskStatus, error: str | None = None
   ) -> None:
-    self.set_value(
-      self.RESEARCH_TASK_NAMESPACE, str(listing_id), TaskStatusEntry(status=status, error=error)
+    self.update_value(
+      self.RESEARCH_TASK_NAMESPACE,
+      str(listing_id),
+      lambda entry: advance_task_status(entry, status, error),
     )
 
+  def set_research_stage_status(
+    self,
+    listing_id: UUID,
+    stage: str,
+    status: TaskStatus,
+    result: BaseModel | None = None,
+  ) -> None:
+    def update(entry: TaskStatusEntry | None) -> TaskStatusEntry:
+      entry = entry or advance_task_status(None, TaskStatus.RUNNING)
+      results = entry.results
+      if result is not None:
+        results = {**results, stage: result.model_dump(mode='json', by_alias=True)}
+      return entry.model_copy(
+        update={'stages': {**entry.stages, stage: status}, 'results': results}
+      )
+
+    self.update_value(self.RESEARCH_TASK_NAMESPACE, str(listing_id), update)
+
   def get_research_status(self, listing_id: UUID) -> TaskStatusEntry | None:
     return self.get_value(self.RESEARCH_TASK_NAMESPACE, str(listing_id))
 
@@ -291,7 +440,8 @@ class ListingRepository(DatabaseRepository, VectorRepository, InMemoryKVReposito
       return []
 
     placeholders = ','.join('?' * len(matching_ids))
-    rows = self.fetch_all(
+    rows = await run_in_db_thread(
+      self.fetch_all,
       f"""
       SELECT
         l.id, l.url, l.title, l.company, l.domain, l.location, l.description, l.notes,
@@ -317,26 +467,55 @@ class ListingRepository(DatabaseRepository, VectorRepository, InMemoryKVReposito
     """
     Find duplicates using fuzzy string matching on company and title.
 
+    Listings are blocked by company first: only listings whose company clears the company
+    threshold have their titles scored, and matches are loaded in a single query.
+
     Args:
       new_listing: The listing to check
 
     Returns:
       List of (similar_listing, similarity_score) tuples above threshold
     """
-    # Get all listings for heuristic comparison (no pagination for deduplication)
-    page_result = self.list_all(page=1, size=1000)
-    existing_listings = page_result.items
+    company_rows = self.fetch_all('SELECT DISTINCT company FROM listings')
+    companies = [row['company'] for row in company_rows]
+    company_scores = {
+      company: score
+      for company, score in zip(
+        companies, fuzzy_text_similarities(new_listing.company, companies), strict=True
+      )
+      if score >= self.settings.listings.company_threshold
+    }
+    if not company_scores:
+      return []
 
-    similar = []
-    for existing_listing in existing_listings:
-      title_sim = fuzzy_text_similarity(new_listing.title, existing_listing.title)
-      company_sim = fuzzy_text_similarity(new_listing.company, existing_listing.company)
+    placeholders = ','.join('?' * len(company_scores))
+    candidate_rows = self.fetch_all(
+      f'SELECT id, title, company FROM listings WHERE company IN ({placeholders})',
+      tuple(company_scores),
+    )
+    title_scores = fuzzy_text_similarities(
+      new_listing.title, [row['title'] for row in candidate_rows]
+    )
 
-      if (
-        title_sim >= self.settings.listings.title_threshold
-        and company_sim >= self.settings.listings.company_threshold
-      ):
-        combined_score = (title_sim + company_sim) / 2
-        similar.append((self.get(existing_listing.id), combined_score))
+    combined_scores = {
+      row['id']: (title_sim + company_scores[row['company']]) / 2
+      for row, title_sim in zip(candidate_rows, title_scores, strict=True)
+      if title_sim >= self.settings.listings.title_threshold
+    }
+    if not combined_scores:
+      return []
+
+    placeholders = ','.join('?' * len(combined_scores))
+    rows = self.fetch_all(
+      f"""
+      SELECT
+        l.id, l.url, l.title, l.company, l.domain, l.location, l.description, l.notes,
+        l.research, l.posted_date, l.salary, l.skills, l.requirements, l.keywords
+      FROM listings l
+      WHERE l.id IN ({placeholders})
+      """,
+      tuple(combined_scores),
+    )
 
+    similar = [(Listing(**dict(row)), combined_scores[row['id']]) for row in rows]
     return sorted(similar, key=lambda x: x[1], reverse=True)
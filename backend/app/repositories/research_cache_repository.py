@@ -0,0 +1,39 @@
+import time
+from typing import Annotated
+
+from fastapi import Depends
+
+from app.repositories.base import DatabaseRepository
+from app.services.config import get_settings
+from app.services.config.schemas import AppConfig
+
+
+class ResearchCacheRepository(DatabaseRepository):
+  """Listing research results shared between listings with the same company or role."""
+
+  def __init__(self, settings: Annotated[AppConfig, Depends(get_settings)]):
+    super().__init__(settings)
+
+  def get(self, stage: str, cache_key: str, max_age_seconds: float) -> str | None:
+    """Return the stored JSON result if it was generated within `max_age_seconds`."""
+    row = self.fetch_one(
+      """
+      SELECT payload
+      FROM research_cache
+      WHERE stage = ? AND cache_key = ? AND generated_at >= ?
+      """,
+      (stage, cache_key, time.time() - max_age_seconds),
+    )
+    return row['payload'] if row else None
+
+  def put(self, stage: str, cache_key: str, payload: str) -> None:
+    self.execute(
+      """
+      INSERT OR REPLACE INTO research_cache (stage, cache_key, payload, generated_at)
+      VALUES (?, ?, ?, ?)
+      """,
+      (stage, cache_key, payload, time.time()),
+    )
+
+  def clear(self) -> None:
+    self.execute('DELETE FROM research_cache')
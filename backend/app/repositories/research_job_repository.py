@@ -0,0 +1,199 @@
+import time
+from typing import Annotated
+from uuid import UUID, uuid4
+
+from fastapi import Depends
+
+from app.repositories.base import DatabaseRepository
+from app.schemas.research_queue import ResearchJob, ResearchQueueProgress
+from app.schemas.task_status import TaskStatus
+from app.services.config import get_settings
+from app.services.config.schemas import AppConfig
+from app.utils.errors import NotFoundError, ValidationError
+from app.utils.text import normalize_company_name
+
+# Jobs interrupted by this many restarts are failed instead of resumed again
+MAX_RESEARCH_ATTEMPTS = 3
+FINISHED_JOB_RETENTION_SECONDS = 7 * 24 * 3600
+INTERRUPTED_JOB_ERROR = 'Research was interrupted too many times. Try again.'
+
+
+class ResearchJobRepository(DatabaseRepository):
+  """
+  Durable queue of listings waiting for research.
+
+  Jobs outlive the process, so research queued before a restart picks up where it stopped.
+  """
+
+  def __init__(self, settings: Annotated[AppConfig, Depends(get_settings)]):
+    super().__init__(settings)
+
+  def enqueue(self, listing_ids: list[UUID], priority: int = 0) -> tuple[str, list[UUID]]:
+    """
+    Queue listings for research as one batch.
+
+    Listings that are already queued move to the new batch and priority; listings being
+    researched right now are left to finish.
+
+    Returns:
+      The batch id and the listings that were set to pending, excluding those already running.
+
+    Raises:
+      ValidationError: If no listings are given.
+      NotFoundError: If any listing does not exist.
+    """
+    ids = [str(listing_id) for listing_id in dict.fromkeys(listing_ids)]
+    if not ids:
+      raise ValidationError('Choose at least one listing to research.')
+    batch_id = str(uuid4())
+    now = time.time()
+
+    with self.transaction():
+      placeholders = ', '.join('?' * len(ids))
+      rows = self.fetch_all(
+        f'SELECT id, company FROM listings WHERE id IN ({placeholders})', tuple(ids)
+      )
+      companies = {row['id']: row['company'] for row in rows}
+      missing = [listing_id for listing_id in ids if listing_id not in companies]
+      if missing:
+        raise NotFoundError(f'Listing not found: {missing[0]}')
+
+      running = {
+        row['listing_id']
+        for row in self.fetch_all(
+          f"""
+          SELECT listing_id FROM research_jobs
+          WHERE status = 'running' AND listing_id IN ({placeholders})
+          """,
+          tuple(ids),
+        )
+      }
+      self.execute(
+        'DELETE FROM research_jobs WHERE status IN (?, ?) AND finished_at < ?',
+        (TaskStatus.SUCCEEDED, TaskStatus.FAILED, now - FINISHED_JOB_RETENTION_SECONDS),
+      )
+      # SET expressions read the row as it was before the update
+      self.execute_many(
+        """
+        INSERT INTO research_jobs (
+          listing_id, batch_id, company_key, priority, status, enqueued_at
+        )
+        VALUES (?, ?, ?, ?, 'pending', ?)
+        ON CONFLICT (listing_id) DO UPDATE SET
+          batch_id = excluded.batch_id,
+          company_key = excluded.company_key,
+          priority = excluded.priority,
+          status = CASE WHEN status = 'running' THEN status ELSE 'pending' END,
+          error = NULL,
+          attempts = CASE WHEN status = 'running' THEN attempts ELSE 0 END,
+          enqueued_at = CASE WHEN status = 'pending' THEN enqueued_at ELSE excluded.enqueued_at END,
+          finished_at = NULL
+        """,
+        [
+          (listing_id, batch_id, normalize_company_name(companies[listing_id]), priority, now)
+          for listing_id in ids
+        ],
+      )
+
+    return batch_id, [UUID(listing_id) for listing_id in ids if listing_id not in running]
+
+  def claim_next(self) -> ResearchJob | None:
+    """
+    Mark the next job as running and return it, or None if nothing can start.
+
+    Jobs run in priority order, then oldest first. A job waits while another job for the same
+    company is running, so it can reuse that job's cached company research.
+    """
+    with self.transaction() as conn:
+      # Take the write lock up front so the pick and the claim are atomic across pooled
+      # connections; otherwise two workers could each claim a different job for one company
+      if not conn.in_transaction:
+        self.execute('BEGIN IMMEDIATE')
+      row = self.fetch_one(
+        """
+        UPDATE research_jobs
+        SET status = 'running', started_at = ?, attempts = attempts + 1
+        WHERE listing_id = (
+          SELECT listing_id
+          FROM research_jobs
+          WHERE status = 'pending'
+            AND company_key NOT IN (
+              SELECT company_key FROM research_jobs WHERE status = 'running'
+            )
+          ORDER BY priority, enqueued_at
+          LIMIT 1
+        )
+        RETURNING listing_id, batch_id, company_key, priority, attempts
+        """,
+        (time.time(),),
+      )
+
+    if row is None:
+      return None
+    return ResearchJob(
+      listing_id=UUID(row['listing_id']),
+      batch_id=row['batch_id'],
+      company_key=row['company_key'],
+      priority=row['priority'],
+      status=TaskStatus.RUNNING,
+      attempts=row['attempts'],
+    )
+
+  def finish(self, listing_id: UUID, status: TaskStatus, error: str | None = None) -> None:
+    self.execute(
+      """
+      UPDATE research_jobs
+      SET status = ?, error = ?, finished_at = ?
+      WHERE listing_id = ?
+      """,
+      (status, error, time.time(), str(listing_id)),
+    )
+
+  def requeue_interrupted(self) -> int:
+    """
+    Return jobs left running by a previous process to the queue.
+
+    Jobs that have already been interrupted `MAX_RESEARCH_ATTEMPTS` times are failed instead,
+    so a listing that crashes the app cannot do so on every start.
+    """
+    cursor = self.execute(
+      """
+      UPDATE research_jobs
+      SET
+        status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END,
+        error = CASE WHEN attempts >= ? THEN ? ELSE NULL END,
+        finished_at = CASE WHEN attempts >= ? THEN ? ELSE NULL END
+      WHERE status = 'running'
+      """,
+      (
+        MAX_RESEARCH_ATTEMPTS,
+        MAX_RESEARCH_ATTEMPTS,
+        INTERRUPTED_JOB_ERROR,
+        MAX_RESEARCH_ATTEMPTS,
+        time.time(),
+      ),
+    )
+    return cursor.rowcount
+
+  def has_pending(self) -> bool:
+    row = self.fetch_one("SELECT 1 FROM research_jobs WHERE status = 'pending' LIMIT 1")
+    return row is not None
+
+  def get_progress(self, batch_id: str | None = None) -> ResearchQueueProgress:
+    """Count jobs by status for one batch, or for every job still on record."""
+    query = 'SELECT status, COUNT(*) AS count FROM research_jobs'
+    params: tuple = ()
+    if batch_id is not None:
+      query += ' WHERE batch_id = ?'
+      params = (batch_id,)
+    rows = self.fetch_all(f'{query} GROUP BY status', params)
+
+    counts = {row['status']: row['count'] for row in rows}
+    return ResearchQueueProgress(
+      batch_id=batch_id,
+      total=sum(counts.values()),
+      pending=counts.get(TaskStatus.PENDING, 0),
+      running=counts.get(TaskStatus.RUNNING, 0),
+      succeeded=counts.get(TaskStatus.SUCCEEDED, 0),
+      failed=counts.get(TaskStatus.FAILED, 0),
+    )
@@ -0,0 +1,83 @@
+import base64
+import binascii
+import os
+import re
+import time
+from pathlib import Path
+from typing import Annotated
+
+from fastapi import Depends
+
+from app.repositories.base import FileRepository
+from app.services.config import get_settings
+from app.services.config.schemas import AppConfig
+from app.utils.errors import NotFoundError, ServiceError, ValidationError
+from app.utils.hash import sha256_hex
+from app.utils.images import detect_image_format
+
+SCREENSHOT_EXTENSIONS = ['.webp', '.jpeg', '.png']
+# Screenshots only back listing drafts, which are short-lived
+SCREENSHOT_RETENTION_SECONDS = 30 * 24 * 3600
+SCREENSHOT_ID_PATTERN = re.compile(r'^[0-9a-f]{64}$')
+
+
+class ScreenshotRepository(FileRepository):
+  """Content-addressed screenshot files, so identical screenshots are stored once."""
+
+  def __init__(self, settings: Annotated[AppConfig, Depends(get_settings)]):
+    self.settings = settings
+    super().__init__()
+
+  @property
+  def screenshots_dir(self) -> Path:
+    return Path(self.settings.paths.screenshots_dir)
+
+  def save(self, image: str) -> str:
+    """
+    Store a base64-encoded screenshot and return its id.
+
+    Raises:
+      ValidationError: If the data is not a WebP, JPEG or PNG image.
+      ServiceError: If writing the file fails.
+    """
+    try:
+      data = base64.b64decode(image, validate=True)
+    except binascii.Error as e:
+      raise ValidationError('That screenshot is not a valid image.') from e
+
+    image_format = detect_image_format(data)
+    if image_format is None:
+      raise ValidationError('That screenshot is not a valid image.')
+
+    id = sha256_hex(image)
+    filepath = self.screenshots_dir / f'{id}.{image_format}'
+    try:
+      # A new reference restarts the retention window, so pruning cannot remove a file in use
+      os.utime(filepath)
+    except FileNotFoundError:
+      self._prune_expired()
+      self.write_bytes(filepath, data)
+    except OSError as e:
+      raise ServiceError() from e
+    return id
+
+  def get_path(self, id: str) -> Path:
+    """
+    Find the stored file for a screenshot id.
+
+    Raises:
+      NotFoundError: If no screenshot has this id.
+    """
+    if SCREENSHOT_ID_PATTERN.match(id):
+      for extension in SCREENSHOT_EXTENSIONS:
+        filepath = self.screenshots_dir / f'{id}{extension}'
+        if filepath.exists():
+          return filepath
+
+    raise NotFoundError('That screenshot could not be found.')
+
+  def _prune_expired(self) -> None:
+    cutoff = time.time() - SCREENSHOT_RETENTION_SECONDS
+    for filepath in self.list_directory(self.screenshots_dir, SCREENSHOT_EXTENSIONS):
+      if filepath.stat().st_mtime < cutoff:
+        self.delete(filepath)
@@ -1,13 +1,16 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, BackgroundTasks, Cookie, Depends, status
+from fastapi import APIRouter, BackgroundTasks, Cookie, Depends, Request, status
+from fastapi.responses import StreamingResponse
 
+from app.managers import run_in_db_thread
 from app.repositories import ApplicationRepository
 from app.schemas.application import Application, StatusEvent
 from app.schemas.task_status import TaskStatus, TaskStatusEntry
 from app.services.application import ApplicationService
 from app.utils.errors import NotFoundError
+from app.utils.sse import SSE_HEADERS, stream_task_status
 
 router = APIRouter(
   prefix='/applications',
@@ -19,14 +22,14 @@ router = APIRouter(
 async def get_application(
   id: UUID, application_repository: Annotated[ApplicationRepository, Depends()]
 ):
-  return application_repository.get(id)
+  return await run_in_db_thread(application_repository.get, id)
 
 
 @router.post('/', response_model=Application)
 async def create_application(
   application: Application, application_repository: Annotated[ApplicationRepository, Depends()]
 ):
-  return application_repository.create(application)
+  return await run_in_db_thread(application_repository.create, application)
 
 
 @router.post('/{application_id}/events', response_model=StatusEvent)
@@ -35,7 +38,7 @@ async def create_status_event(
   status_event: StatusEvent,
   application_repository: Annotated[ApplicationRepository, Depends()],
 ):
-  return application_repository.create_event(status_event, application_id)
+  return await run_in_db_thread(application_repository.create_event, status_event, application_id)
 
 
 @router.put('/{application_id}/events/{event_id}', response_model=StatusEvent)
@@ -46,7 +49,7 @@ async def update_status_event(
   application_repository: Annotated[ApplicationRepository, Depends()],
 ):
   status_event.id = event_id
-  return application_repository.update_event(status_event)
+  return await run_in_db_thread(application_repository.update_event, status_event)
 
 
 @router.delete('/{application_id}/events/{event_id}', response_model=None)
@@ -55,7 +58,7 @@ async def delete_status_event(
   event_id: UUID,
   application_repository: Annotated[ApplicationRepository, Depends()],
 ):
-  application_repository.delete_event(event_id)
+  await run_in_db_thread(application_repository.delete_event, event_id)
 
 
 @router.post('/{id}/analysis', response_model=TaskStatusEntry, status_code=status.HTTP_202_ACCEPTED)
@@ -66,13 +69,13 @@ async def generate_analysis(
   application_repository: Annotated[ApplicationRepository, Depends()],
   session_token: Annotated[str | None, Cookie(alias='__session')] = None,
 ):
-  application_repository.set_analysis_status(id, TaskStatus.PENDING)
+  await run_in_db_thread(application_repository.set_analysis_status, id, TaskStatus.PENDING)
   background_tasks.add_task(
     application_service.generate_analysis_task,
     id,
     session_token,
   )
-  return application_repository.get_analysis_status(id)
+  return await run_in_db_thread(application_repository.get_analysis_status, id)
 
 
 @router.get('/{id}/analysis/status', response_model=TaskStatusEntry | None)
@@ -80,7 +83,25 @@ async def get_analysis_status(
   id: UUID,
   application_repository: Annotated[ApplicationRepository, Depends()],
 ):
-  return application_repository.get_analysis_status(id)
+  return await run_in_db_thread(application_repository.get_analysis_status, id)
+
+
+@router.get('/{id}/analysis/events', response_class=StreamingResponse)
+async def stream_analysis_status(
+  id: UUID,
+  request: Request,
+  application_repository: Annotated[ApplicationRepository, Depends()],
+):
+  return StreamingResponse(
+    stream_task_status(
+      ApplicationRepository.ANALYSIS_TASK_NAMESPACE,
+      str(id),
+      lambda: run_in_db_thread(application_repository.get_analysis_status, id),
+      request.is_disconnected,
+    ),
+    media_type='text/event-stream',
+    headers=SSE_HEADERS,
+  )
 
 
 @router.delete('/{id}/analysis/suggestions/{suggestion_id}', response_model=Application)
@@ -89,7 +110,7 @@ async def remove_analysis_suggestion(
   suggestion_id: str,
   application_repository: Annotated[ApplicationRepository, Depends()],
 ):
-  application = application_repository.get(id)
+  application = await run_in_db_thread(application_repository.get, id)
   analysis = application.analysis
   ai_suggestions = analysis.ai_suggestions if analysis else None
   if not analysis or not ai_suggestions:
@@ -102,7 +123,8 @@ async def remove_analysis_suggestion(
   if len(ai_suggestions.suggestions) == previous_count:
     raise NotFoundError('That AI suggestion was not found.')
 
-  return application_repository.update_analysis(
+  return await run_in_db_thread(
+    application_repository.update_analysis,
     id,
     analysis.model_dump_json(by_alias=True),
   )
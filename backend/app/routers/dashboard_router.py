@@ -1,8 +1,10 @@
+import asyncio
 from datetime import UTC, datetime, timedelta
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query
 
+from app.managers import run_in_db_thread
 from app.schemas.stats import StatsResponse
 from app.services.stats import StatsService
 
@@ -20,17 +22,14 @@ async def get_stats(
   end_date = datetime.now(UTC).date()
   start_date = end_date - timedelta(days=days)
 
+  summary, application_funnel, application_history = await asyncio.gather(
+    run_in_db_thread(stats_service.get_summary, start_date, end_date),
+    run_in_db_thread(stats_service.get_funnel, start_date, end_date),
+    run_in_db_thread(stats_service.get_history, start_date, end_date),
+  )
+
   return StatsResponse(
-    summary=stats_service.get_summary(
-      start_date,
-      end_date,
-    ),
-    application_funnel=stats_service.get_funnel(
-      start_date,
-      end_date,
-    ),
-    application_history=stats_service.get_history(
-      start_date,
-      end_date,
-    ),
+    summary=summary,
+    application_funnel=application_funnel,
+    application_history=application_history,
   )
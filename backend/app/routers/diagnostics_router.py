@@ -0,0 +1,30 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+
+from app.clients.scraping.fetch_tiers import fetch_tier_stats
+from app.managers import CrawlCache, get_connection_pool, run_in_db_thread
+from app.schemas.diagnostics import (
+  CrawlCacheDiagnostics,
+  CrawlDiagnostics,
+  FetchTierDiagnostics,
+)
+from app.services.config import get_settings
+from app.services.config.schemas import AppConfig
+
+router = APIRouter(
+  prefix='/diagnostics',
+  tags=['Diagnostics'],
+)
+
+
+@router.get('/crawling', response_model=CrawlDiagnostics)
+async def get_crawl_diagnostics(
+  settings: Annotated[AppConfig, Depends(get_settings)],
+) -> CrawlDiagnostics:
+  cache = CrawlCache(get_connection_pool(settings.paths.db_path, settings.database))
+  cache_stats = await run_in_db_thread(cache.stats)
+  return CrawlDiagnostics(
+    cache=CrawlCacheDiagnostics.model_validate(cache_stats),
+    fetch_tiers=FetchTierDiagnostics.model_validate(fetch_tier_stats.snapshot()),
+  )
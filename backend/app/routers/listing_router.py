@@ -1,16 +1,23 @@
 from typing import Annotated, Literal
 from uuid import UUID
 
-from fastapi import APIRouter, BackgroundTasks, Body, Cookie, Depends, Query, status
+from fastapi import APIRouter, BackgroundTasks, Body, Cookie, Depends, Query, Request, status
+from fastapi.responses import StreamingResponse
 from pydantic import HttpUrl
 
-from app.repositories import ApplicationRepository, ListingRepository
+from app.managers import run_in_db_thread
+from app.repositories import ApplicationRepository, ListingRepository, ResearchJobRepository
+from app.repositories.listing_repository import ListingSortBy
 from app.schemas.application import StatusEnum
 from app.schemas.listing import Listing, ListingSummary
 from app.schemas.listing_draft import ListingDraft
+from app.schemas.research_queue import ResearchQueueProgress
 from app.schemas.task_status import TaskStatus, TaskStatusEntry
-from app.schemas.types import Page
-from app.services.listing import ListingService
+from app.schemas.types import CursorPage, Page
+from app.services.config import get_settings
+from app.services.config.schemas import AppConfig
+from app.services.listing import ListingService, research_queue
+from app.utils.sse import SSE_HEADERS, stream_task_status
 
 router = APIRouter(
   prefix='/listings',
@@ -32,20 +39,34 @@ async def generate_listing_draft(
   )
 
 
-@router.get('', response_model=Page[ListingSummary])
+@router.get('', response_model=Page[ListingSummary] | CursorPage[ListingSummary])
 async def get_listings(
   listing_repository: Annotated[ListingRepository, Depends()],
   page: int | None = 1,
   size: int | None = 10,
   search: str | None = None,
   status: list[StatusEnum] | None = None,
-  sort_by: Annotated[
-    Literal['title', 'company', 'posted_at', 'last_status_at'] | None,
-    Query(alias='sort-by'),
-  ] = None,
+  sort_by: Annotated[ListingSortBy | None, Query(alias='sort-by')] = None,
   sort_dir: Annotated[Literal['asc', 'desc'] | None, Query(alias='sort-dir')] = None,
+  pagination: Literal['offset', 'cursor'] = 'offset',
+  cursor: str | None = None,
+  include_total: Annotated[bool, Query(alias='include-total')] = False,
 ):
-  return listing_repository.list_all(page, size, search, status, sort_by, sort_dir)
+  if pagination == 'cursor':
+    return await run_in_db_thread(
+      listing_repository.list_all_by_cursor,
+      size,
+      cursor,
+      search,
+      status,
+      sort_by,
+      sort_dir,
+      include_total,
+    )
+
+  return await run_in_db_thread(
+    listing_repository.list_all, page, size, search, status, sort_by, sort_dir
+  )
 
 
 @router.get('/{id}', response_model=Listing)
@@ -54,8 +75,8 @@ async def get_listing(
   application_repository: Annotated[ApplicationRepository, Depends()],
   id: UUID,
 ):
-  listing = listing_repository.get(id)
-  listing.applications = application_repository.get_by_listing_id(id)
+  listing = await run_in_db_thread(listing_repository.get, id)
+  listing.applications = await run_in_db_thread(application_repository.get_by_listing_id, id)
   return listing
 
 
@@ -73,7 +94,38 @@ async def update_listing_notes(
   listing_repository: Annotated[ListingRepository, Depends()],
   notes: Annotated[str | None, Body()] = None,
 ):
-  return listing_repository.update_notes(id, notes)
+  return await run_in_db_thread(listing_repository.update_notes, id, notes)
+
+
+@router.post(
+  '/research', response_model=ResearchQueueProgress, status_code=status.HTTP_202_ACCEPTED
+)
+async def queue_research(
+  ids: Annotated[list[UUID], Body()],
+  listing_repository: Annotated[ListingRepository, Depends()],
+  research_job_repository: Annotated[ResearchJobRepository, Depends()],
+  settings: Annotated[AppConfig, Depends(get_settings)],
+  priority: Annotated[int, Body()] = 0,
+  session_token: Annotated[str | None, Cookie(alias='__session')] = None,
+):
+  def enqueue() -> str:
+    batch_id, queued_ids = research_job_repository.enqueue(ids, priority)
+    # Listings already being researched keep their running status and stage progress
+    for listing_id in queued_ids:
+      listing_repository.set_research_status(listing_id, TaskStatus.PENDING)
+    return batch_id
+
+  batch_id = await run_in_db_thread(enqueue)
+  research_queue.wake(settings, batch_id, session_token)
+  return await run_in_db_thread(research_job_repository.get_progress, batch_id)
+
+
+@router.get('/research/progress', response_model=ResearchQueueProgress)
+async def get_research_progress(
+  research_job_repository: Annotated[ResearchJobRepository, Depends()],
+  batch_id: Annotated[str | None, Query(alias='batch-id')] = None,
+):
+  return await run_in_db_thread(research_job_repository.get_progress, batch_id)
 
 
 # TODO: Unlikely but potential race condition if get_research_status is hit before
@@ -86,13 +138,13 @@ async def generate_research(
   listing_repository: Annotated[ListingRepository, Depends()],
   session_token: Annotated[str | None, Cookie(alias='__session')] = None,
 ):
-  listing_repository.set_research_status(id, TaskStatus.PENDING)
+  await run_in_db_thread(listing_repository.set_research_status, id, TaskStatus.PENDING)
   background_tasks.add_task(
     listing_service.generate_research_task,
     id,
     session_token,
   )
-  return listing_repository.get_research_status(id)
+  return await run_in_db_thread(listing_repository.get_research_status, id)
 
 
 @router.get('/{id}/research/status', response_model=TaskStatusEntry | None)
@@ -100,4 +152,22 @@ async def get_research_status(
   id: UUID,
   listing_repository: Annotated[ListingRepository, Depends()],
 ):
-  return listing_repository.get_research_status(id)
+  return await run_in_db_thread(listing_repository.get_research_status, id)
+
+
+@router.get('/{id}/research/events', response_class=StreamingResponse)
+async def stream_research_status(
+  id: UUID,
+  request: Request,
+  listing_repository: Annotated[ListingRepository, Depends()],
+):
+  return StreamingResponse(
+    stream_task_status(
+      ListingRepository.RESEARCH_TASK_NAMESPACE,
+      str(id),
+      lambda: run_in_db_thread(listing_repository.get_research_status, id),
+      request.is_disconnected,
+    ),
+    media_type='text/event-stream',
+    headers=SSE_HEADERS,
+  )
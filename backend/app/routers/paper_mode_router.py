@@ -2,6 +2,7 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends
 
+from app.managers import run_in_db_thread
 from app.services.paper_mode import PaperModeService
 
 router = APIRouter(prefix='/paper-mode', tags=['Paper Mode'])
@@ -11,11 +12,11 @@ router = APIRouter(prefix='/paper-mode', tags=['Paper Mode'])
 async def enter_paper_mode(
   paper_mode_service: Annotated[PaperModeService, Depends()],
 ) -> bool:
-  return paper_mode_service.enter()
+  return await run_in_db_thread(paper_mode_service.enter)
 
 
 @router.post('/exit', response_model=bool)
 async def exit_paper_mode(
   paper_mode_service: Annotated[PaperModeService, Depends()],
 ) -> bool:
-  return paper_mode_service.exit()
+  return await run_in_db_thread(paper_mode_service.exit)
@@ -4,6 +4,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Query
 
 from app.clients.model import ModelClient, get_model_client
+from app.managers import run_in_db_thread
 from app.repositories import ListingRepository, ResumeRepository, TemplateRepository
 from app.schemas.resume import Resume
 from app.schemas.template import DEFAULT_TEMPLATE_ID
@@ -27,38 +28,41 @@ async def create_resume(
   listing_id: Annotated[UUID | None, Query(alias='listing-id')] = None,
 ) -> Resume:
   # TODO: Maybe make this a decorator
-  default_resume = resume_repository.ensure_default_global_resume_exists()
+  default_resume = await run_in_db_thread(resume_repository.ensure_default_global_resume_exists)
 
   if mode == 'default':
-    return resume_repository.create(
+    return await run_in_db_thread(
+      resume_repository.create,
       Resume(
         template_id=default_resume.template_id,
         sections=default_resume.sections,
-      )
+      ),
     )
   elif mode == 'blank':
-    return resume_repository.create(
+    return await run_in_db_thread(
+      resume_repository.create,
       Resume(
         template_id=default_resume.template_id,
         sections=[],
-      )
+      ),
     )
   elif mode == 'optimized':
     if listing_id is None:
       raise ValidationError('Choose a listing before creating an optimized resume.')
 
-    listing = listing_repository.get(listing_id)
+    listing = await run_in_db_thread(listing_repository.get, listing_id)
     optimized_sections = await optimize_resume_sections(
       sections=default_resume.sections,
       listing=listing,
       llm_client=llm_client,
     )
 
-    return resume_repository.create(
+    return await run_in_db_thread(
+      resume_repository.create,
       Resume(
         template_id=default_resume.template_id,
         sections=optimized_sections,
-      )
+      ),
     )
   else:
     raise ValidationError('Choose a valid resume creation mode.')
@@ -70,14 +74,14 @@ async def get_resume(
   resume_repository: Annotated[ResumeRepository, Depends()],
   template_repository: Annotated[TemplateRepository, Depends()],
 ) -> Resume:
-  resume = resume_repository.get(resume_id)
+  resume = await run_in_db_thread(resume_repository.get, resume_id)
 
   # Self-healing
   try:
     template_repository.get_local_template(resume.template_id)
   except NotFoundError:
     resume.template_id = DEFAULT_TEMPLATE_ID
-    resume = resume_repository.update(resume)
+    resume = await run_in_db_thread(resume_repository.update, resume)
 
   return resume
 
@@ -89,7 +93,7 @@ async def update_resume(
   resume_repository: Annotated[ResumeRepository, Depends()],
 ) -> Resume:
   resume.id = resume_id
-  return resume_repository.update(resume)
+  return await run_in_db_thread(resume_repository.update, resume)
 
 
 @router.delete('/{resume_id}')
@@ -97,5 +101,5 @@ async def delete_resume(
   resume_id: UUID,
   resume_repository: Annotated[ResumeRepository, Depends()],
 ):
-  resume_repository.delete(resume_id)
+  await run_in_db_thread(resume_repository.delete, resume_id)
   return {'message': 'Resume deleted successfully'}
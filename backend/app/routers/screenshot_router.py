@@ -0,0 +1,27 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import FileResponse
+
+from app.repositories import ScreenshotRepository
+from app.utils.images import IMAGE_MEDIA_TYPES
+
+router = APIRouter(
+  prefix='/screenshots',
+  tags=['Screenshots'],
+)
+
+# Screenshots are content-addressed, so a given id always refers to the same image
+IMMUTABLE_CACHE_CONTROL = 'private, max-age=31536000, immutable'
+
+
+@router.get('/{id}', response_class=FileResponse)
+async def get_screenshot(
+  id: str, screenshot_repository: Annotated[ScreenshotRepository, Depends()]
+):
+  filepath = screenshot_repository.get_path(id)
+  return FileResponse(
+    filepath,
+    media_type=IMAGE_MEDIA_TYPES[filepath.suffix.lstrip('.')],
+    headers={'Cache-Control': IMMUTABLE_CACHE_CONTROL},
+  )
@@ -4,6 +4,7 @@ from importlib.resources import files
 from pathlib import Path
 
 import uvicorn
+from fastapi import Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
@@ -24,8 +25,13 @@ app.add_middleware(
 
 
 @app.get('/api/health')
-async def health() -> dict[str, str]:
-  return {'status': 'ok'}
+async def health(request: Request) -> dict[str, str]:
+  settings = get_settings(ConfigService())
+  pool = request.app.state.connection_pools.get_pool(settings.paths.db_path, settings.database)
+  return {
+    'status': 'ok',
+    'database': 'ok' if pool.health_check() else 'unavailable',
+  }
 
 
 def get_frontend_dist_path() -> Path:
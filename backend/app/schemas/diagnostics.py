@@ -0,0 +1,29 @@
+from pydantic import Field
+
+from app.schemas.types import CamelModel
+
+
+class CrawlCacheDiagnostics(CamelModel):
+  hits: int = 0
+  revalidated: int = 0
+  misses: int = 0
+  stores: int = 0
+  evictions: int = 0
+  hit_rate: float = 0.0
+  entries: int = 0
+  size_bytes: int = 0
+
+
+class FetchTierDiagnostics(CamelModel):
+  http: int = 0
+  browser: int = 0
+  http_win_rate: float = 0.0
+  # Why crawls fell through from the HTTP tier to the browser, by reason
+  escalations: dict[str, int] = Field(default_factory=dict)
+
+
+class CrawlDiagnostics(CamelModel):
+  """Crawl counters since the backend started, for judging how well caching and tiering work."""
+
+  cache: CrawlCacheDiagnostics
+  fetch_tiers: FetchTierDiagnostics
@@ -29,7 +29,7 @@ class BaseListingDraft(CamelModel):
 class ListingDraftUnique(BaseListingDraft):
   status: Literal[DraftStatusEnum.UNIQUE] = DraftStatusEnum.UNIQUE
   listing: ListingExtraction
-  screenshot: str | None = None
+  screenshot_id: str | None = None
 
 
 class ListingDraftDuplicateUrl(BaseListingDraft):
@@ -41,13 +41,13 @@ class ListingDraftDuplicateContent(BaseListingDraft):
   status: Literal[DraftStatusEnum.DUPLICATE_CONTENT] = DraftStatusEnum.DUPLICATE_CONTENT
   listing: ListingExtraction
   duplicate_of: Listing
-  screenshot: str | None = None
+  screenshot_id: str | None = None
 
 
 class ListingDraftError(BaseListingDraft):
   status: Literal[DraftStatusEnum.ERROR] = DraftStatusEnum.ERROR
   error: str
-  screenshot: str | None = None
+  screenshot_id: str | None = None
 
 
 ListingDraft = Annotated[
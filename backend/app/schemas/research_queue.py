@@ -0,0 +1,23 @@
+from uuid import UUID
+
+from app.schemas.task_status import TaskStatus
+from app.schemas.types import CamelModel
+
+
+class ResearchJob(CamelModel):
+  listing_id: UUID
+  batch_id: str
+  company_key: str
+  priority: int = 0
+  status: TaskStatus
+  error: str | None = None
+  attempts: int = 0
+
+
+class ResearchQueueProgress(CamelModel):
+  batch_id: str | None = None
+  total: int = 0
+  pending: int = 0
+  running: int = 0
+  succeeded: int = 0
+  failed: int = 0
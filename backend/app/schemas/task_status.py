@@ -1,6 +1,10 @@
+from datetime import UTC, datetime
 from enum import StrEnum
+from typing import Any
 
-from pydantic import BaseModel
+from pydantic import Field
+
+from app.schemas.types import CamelModel
 
 
 class TaskStatus(StrEnum):
@@ -10,6 +14,40 @@ class TaskStatus(StrEnum):
   FAILED = 'failed'
 
 
-class TaskStatusEntry(BaseModel):
+class TaskStatusEntry(CamelModel):
   status: TaskStatus
   error: str | None = None
+  # Progress of tasks that run in stages, with each stage's result once it finishes
+  stages: dict[str, TaskStatus] = Field(default_factory=dict)
+  results: dict[str, Any] = Field(default_factory=dict)
+  created_at: datetime | None = None
+  started_at: datetime | None = None
+  finished_at: datetime | None = None
+
+  @property
+  def duration_seconds(self) -> float | None:
+    """Time from starting to finishing, once the task has finished."""
+    if self.started_at is None or self.finished_at is None:
+      return None
+    return (self.finished_at - self.started_at).total_seconds()
+
+
+def advance_task_status(
+  previous: TaskStatusEntry | None, status: TaskStatus, error: str | None = None
+) -> TaskStatusEntry:
+  """
+  Move a task to `status`, stamping when it was queued, started and finished.
+
+  Queuing a task starts a new run from a clean slate; later transitions keep the stage
+  progress and timestamps recorded so far.
+  """
+  now = datetime.now(UTC)
+  if previous is None or status == TaskStatus.PENDING:
+    previous = TaskStatusEntry(status=status, created_at=now)
+
+  update: dict[str, Any] = {'status': status, 'error': error}
+  if status == TaskStatus.RUNNING and previous.started_at is None:
+    update['started_at'] = now
+  if status in (TaskStatus.SUCCEEDED, TaskStatus.FAILED):
+    update['finished_at'] = now
+  return previous.model_copy(update=update)
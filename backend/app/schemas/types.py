@@ -28,6 +28,15 @@ class Page(BaseModel, Generic[T]):
   pages: int
 
 
+class CursorPage(CamelModel, Generic[T]):
+  """A keyset-paginated response model. Pass `next_cursor` back to fetch the following page."""
+
+  items: list[T]
+  size: int
+  next_cursor: str | None = None
+  total: int | None = None
+
+
 def parse_json_list_as(converter: Callable[..., T]) -> Callable[[Any], list[T]]:
   """
   Create a parser that converts JSON array items to a specific type.
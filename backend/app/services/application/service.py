@@ -8,6 +8,7 @@ from app.clients.application_analysis import (
   ApplicationAnalysisClient,
   get_application_analysis_client,
 )
+from app.managers import run_in_db_thread
 from app.repositories import ApplicationRepository, ListingRepository, ResumeRepository
 from app.schemas.task_status import TaskStatus
 from app.utils.auth_context import use_session_token
@@ -37,12 +38,14 @@ class ApplicationService:
     session_token: str | None = None,
   ) -> None:
     with use_session_token(session_token):
-      self.application_repository.set_analysis_status(application_id, TaskStatus.RUNNING)
+      await run_in_db_thread(
+        self.application_repository.set_analysis_status, application_id, TaskStatus.RUNNING
+      )
 
       try:
-        application = self.application_repository.get(application_id)
-        listing = self.listing_repository.get(application.listing_id)
-        resume = self.resume_repository.get(application.resume_id)
+        application = await run_in_db_thread(self.application_repository.get, application_id)
+        listing = await run_in_db_thread(self.listing_repository.get, application.listing_id)
+        resume = await run_in_db_thread(self.resume_repository.get, application.resume_id)
 
         if not listing.skills and not listing.keywords:
           raise ServiceError(
@@ -55,13 +58,18 @@ class ApplicationService:
           resume=resume,
         )
 
-        self.application_repository.update_analysis(
-          application_id, analysis.model_dump_json(by_alias=True)
+        await run_in_db_thread(
+          self.application_repository.update_analysis,
+          application_id,
+          analysis.model_dump_json(by_alias=True),
         )
 
-        self.application_repository.set_analysis_status(application_id, TaskStatus.SUCCEEDED)
+        await run_in_db_thread(
+          self.application_repository.set_analysis_status, application_id, TaskStatus.SUCCEEDED
+        )
       except Exception as e:
-        self.application_repository.set_analysis_status(
+        await run_in_db_thread(
+          self.application_repository.set_analysis_status,
           application_id,
           TaskStatus.FAILED,
           user_facing_error_message(e),
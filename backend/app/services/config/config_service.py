@@ -48,6 +48,12 @@ class ConfigService:
     if env_updates:
       self._write_env(env_updates)
 
+    if merged['model'] != current['model']:
+      # Imported here because app.managers depends on this package for its settings schemas
+      from app.managers import model_clients
+
+      model_clients.invalidate()
+
   def _read_yaml(self) -> dict:
     content = yaml.safe_load(self.user_config_path.read_text())
     return content if isinstance(content, dict) else {}
@@ -122,6 +122,12 @@ class PathsPrefs(BaseModel):
     ),
     exposure='advanced',
   )
+  screenshots_dir: str = ConfigField(
+    default_factory=lambda: str(get_data_dir() / 'screenshots'),
+    title='Screenshots Directory',
+    description='Folder where screenshots of crawled job listing pages are stored.',
+    exposure='advanced',
+  )
   playwright_browsers_path: str = ConfigField(
     default_factory=lambda: str(get_data_dir() / 'playwright-browsers'),
     title='Playwright Browsers Path',
@@ -130,6 +136,115 @@ class PathsPrefs(BaseModel):
   )
 
 
+class DatabasePrefs(BaseModel):
+  journal_mode: Literal['wal', 'delete', 'truncate'] = ConfigField(
+    default='wal',
+    title='Journal Mode',
+    description=(
+      'How SQLite journals writes. WAL lets background research and analysis write while '
+      'the app keeps reading. DELETE is the SQLite default and blocks readers during writes.'
+    ),
+    exposure='advanced',
+  )
+  synchronous: Literal['off', 'normal', 'full'] = ConfigField(
+    default='normal',
+    title='Synchronous Writes',
+    description=(
+      'How often SQLite waits for data to reach the disk. NORMAL is safe with WAL and much '
+      'faster than FULL. OFF risks losing recent writes if the machine loses power.'
+    ),
+    exposure='advanced',
+  )
+  mmap_size_mb: int = ConfigField(
+    default=256,
+    title='Memory-Mapped I/O (MB)',
+    ge=0,
+    le=4096,
+    description=(
+      'How much of the database file SQLite reads through memory mapping. '
+      'Set to 0 to disable memory-mapped I/O.'
+    ),
+    exposure='advanced',
+  )
+  cache_size_mb: int = ConfigField(
+    default=32,
+    title='Page Cache Size (MB)',
+    ge=1,
+    le=1024,
+    description='Page cache kept by each database connection.',
+    exposure='advanced',
+  )
+  temp_store: Literal['default', 'file', 'memory'] = ConfigField(
+    default='memory',
+    title='Temporary Storage',
+    description='Where SQLite keeps temporary tables and indexes used by sorting and grouping.',
+    exposure='advanced',
+  )
+  busy_timeout_ms: int = ConfigField(
+    default=5000,
+    title='Busy Timeout (ms)',
+    ge=0,
+    le=60000,
+    description='How long a connection waits for a lock held by another writer before failing.',
+    exposure='advanced',
+  )
+  wal_autocheckpoint_pages: int = ConfigField(
+    default=1000,
+    title='WAL Auto-Checkpoint (pages)',
+    ge=0,
+    le=100000,
+    description=(
+      'Number of WAL pages after which SQLite copies them back into the database file. '
+      'Set to 0 to rely only on periodic checkpoints.'
+    ),
+    exposure='advanced',
+  )
+  checkpoint_interval_seconds: int = ConfigField(
+    default=300,
+    title='Checkpoint Interval (s)',
+    ge=0,
+    le=86400,
+    description=(
+      'How often Atto checkpoints the WAL in the background between requests. '
+      'The WAL is always truncated when Atto shuts down. Set to 0 to disable.'
+    ),
+    exposure='advanced',
+  )
+  pool_size: int = ConfigField(
+    default=8,
+    title='Connection Pool Size',
+    ge=1,
+    le=64,
+    description='Maximum number of database connections kept open at once.',
+    exposure='advanced',
+  )
+  task_store: Literal['memory', 'sqlite'] = ConfigField(
+    default='memory',
+    title='Task Status Storage',
+    description=(
+      'Where the status of research and analysis tasks is kept. SQLite keeps it across '
+      'restarts and shares it between server processes; memory is slightly faster.'
+    ),
+    exposure='advanced',
+  )
+  task_ttl_hours: float = ConfigField(
+    default=24.0,
+    title='Task Status Lifetime (hours)',
+    gt=0.0,
+    le=24.0 * 30,
+    description='How long the status of a task is kept after its last update.',
+    exposure='advanced',
+  )
+  task_max_entries: int = ConfigField(
+    default=1000,
+    title='Task Status Limit',
+    ge=10,
+    le=100000,
+    description='Maximum number of task statuses kept; the least recently updated are dropped.',
+    exposure='advanced',
+  )
+
+
 class ModelPrefs(BaseModel):
   provider: ModelProvider = ConfigField(
     default='openai',
@@ -168,6 +283,55 @@ class ModelPrefs(BaseModel):
     ),
     exposure='advanced',
   )
+  max_connections: int = ConfigField(
+    default=20,
+    title='Max Connections',
+    ge=1,
+    le=200,
+    description='Maximum number of open connections to the AI provider at once.',
+    exposure='advanced',
+  )
+  keepalive_connections: int = ConfigField(
+    default=10,
+    title='Keep-Alive Connections',
+    ge=0,
+    le=200,
+    description=(
+      'Idle connections kept open to the AI provider so later requests skip the connection '
+      'handshake.'
+    ),
+    exposure='advanced',
+  )
+  keepalive_expiry_seconds: float = ConfigField(
+    default=60.0,
+    title='Keep-Alive Expiry (seconds)',
+    ge=0.0,
+    le=600.0,
+    description='How long an idle connection to the AI provider is kept open.',
+    exposure='advanced',
+  )
+  analysis_concurrency: int = ConfigField(
+    default=3,
+    title='Analysis Concurrency',
+    ge=1,
+    le=8,
+    description=(
+      'Maximum number of AI requests a single application analysis sends at once. Lower this '
+      'if your provider rate-limits you.'
+    ),
+    exposure='advanced',
+  )
+  embedding_cache_size: int = ConfigField(
+    default=50_000,
+    title='Embedding Cache Size',
+    ge=0,
+    le=1_000_000,
+    description=(
+      'Maximum number of text embeddings kept on disk so unchanged text is never embedded '
+      'twice. Set to 0 to turn the cache off.'
+    ),
+    exposure='advanced',
+  )
   api_key: str = ConfigField(
     default='',
     title='API Key',
@@ -296,6 +460,166 @@ class IngestionPrefs(BaseModel):
     ),
     exposure='advanced',
   )
+  screenshot_mode: Literal['off', 'viewport', 'full_page'] = ConfigField(
+    default='viewport',
+    title='Listing Screenshots',
+    description=(
+      'Screenshot captured when importing a listing from a URL. '
+      'OFF: No screenshot, fastest. '
+      'VIEWPORT (default): The visible part of the page. '
+      'FULL PAGE: The entire page, slowest and largest.'
+    ),
+    exposure='advanced',
+  )
+  screenshot_format: Literal['webp', 'jpeg'] = ConfigField(
+    default='webp',
+    title='Screenshot Format',
+    description='Image format screenshots are stored in. WebP is smaller at the same quality.',
+    exposure='advanced',
+  )
+  screenshot_quality: int = ConfigField(
+    default=60,
+    title='Screenshot Quality',
+    ge=1,
+    le=100,
+    description='Compression quality of stored screenshots. Lower values use less disk space.',
+    exposure='advanced',
+  )
+  screenshot_max_width: int = ConfigField(
+    default=1280,
+    title='Screenshot Width',
+    ge=320,
+    le=3840,
+    description='Screenshots wider than this many pixels are scaled down.',
+    exposure='advanced',
+  )
+  http_first_fetch: bool = ConfigField(
+    default=True,
+    title='Try Plain HTTP First',
+    description=(
+      'Fetch pages without a browser when they are server-rendered, falling back to the '
+      'browser for pages that need JavaScript. Much faster for most job boards. Listings '
+      'imported this way have no screenshot.'
+    ),
+    exposure='advanced',
+  )
+  browser_pool_size: int = ConfigField(
+    default=2,
+    title='Browser Pool Size',
+    ge=1,
+    le=16,
+    description=(
+      'Number of headless browsers kept running for crawling. More browsers crawl more pages '
+      'at once but use more memory.'
+    ),
+    exposure='advanced',
+  )
+  browser_recycle_after_pages: int = ConfigField(
+    default=50,
+    title='Restart Browser After Pages',
+    ge=1,
+    le=1000,
+    description='Restart each browser after this many pages to release leaked memory.',
+    exposure='advanced',
+  )
+  crawl_concurrency: int = ConfigField(
+    default=4,
+    title='Concurrent Crawls',
+    ge=1,
+    le=32,
+    description='Maximum number of pages crawled at once across all research.',
+    exposure='advanced',
+  )
+  crawl_per_host_concurrency: int = ConfigField(
+    default=1,
+    title='Concurrent Crawls per Site',
+    ge=1,
+    le=8,
+    description='Maximum number of pages crawled at once from the same website.',
+    exposure='advanced',
+  )
+  crawl_per_host_delay_seconds: float = ConfigField(
+    default=1.0,
+    title='Delay Between Requests per Site',
+    ge=0.0,
+    le=30.0,
+    description='Minimum number of seconds between requests to the same website.',
+    exposure='advanced',
+  )
+  research_parallelism: int = ConfigField(
+    default_factory=lambda: min(3, max(1, (os.cpu_count() or 1) // 2)),
+    title='Parallel Research Stages',
+    ge=1,
+    le=3,
+    description=(
+      'Number of listing research stages (sentiment, salary and market) run at once. Crawls '
+      'still respect the concurrency limits above; lower this on machines with little memory.'
+    ),
+    exposure='advanced',
+  )
+  research_queue_concurrency: int = ConfigField(
+    default=1,
+    title='Queued Research Jobs at Once',
+    ge=1,
+    le=8,
+    description=(
+      'Number of listings researched at once when many are queued together. Listings from the '
+      'same company are always researched one after another so they can share results.'
+    ),
+    exposure='advanced',
+  )
+  research_sentiment_max_age_days: float = ConfigField(
+    default=30.0,
+    title='Reuse Company Sentiment (days)',
+    ge=0.0,
+    le=365.0,
+    description=(
+      'Reuse sentiment research for a company done within this many days, even for another '
+      'listing. Set to 0 to always research again.'
+    ),
+    exposure='advanced',
+  )
+  research_salary_max_age_days: float = ConfigField(
+    default=30.0,
+    title='Reuse Salary Research (days)',
+    ge=0.0,
+    le=365.0,
+    description=(
+      'Reuse salary research for the same company, title and location done within this many '
+      'days. Set to 0 to always research again.'
+    ),
+    exposure='advanced',
+  )
+  research_market_max_age_days: float = ConfigField(
+    default=7.0,
+    title='Reuse Market Research (days)',
+    ge=0.0,
+    le=365.0,
+    description=(
+      'Reuse market research for the same company and title done within this many days. News '
+      'moves quickly, so keep this short. Set to 0 to always research again.'
+    ),
+    exposure='advanced',
+  )
+  crawl_cache_ttl_hours: float = ConfigField(
+    default=24.0,
+    title='Crawl Cache Lifetime (hours)',
+    ge=0.0,
+    le=24.0 * 30,
+    description=(
+      'How long crawled pages are reused before being fetched again. Review and salary sites '
+      'are kept longer and news sites shorter. Set to 0 to turn the cache off.'
+    ),
+    exposure='advanced',
+  )
+  crawl_cache_max_mb: int = ConfigField(
+    default=100,
+    title='Crawl Cache Size (MB)',
+    ge=1,
+    le=10_000,
+    description='Maximum disk space used by cached pages. Least recently used pages are dropped.',
+    exposure='advanced',
+  )
 
 
 class ExperimentalPrefs(BaseModel):
@@ -336,6 +660,11 @@ class AppConfig(BaseModel):
     title='File Paths',
     description='File system paths configuration',
   )
+  database: DatabasePrefs = Field(
+    default_factory=DatabasePrefs,
+    title='Database',
+    description='SQLite storage settings. Changes apply after restarting Atto.',
+  )
   model: ModelPrefs = Field(
     default_factory=ModelPrefs,
     title='AI Models',
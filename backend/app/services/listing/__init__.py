@@ -1,5 +1,8 @@
+from .research_queue import ResearchQueue, research_queue
 from .service import ListingService
 
 __all__ = [
   'ListingService',
+  'ResearchQueue',
+  'research_queue',
 ]
@@ -0,0 +1,18 @@
+from .ashby import AshbyExtractor
+from .base import AtsExtractor, AtsPosting, slug_to_name
+from .greenhouse import GreenhouseExtractor
+from .lever import LeverExtractor
+from .registry import AtsExtractorRegistry, ats_extractors
+from .workday import WorkdayExtractor
+
+__all__ = [
+  'AshbyExtractor',
+  'AtsExtractor',
+  'AtsExtractorRegistry',
+  'AtsPosting',
+  'GreenhouseExtractor',
+  'LeverExtractor',
+  'WorkdayExtractor',
+  'ats_extractors',
+  'slug_to_name',
+]
@@ -0,0 +1,46 @@
+import re
+from datetime import datetime
+
+import httpx
+from pydantic import HttpUrl
+
+from .base import AtsExtractor, AtsPosting, html_to_text, slug_to_name
+
+API_BASE = 'https://api.ashbyhq.com/posting-api/job-board'
+POSTING_PATH = re.compile(r'^/(?P<organization>[\w.%-]+)/(?P<job_id>[0-9a-f-]{36})')
+
+
+class AshbyExtractor(AtsExtractor):
+  name = 'ashby'
+  hosts = ('jobs.ashbyhq.com',)
+
+  def __init__(self, api_base: str = API_BASE) -> None:
+    self.api_base = api_base
+
+  def parse_url(self, url: HttpUrl) -> dict[str, str] | None:
+    match = POSTING_PATH.match(url.path or '')
+    return match.groupdict() if match else None
+
+  async def fetch(
+    self, url: HttpUrl, ids: dict[str, str], client: httpx.AsyncClient
+  ) -> AtsPosting | None:
+    # The public API only lists whole boards, so the posting is picked out by id
+    response = await client.get(f'{self.api_base}/{ids["organization"]}')
+    if response.status_code == httpx.codes.NOT_FOUND:
+      return None
+    response.raise_for_status()
+
+    jobs = response.json().get('jobs', [])
+    job = next((job for job in jobs if job.get('id') == ids['job_id']), None)
+    if job is None:
+      return None
+
+    published = job.get('publishedAt')
+    return AtsPosting(
+      source=self.name,
+      title=job['title'],
+      company=slug_to_name(ids['organization']),
+      location=job.get('location'),
+      posted_date=datetime.fromisoformat(published).date() if published else None,
+      description=html_to_text(job.get('descriptionHtml') or job.get('descriptionPlain') or ''),
+    )
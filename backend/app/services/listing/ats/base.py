@@ -0,0 +1,92 @@
+import re
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Any
+
+import httpx
+from bs4 import BeautifulSoup
+from pydantic import BaseModel, HttpUrl
+
+from app.schemas.listing import Money
+from app.schemas.listing_draft import ListingExtraction
+
+# ATS descriptions are clean already; this only guards the LLM pass against very long postings
+MAX_DESCRIPTION_CHARS = 12_000
+SUMMARY_SENTENCES = 3
+
+
+class AtsPosting(BaseModel):
+  """A job posting read from an applicant tracking system's public API."""
+
+  source: str
+  title: str
+  company: str
+  location: str | None = None
+  posted_date: date | None = None
+  salary: Money | None = None
+  description: str
+
+  @property
+  def content(self) -> str:
+    """Compact plain-text version of the posting for the extraction prompt."""
+    header = [
+      f'Title: {self.title}',
+      f'Company: {self.company}',
+      f'Location: {self.location}' if self.location else None,
+      f'Posted: {self.posted_date.isoformat()}' if self.posted_date else None,
+    ]
+    return '\n'.join(line for line in header if line) + f'\n\n{self.description}'
+
+  def to_listing_extraction(self) -> ListingExtraction:
+    """Build a listing from the posting alone, for when the LLM pass is unavailable."""
+    sentences = re.split(r'(?<=[.!?])\s+', ' '.join(self.description.split()))
+    return ListingExtraction(
+      title=self.title,
+      company=self.company,
+      # None of the ATS APIs report the employer's website, and the posting URL is the ATS's own
+      domain='',
+      location=self.location,
+      posted_date=self.posted_date,
+      salary=self.salary,
+      description=' '.join(sentences[:SUMMARY_SENTENCES]),
+    )
+
+
+class AtsExtractor(ABC):
+  """
+  Reads postings for one applicant tracking system.
+
+  `hosts` are matched against the normalized URL host; entries starting with a dot match
+  any subdomain.
+  """
+
+  name: str
+  hosts: tuple[str, ...]
+
+  @abstractmethod
+  def parse_url(self, url: HttpUrl) -> dict[str, str] | None:
+    """Extract the identifiers needed to call the API, or None if this is not a posting."""
+
+  @abstractmethod
+  async def fetch(
+    self, url: HttpUrl, ids: dict[str, str], client: httpx.AsyncClient
+  ) -> AtsPosting | None:
+    """Fetch and map a posting, or None if the API does not know it."""
+
+
+def html_to_text(html: str) -> str:
+  text = BeautifulSoup(html, 'html.parser').get_text('\n')
+  lines = (' '.join(line.split()) for line in text.splitlines())
+  return '\n'.join(line for line in lines if line)[:MAX_DESCRIPTION_CHARS]
+
+
+def slug_to_name(slug: str) -> str:
+  return ' '.join(part.capitalize() for part in re.split(r'[-_]', slug) if part)
+
+
+def salary_midpoint(minimum: Any, maximum: Any, currency: Any) -> Money | None:
+  values = [value for value in (minimum, maximum) if isinstance(value, int | float) and value > 0]
+  if not values:
+    return None
+  code = currency if isinstance(currency, str) and re.fullmatch(r'[A-Z]{3}', currency) else 'USD'
+  return Money(value=round(sum(values) / len(values)), currency=code)
@@ -0,0 +1,43 @@
+import html
+import re
+from datetime import datetime
+
+import httpx
+from pydantic import HttpUrl
+
+from .base import AtsExtractor, AtsPosting, html_to_text, slug_to_name
+
+API_BASE = 'https://boards-api.greenhouse.io/v1/boards'
+POSTING_PATH = re.compile(r'^/(?P<board>[\w-]+)/jobs/(?P<job_id>\d+)')
+
+
+class GreenhouseExtractor(AtsExtractor):
+  name = 'greenhouse'
+  hosts = ('boards.greenhouse.io', 'job-boards.greenhouse.io', 'job-boards.eu.greenhouse.io')
+
+  def __init__(self, api_base: str = API_BASE) -> None:
+    self.api_base = api_base
+
+  def parse_url(self, url: HttpUrl) -> dict[str, str] | None:
+    match = POSTING_PATH.match(url.path or '')
+    return match.groupdict() if match else None
+
+  async def fetch(
+    self, url: HttpUrl, ids: dict[str, str], client: httpx.AsyncClient
+  ) -> AtsPosting | None:
+    response = await client.get(f'{self.api_base}/{ids["board"]}/jobs/{ids["job_id"]}')
+    if response.status_code == httpx.codes.NOT_FOUND:
+      return None
+    response.raise_for_status()
+    job = response.json()
+
+    published = job.get('first_published') or job.get('updated_at')
+    return AtsPosting(
+      source=self.name,
+      title=job['title'],
+      company=job.get('company_name') or slug_to_name(ids['board']),
+      location=(job.get('location') or {}).get('name'),
+      posted_date=datetime.fromisoformat(published).date() if published else None,
+      # The board API returns the description HTML entity-encoded
+      description=html_to_text(html.unescape(job.get('content') or '')),
+    )
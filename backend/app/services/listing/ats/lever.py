@@ -0,0 +1,52 @@
+import re
+from datetime import UTC, datetime
+
+import httpx
+from pydantic import HttpUrl
+
+from .base import AtsExtractor, AtsPosting, html_to_text, salary_midpoint, slug_to_name
+
+API_BASE = 'https://api.lever.co/v0/postings'
+POSTING_PATH = re.compile(r'^/(?P<company>[\w.-]+)/(?P<posting_id>[0-9a-f-]{36})')
+
+
+class LeverExtractor(AtsExtractor):
+  name = 'lever'
+  hosts = ('jobs.lever.co', 'jobs.eu.lever.co')
+
+  def __init__(self, api_base: str = API_BASE) -> None:
+    self.api_base = api_base
+
+  def parse_url(self, url: HttpUrl) -> dict[str, str] | None:
+    match = POSTING_PATH.match(url.path or '')
+    return match.groupdict() if match else None
+
+  async def fetch(
+    self, url: HttpUrl, ids: dict[str, str], client: httpx.AsyncClient
+  ) -> AtsPosting | None:
+    response = await client.get(f'{self.api_base}/{ids["company"]}/{ids["posting_id"]}')
+    if response.status_code == httpx.codes.NOT_FOUND:
+      return None
+    response.raise_for_status()
+    posting = response.json()
+
+    # Requirements and responsibilities live in separate HTML lists
+    sections = [posting.get('descriptionPlain') or '']
+    for section in posting.get('lists') or []:
+      sections.append(f'{section.get("text", "")}\n{html_to_text(section.get("content", ""))}')
+    sections.append(posting.get('additionalPlain') or '')
+
+    created_at = posting.get('createdAt')
+    salary_range = posting.get('salaryRange') or {}
+    return AtsPosting(
+      source=self.name,
+      title=posting['text'],
+      # Lever postings do not carry the company's display name
+      company=slug_to_name(ids['company']),
+      location=(posting.get('categories') or {}).get('location'),
+      posted_date=datetime.fromtimestamp(created_at / 1000, UTC).date() if created_at else None,
+      salary=salary_midpoint(
+        salary_range.get('min'), salary_range.get('max'), salary_range.get('currency')
+      ),
+      description=html_to_text('\n\n'.join(section for section in sections if section.strip())),
+    )
@@ -0,0 +1,63 @@
+import logging
+
+from pydantic import HttpUrl
+
+from app.managers import page_fetcher
+
+from .ashby import AshbyExtractor
+from .base import AtsExtractor, AtsPosting
+from .greenhouse import GreenhouseExtractor
+from .lever import LeverExtractor
+from .workday import WorkdayExtractor
+
+logger = logging.getLogger(__name__)
+
+
+class AtsExtractorRegistry:
+  """Routes posting URLs to the extractor for their applicant tracking system by host."""
+
+  def __init__(self, extractors: list[AtsExtractor] | None = None) -> None:
+    self._exact_hosts: dict[str, AtsExtractor] = {}
+    self._host_suffixes: list[tuple[str, AtsExtractor]] = []
+    for extractor in extractors or []:
+      self.register(extractor)
+
+  def register(self, extractor: AtsExtractor) -> None:
+    for host in extractor.hosts:
+      if host.startswith('.'):
+        self._host_suffixes.append((host, extractor))
+      else:
+        self._exact_hosts[host] = extractor
+
+  def find(self, url: HttpUrl) -> AtsExtractor | None:
+    host = (url.host or '').lower()
+    if extractor := self._exact_hosts.get(host):
+      return extractor
+    return next(
+      (extractor for suffix, extractor in self._host_suffixes if host.endswith(suffix)), None
+    )
+
+  async def extract(self, url: HttpUrl) -> AtsPosting | None:
+    """
+    Read a posting from its ATS API.
+
+    Returns:
+      The posting, or None if the URL is not a known ATS posting or the API call failed, in
+      which case the caller should crawl the page instead.
+    """
+    extractor = self.find(url)
+    ids = extractor.parse_url(url) if extractor else None
+    if extractor is None or ids is None:
+      return None
+
+    try:
+      return await extractor.fetch(url, ids, page_fetcher.client)
+    except Exception:
+      # Third-party APIs change shape without notice; any failure falls back to crawling the page
+      logger.warning('Could not read %s posting %s', extractor.name, url, exc_info=True)
+      return None
+
+
+ats_extractors = AtsExtractorRegistry(
+  [GreenhouseExtractor(), LeverExtractor(), AshbyExtractor(), WorkdayExtractor()]
+)
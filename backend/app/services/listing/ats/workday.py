@@ -0,0 +1,49 @@
+import re
+from datetime import date
+
+import httpx
+from pydantic import HttpUrl
+
+from .base import AtsExtractor, AtsPosting, html_to_text, slug_to_name
+
+# e.g. /en-US/External/job/Singapore/Backend-Engineer_R12345
+POSTING_PATH = re.compile(r'^/(?:[a-z]{2}-[A-Z]{2}/)?(?P<site>[\w-]+)/job/(?P<job_path>.+_[\w-]+)$')
+
+
+class WorkdayExtractor(AtsExtractor):
+  name = 'workday'
+  hosts = ('.myworkdayjobs.com',)
+
+  def __init__(self, api_base: str | None = None) -> None:
+    # Each tenant serves its API from its own host, so there is no fixed base by default
+    self.api_base = api_base
+
+  def parse_url(self, url: HttpUrl) -> dict[str, str] | None:
+    match = POSTING_PATH.match(url.path or '')
+    if not match or not url.host:
+      return None
+    return {'tenant': url.host.split('.')[0], **match.groupdict()}
+
+  async def fetch(
+    self, url: HttpUrl, ids: dict[str, str], client: httpx.AsyncClient
+  ) -> AtsPosting | None:
+    api_base = self.api_base or f'https://{url.host}'
+    response = await client.get(
+      f'{api_base}/wday/cxs/{ids["tenant"]}/{ids["site"]}/job/{ids["job_path"]}',
+      headers={'Accept': 'application/json'},
+    )
+    if response.status_code == httpx.codes.NOT_FOUND:
+      return None
+    response.raise_for_status()
+    payload = response.json()
+
+    info = payload.get('jobPostingInfo') or {}
+    start_date = info.get('startDate')
+    return AtsPosting(
+      source=self.name,
+      title=info['title'],
+      company=(payload.get('hiringOrganization') or {}).get('name') or slug_to_name(ids['tenant']),
+      location=info.get('location'),
+      posted_date=date.fromisoformat(start_date) if start_date else None,
+      description=html_to_text(info.get('jobDescription') or ''),
+    )
@@ -6,6 +6,7 @@ from pydantic import HttpUrl
 from app.schemas.listing import Keyword, Listing
 from app.schemas.listing_draft import ListingExtraction
 
+from .ats import AtsPosting
 from .schemas import ExtractionResponse
 
 
@@ -15,6 +16,18 @@ def build_listing_extraction(extraction: ExtractionResponse, content: str) -> Li
   return listing
 
 
+def merge_ats_posting(listing: ListingExtraction, posting: AtsPosting) -> ListingExtraction:
+  """Prefer the ATS's own title and posting date, and fill gaps the LLM left."""
+  return listing.model_copy(
+    update={
+      'title': posting.title,
+      'posted_date': posting.posted_date or listing.posted_date,
+      'location': listing.location or posting.location,
+      'salary': listing.salary or posting.salary,
+    }
+  )
+
+
 def build_duplicate_candidate(listing: ListingExtraction, id: UUID, url: HttpUrl) -> Listing:
   return Listing(
     **listing.model_dump(exclude={'skills', 'requirements'}),
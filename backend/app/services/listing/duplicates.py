@@ -1,3 +1,4 @@
+from app.managers import run_in_db_thread
 from app.repositories.listing_repository import ListingRepository
 from app.schemas.listing import Listing
 
@@ -16,7 +17,9 @@ async def find_similar_listing(
       best_match = match
       best_score = score
 
-  heuristic_matches = listing_repository.find_heuristic_duplicate_candidates(new_listing)
+  heuristic_matches = await run_in_db_thread(
+    listing_repository.find_heuristic_duplicate_candidates, new_listing
+  )
   if heuristic_matches:
     match, score = heuristic_matches[0]
     if score > best_score:
@@ -0,0 +1,17 @@
+from app.schemas.listing import Listing
+from app.utils.text import normalize_company_name, normalize_words
+
+
+def research_cache_key(stage: str, listing: Listing) -> str:
+  """
+  Key a research stage by the listing fields its searches depend on.
+
+  Sentiment only searches for the company. Market news is searched by company and by title,
+  and salary by company, title and location.
+  """
+  parts = [normalize_company_name(listing.company)]
+  if stage in ('salary', 'market'):
+    parts.append(' '.join(normalize_words(listing.title)))
+  if stage == 'salary':
+    parts.append(' '.join(normalize_words(listing.location)))
+  return '|'.join(parts)
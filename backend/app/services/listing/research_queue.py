@@ -0,0 +1,146 @@
+import asyncio
+import logging
+from collections.abc import Callable
+
+from app.clients.cloud_api_client import CloudApiClient
+from app.clients.listing_research import get_listing_research_client
+from app.clients.model import get_model_client
+from app.clients.scraping import get_scraping_client
+from app.managers import run_in_db_thread
+from app.repositories import (
+  ApplicationRepository,
+  ListingRepository,
+  ResearchCacheRepository,
+  ResearchJobRepository,
+  ScreenshotRepository,
+)
+from app.schemas.research_queue import ResearchJob
+from app.schemas.task_status import TaskStatus
+from app.services.config.schemas import AppConfig
+from app.utils.auth_context import use_session_token
+from app.utils.errors import GENERIC_ERROR_MESSAGE, user_facing_error_message
+
+from .service import ListingService
+
+logger = logging.getLogger(__name__)
+
+
+def build_listing_service(settings: AppConfig) -> ListingService:
+  """
+  Wire up a ListingService outside of a request.
+
+  Call inside `use_session_token` so the model and research clients pick cloud or local mode.
+  """
+  cloud_api_client = CloudApiClient(settings)
+  model_client = get_model_client(cloud_api_client, settings)
+  scraping_client = get_scraping_client(settings)
+  return ListingService(
+    listing_repository=ListingRepository(model_client, settings),
+    application_repository=ApplicationRepository(settings),
+    listing_research_client=get_listing_research_client(
+      model_client, scraping_client, cloud_api_client
+    ),
+    llm_client=model_client,
+    scraping_client=scraping_client,
+    screenshot_repository=ScreenshotRepository(settings),
+    research_cache_repository=ResearchCacheRepository(settings),
+    settings=settings,
+  )
+
+
+class ResearchQueue:
+  """
+  Researches queued listings in the background, a few at a time.
+
+  Jobs live in the `research_jobs` table, and workers only run while there is work to claim.
+  Their crawls and model calls go through the same process-wide crawl scheduler, browser pool
+  and model connection pool as research started one listing at a time.
+  """
+
+  def __init__(
+    self, build_service: Callable[[AppConfig], ListingService] = build_listing_service
+  ) -> None:
+    self._build_service = build_service
+    self._workers: set[asyncio.Task[None]] = set()
+    # Kept in memory only, so jobs resumed after a restart run without the user's session
+    self._session_tokens: dict[str, str] = {}
+    # Bumped on every wake, so a worker that found the queue empty can tell whether a batch was
+    # queued while it was claiming
+    self._wakes = 0
+
+  @property
+  def active_workers(self) -> int:
+    return len(self._workers)
+
+  def wake(
+    self, settings: AppConfig, batch_id: str | None = None, session_token: str | None = None
+  ) -> None:
+    """Start workers up to the configured concurrency to drain the queue."""
+    if batch_id is not None and session_token:
+      self._session_tokens[batch_id] = session_token
+
+    self._wakes += 1
+    while len(self._workers) < settings.ingestion.research_queue_concurrency:
+      worker = asyncio.create_task(self._work(settings))
+      self._workers.add(worker)
+      worker.add_done_callback(self._workers.discard)
+
+  async def resume(self, settings: AppConfig) -> None:
+    """Requeue jobs interrupted by the last shutdown and start working through the queue."""
+    repository = ResearchJobRepository(settings)
+    interrupted = await run_in_db_thread(repository.requeue_interrupted)
+    if interrupted:
+      logger.info('Resuming %s interrupted research jobs', interrupted)
+    if await run_in_db_thread(repository.has_pending):
+      self.wake(settings)
+
+  async def join(self) -> None:
+    """Wait until every worker has run out of jobs."""
+    while self._workers:
+      await asyncio.gather(*self._workers, return_exceptions=True)
+
+  async def close(self) -> None:
+    # Running jobs stay marked as running and are requeued by the next resume()
+    workers = list(self._workers)
+    for worker in workers:
+      worker.cancel()
+    await asyncio.gather(*workers, return_exceptions=True)
+
+  async def _work(self, settings: AppConfig) -> None:
+    repository = ResearchJobRepository(settings)
+    while True:
+      wakes = self._wakes
+      job = await run_in_db_thread(repository.claim_next)
+      if job is None:
+        if self._wakes != wakes:
+          continue
+        # Leave the pool before returning, so the next wake starts a worker instead of counting
+        # this one, which only drops out once its done callback runs
+        self._workers.discard(asyncio.current_task())  # type: ignore[arg-type]
+        return
+      status, error = await self._run(job, settings)
+      await run_in_db_thread(repository.finish, job.listing_id, status, error)
+
+      progress = await run_in_db_thread(repository.get_progress, job.batch_id)
+      if not progress.pending and not progress.running:
+        self._session_tokens.pop(job.batch_id, None)
+
+  async def _run(self, job: ResearchJob, settings: AppConfig) -> tuple[TaskStatus, str | None]:
+    session_token = self._session_tokens.get(job.batch_id)
+    try:
+      with use_session_token(session_token):
+        service = self._build_service(settings)
+        await service.generate_research_task(job.listing_id, session_token)
+        entry = await run_in_db_thread(
+          service.listing_repository.get_research_status, job.listing_id
+        )
+    except Exception as e:
+      logger.exception('Queued research failed for listing %s', job.listing_id)
+      return TaskStatus.FAILED, user_facing_error_message(e)
+
+    if entry is None:
+      return TaskStatus.FAILED, GENERIC_ERROR_MESSAGE
+    return entry.status, entry.error
+
+
+research_queue = ResearchQueue()
@@ -1,16 +1,29 @@
+import asyncio
 import logging
 from datetime import UTC, date, datetime
-from typing import Annotated
+from typing import Annotated, Literal, get_args
 from uuid import UUID
 
 from fastapi import Depends
-from pydantic import HttpUrl
+from pydantic import HttpUrl, ValidationError
 
 from app.clients.listing_research import ListingResearchClient, get_listing_research_client
 from app.clients.model import ModelClient, get_model_client
 from app.clients.scraping import ScrapingClient, get_scraping_client
-from app.repositories import ApplicationRepository, ListingRepository
-from app.schemas.listing import ListingResearch
+from app.managers import run_in_db_thread
+from app.repositories import (
+  ApplicationRepository,
+  ListingRepository,
+  ResearchCacheRepository,
+  ScreenshotRepository,
+)
+from app.schemas.listing import (
+  Listing,
+  ListingResearch,
+  MarketContextResult,
+  SalaryRangeResult,
+  SentimentAnalysisResult,
+)
 from app.schemas.listing_draft import (
   ListingDraft,
   ListingDraftDuplicateContent,
@@ -19,17 +32,31 @@ from app.schemas.listing_draft import (
   ListingDraftUnique,
 )
 from app.schemas.task_status import TaskStatus
+from app.services.config import get_settings
+from app.services.config.schemas import AppConfig
 from app.utils.auth_context import use_session_token
 from app.utils.errors import ServiceError, user_facing_error_message
 from app.utils.url import normalize_url
 
-from .drafts import build_duplicate_candidate, build_listing_extraction
+from .ats import ats_extractors
+from .drafts import build_duplicate_candidate, build_listing_extraction, merge_ats_posting
 from .duplicates import find_similar_listing
 from .prompts import LISTING_EXTRACTION_PROMPT
+from .research_keys import research_cache_key
 from .schemas import ExtractionResponse
 
 logger = logging.getLogger(__name__)
 
+ResearchStage = Literal['sentiment', 'salary', 'market']
+RESEARCH_STAGES: tuple[ResearchStage, ...] = get_args(ResearchStage)
+RESEARCH_STAGE_MODELS: dict[
+  ResearchStage, type[SentimentAnalysisResult | SalaryRangeResult | MarketContextResult]
+] = {
+  'sentiment': SentimentAnalysisResult,
+  'salary': SalaryRangeResult,
+  'market': MarketContextResult,
+}
+
 LISTING_EXTRACTION_ERROR_MESSAGE = (
   'Atto could not find a complete job listing there. Paste the job description manually.'
 )
@@ -43,12 +70,29 @@ class ListingService:
     listing_research_client: Annotated[ListingResearchClient, Depends(get_listing_research_client)],
     llm_client: Annotated[ModelClient, Depends(get_model_client)],
     scraping_client: Annotated[ScrapingClient, Depends(get_scraping_client)],
+    screenshot_repository: Annotated[ScreenshotRepository, Depends()],
+    research_cache_repository: Annotated[ResearchCacheRepository, Depends()],
+    settings: Annotated[AppConfig, Depends(get_settings)],
   ) -> None:
     self.listing_repository = listing_repository
     self.application_repository = application_repository
     self.listing_research_client = listing_research_client
     self.llm_client = llm_client
     self.scraping_client = scraping_client
+    self.screenshot_repository = screenshot_repository
+    self.research_cache_repository = research_cache_repository
+    self.settings = settings
+
+  async def _save_screenshot(self, screenshot: str | None) -> str | None:
+    if screenshot is None:
+      return None
+
+    try:
+      return await asyncio.to_thread(self.screenshot_repository.save, screenshot)
+    except Exception:
+      # A missing screenshot should never cost the user their draft
+      logger.warning('Could not store listing screenshot', exc_info=True)
+      return None
 
   async def generate_listing_draft(
     self,
@@ -57,20 +101,26 @@ class ListingService:
     content: str | None = None,
   ) -> ListingDraft:
     url = normalize_url(url)
-    screenshot = None
+    screenshot_id = None
 
-    if existing_listing := self.listing_repository.get_by_url(url):
+    if existing_listing := await run_in_db_thread(self.listing_repository.get_by_url, url):
       return ListingDraftDuplicateUrl(
         id=id,
         url=url,
         duplicate_of=existing_listing,
       )
 
+    # Postings on known applicant tracking systems are read from their JSON APIs, which is much
+    # faster than rendering the page and gives a short, clean description to extract from
+    ats_posting = await ats_extractors.extract(url) if content is None else None
+    if ats_posting is not None:
+      content = ats_posting.content
+
     if content is None:
       try:
-        crawl_result = await self.scraping_client.crawl(url)
+        crawl_result = await self.scraping_client.crawl(url, screenshot=True)
         content = crawl_result.content
-        screenshot = crawl_result.screenshot
+        screenshot_id = await self._save_screenshot(crawl_result.screenshot)
       except Exception as e:
         return ListingDraftError(
           id=id,
@@ -91,14 +141,21 @@ class ListingService:
         raise ServiceError(LISTING_EXTRACTION_ERROR_MESSAGE)
 
       listing = build_listing_extraction(extraction, content)
+      if ats_posting is not None:
+        listing = merge_ats_posting(listing, ats_posting)
 
     except Exception:
-      return ListingDraftError(
-        id=id,
-        url=url,
-        error=LISTING_EXTRACTION_ERROR_MESSAGE,
-        screenshot=screenshot,
-      )
+      if ats_posting is not None:
+        # The posting is already structured, so it still makes a usable draft
+        logger.warning('Falling back to the %s posting for %s', ats_posting.source, url)
+        listing = ats_posting.to_listing_extraction()
+      else:
+        return ListingDraftError(
+          id=id,
+          url=url,
+          error=LISTING_EXTRACTION_ERROR_MESSAGE,
+          screenshot_id=screenshot_id,
+        )
 
     # TODO: If salary is null after extraction, look it up via external sources.
     # - Cloud mode: call a salary API (e.g. Levels.fyi, Glassdoor API) using company + title.
@@ -113,16 +170,152 @@ class ListingService:
         url=url,
         listing=listing,
         duplicate_of=similar_match,
-        screenshot=screenshot,
+        screenshot_id=screenshot_id,
       )
 
     return ListingDraftUnique(
       id=id,
       url=url,
       listing=listing,
-      screenshot=screenshot,
+      screenshot_id=screenshot_id,
     )
 
+  async def _run_research_stages(
+    self,
+    listing_id: UUID,
+    listing: Listing,
+  ) -> tuple[SentimentAnalysisResult, SalaryRangeResult, MarketContextResult]:
+    # The stages are independent; crawls across all of them still go through the shared crawl
+    # scheduler and browser pool, so the parallelism budget only bounds how many run at once
+    slots = asyncio.Semaphore(self.settings.ingestion.research_parallelism)
+    for stage in RESEARCH_STAGES:
+      await run_in_db_thread(
+        self.listing_repository.set_research_stage_status, listing_id, stage, TaskStatus.PENDING
+      )
+
+    tasks: dict[ResearchStage, asyncio.Task] = {
+      'sentiment': asyncio.create_task(
+        self._run_research_stage(listing_id, 'sentiment', slots, listing)
+      ),
+      'salary': asyncio.create_task(self._run_research_stage(listing_id, 'salary', slots, listing)),
+      'market': asyncio.create_task(self._run_research_stage(listing_id, 'market', slots, listing)),
+    }
+    try:
+      sentiment, salary, market = await asyncio.gather(*tasks.values())
+    except BaseException:
+      # One failed stage fails the research, so stop crawling for the others
+      for task in tasks.values():
+        task.cancel()
+      await asyncio.gather(*tasks.values(), return_exceptions=True)
+      # Cancelled stages never reach their own failure handling, so settle their status here
+      for stage, task in tasks.items():
+        if task.cancelled():
+          await run_in_db_thread(
+            self.listing_repository.set_research_stage_status, listing_id, stage, TaskStatus.FAILED
+          )
+      raise
+    return sentiment, salary, market
+
+  async def _run_research_stage(
+    self,
+    listing_id: UUID,
+    stage: ResearchStage,
+    slots: asyncio.Semaphore,
+    listing: Listing,
+  ) -> SentimentAnalysisResult | SalaryRangeResult | MarketContextResult:
+    run_stage = {
+      'sentiment': self.listing_research_client.get_sentiment_analysis,
+      'salary': self.listing_research_client.get_salary_range,
+      'market': self.listing_research_client.get_market_context,
+    }[stage]
+
+    cached = await self._get_cached_research(stage, listing)
+    if cached is not None:
+      await run_in_db_thread(
+        self.listing_repository.set_research_stage_status,
+        listing_id,
+        stage,
+        TaskStatus.SUCCEEDED,
+        cached,
+      )
+      return cached
+
+    async with slots:
+      await run_in_db_thread(
+        self.listing_repository.set_research_stage_status, listing_id, stage, TaskStatus.RUNNING
+      )
+      try:
+        result = await run_stage(listing)
+      except Exception:
+        await run_in_db_thread(
+          self.listing_repository.set_research_stage_status,
+          listing_id,
+          stage,
+          TaskStatus.FAILED,
+        )
+        raise
+
+    await run_in_db_thread(
+      self.listing_repository.set_research_stage_status,
+      listing_id,
+      stage,
+      TaskStatus.SUCCEEDED,
+      result,
+    )
+    await self._cache_research(stage, listing, result)
+    return result
+
+  def _research_max_age_seconds(self, stage: ResearchStage) -> float:
+    ingestion = self.settings.ingestion
+    days = {
+      'sentiment': ingestion.research_sentiment_max_age_days,
+      'salary': ingestion.research_salary_max_age_days,
+      'market': ingestion.research_market_max_age_days,
+    }[stage]
+    return days * 24 * 3600
+
+  async def _get_cached_research(
+    self, stage: ResearchStage, listing: Listing
+  ) -> SentimentAnalysisResult | SalaryRangeResult | MarketContextResult | None:
+    max_age_seconds = self._research_max_age_seconds(stage)
+    if max_age_seconds <= 0:
+      return None
+
+    try:
+      payload = await run_in_db_thread(
+        self.research_cache_repository.get,
+        stage,
+        research_cache_key(stage, listing),
+        max_age_seconds,
+      )
+    except ServiceError:
+      logger.warning('Could not read cached %s research', stage, exc_info=True)
+      return None
+    if payload is None:
+      return None
+    try:
+      return RESEARCH_STAGE_MODELS[stage].model_validate_json(payload)
+    except ValidationError:
+      # Stored before the result schema changed, so research it again
+      logger.warning('Discarding cached %s research that no longer validates', stage)
+      return None
+
+  async def _cache_research(
+    self,
+    stage: ResearchStage,
+    listing: Listing,
+    result: SentimentAnalysisResult | SalaryRangeResult | MarketContextResult,
+  ) -> None:
+    try:
+      await run_in_db_thread(
+        self.research_cache_repository.put,
+        stage,
+        research_cache_key(stage, listing),
+        result.model_dump_json(by_alias=True),
+      )
+    except ServiceError:
+      logger.warning('Could not cache %s research', stage, exc_info=True)
+
   # Must manually plumb the Clerk session cookie because this is a background task
   async def generate_research_task(
     self,
@@ -130,16 +323,14 @@ class ListingService:
     session_token: str | None = None,
   ) -> None:
     with use_session_token(session_token):
-      self.listing_repository.set_research_status(listing_id, TaskStatus.RUNNING)
+      await run_in_db_thread(
+        self.listing_repository.set_research_status, listing_id, TaskStatus.RUNNING
+      )
 
       try:
-        listing = self.listing_repository.get(listing_id)
+        listing = await run_in_db_thread(self.listing_repository.get, listing_id)
 
-        # Perform sequentially since crawling is very resource intensive
-        # TODO: Allow user to crawl in parallel, adding a setting for users with powerful machines
-        sentiment = await self.listing_research_client.get_sentiment_analysis(listing)
-        salary = await self.listing_research_client.get_salary_range(listing)
-        market = await self.listing_research_client.get_market_context(listing)
+        sentiment, salary, market = await self._run_research_stages(listing_id, listing)
 
         insights_result = await self.listing_research_client.get_applicant_insights(
           listing=listing,
@@ -155,13 +346,17 @@ class ListingService:
           generated_at=datetime.now(UTC),
         )
 
-        self.listing_repository.update_research(
+        await run_in_db_thread(
+          self.listing_repository.update_research,
           listing_id,
           research.model_dump_json(by_alias=True),
         )
-        self.listing_repository.set_research_status(listing_id, TaskStatus.SUCCEEDED)
+        await run_in_db_thread(
+          self.listing_repository.set_research_status, listing_id, TaskStatus.SUCCEEDED
+        )
       except Exception as e:
-        self.listing_repository.set_research_status(
+        await run_in_db_thread(
+          self.listing_repository.set_research_status,
           listing_id,
           TaskStatus.FAILED,
           user_facing_error_message(e),
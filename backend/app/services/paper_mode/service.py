@@ -7,6 +7,7 @@ from typing import Annotated
 from fastapi import Depends
 
 from app.db_init import create_tables
+from app.managers import connection_pools
 from app.repositories import (
   ApplicationRepository,
   ListingRepository,
@@ -56,7 +57,7 @@ class PaperModeService:
       )
       date_shift = date.today() - paper_fixture.anchor_date
 
-      create_tables(settings.paths.db_path)
+      create_tables(settings.paths.db_path, settings.database)
       with self.application_repository.transaction():
         for resume in paper_fixture.resumes:
           self.resume_repository.seed(resume)
@@ -102,6 +103,8 @@ class PaperModeService:
 
   def _delete_paper_workspace(self) -> None:
     paper_dir = self.config_service.data_dir / PAPER_DIRNAME
+    # Pooled connections would otherwise keep pointing at the deleted database file
+    connection_pools.close_pool(str(paper_dir / 'db.sqlite3'))
     if paper_dir.exists():
       shutil.rmtree(paper_dir)
 
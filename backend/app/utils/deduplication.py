@@ -1,7 +1,7 @@
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Sequence
 from typing import TypeVar
 
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
 T = TypeVar('T')
 K = TypeVar('K')
@@ -25,25 +25,30 @@ def fuzzy_text_similarity(text1: str, text2: str) -> float:
   return fuzz.ratio(_normalize_text(text1), _normalize_text(text2)) / 100
 
 
-def cosine_similarity(vec1: list[float], vec2: list[float]) -> float:
+def fuzzy_text_similarities(text: str, candidates: Sequence[str]) -> list[float]:
   """
-  Calculate cosine similarity between two vectors.
+  Score one text string against many candidates in a single vectorized pass.
+
+  Equivalent to calling fuzzy_text_similarity for each candidate, but the comparisons run in
+  native code across all cores.
 
   Args:
-    vec1: First vector
-    vec2: Second vector
+    text: Text to compare
+    candidates: Texts to compare against
 
   Returns:
-    Similarity score between -1.0 and 1.0 (1.0 = identical direction)
+    Similarity scores between 0.0 and 1.0, in candidate order
   """
-  dot_product = sum(a * b for a, b in zip(vec1, vec2, strict=True))
-  magnitude1 = sum(a * a for a in vec1) ** 0.5
-  magnitude2 = sum(b * b for b in vec2) ** 0.5
-
-  if magnitude1 == 0 or magnitude2 == 0:
-    return 0.0
-
-  return dot_product / (magnitude1 * magnitude2)
+  if not candidates:
+    return []
+
+  scores = process.cdist(
+    [_normalize_text(text)],
+    [_normalize_text(candidate) for candidate in candidates],
+    scorer=fuzz.ratio,
+    workers=-1,
+  )
+  return (scores[0] / 100).tolist()
 
 
 def deduplicate_by(items: Iterable[T], key_selector: Callable[[T], K]) -> list[T]:
@@ -0,0 +1,41 @@
+import base64
+import io
+from typing import Literal
+
+from PIL import Image
+
+ImageFormat = Literal['webp', 'jpeg']
+
+IMAGE_MEDIA_TYPES = {'webp': 'image/webp', 'jpeg': 'image/jpeg', 'png': 'image/png'}
+
+
+def compress_image(data: bytes, image_format: ImageFormat, quality: int, max_width: int) -> bytes:
+  """Downscale an image to at most `max_width` pixels wide and re-encode it lossily."""
+  with Image.open(io.BytesIO(data)) as image:
+    # Neither target format needs an alpha channel for page screenshots
+    converted = image.convert('RGB')
+
+  if converted.width > max_width:
+    height = round(converted.height * max_width / converted.width)
+    converted = converted.resize((max_width, height), Image.Resampling.LANCZOS)
+
+  output = io.BytesIO()
+  converted.save(output, format=image_format.upper(), quality=quality, optimize=True)
+  return output.getvalue()
+
+
+def compress_base64_image(
+  data: str, image_format: ImageFormat, quality: int, max_width: int
+) -> str:
+  compressed = compress_image(base64.b64decode(data), image_format, quality, max_width)
+  return base64.b64encode(compressed).decode('ascii')
+
+
+def detect_image_format(data: bytes) -> str | None:
+  if data.startswith(b'RIFF') and data[8:12] == b'WEBP':
+    return 'webp'
+  if data.startswith(b'\xff\xd8\xff'):
+    return 'jpeg'
+  if data.startswith(b'\x89PNG\r\n\x1a\n'):
+    return 'png'
+  return None
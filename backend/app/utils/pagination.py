@@ -0,0 +1,41 @@
+import base64
+import binascii
+import json
+from typing import Any
+
+from app.utils.errors import ValidationError
+
+INVALID_CURSOR_MESSAGE = 'This page of results has expired. Reload the list and try again.'
+
+
+def encode_cursor(payload: dict[str, Any]) -> str:
+  """
+  Encode keyset pagination state into an opaque, URL-safe continuation token.
+
+  Args:
+    payload: JSON-serializable position of the last row returned.
+
+  Returns:
+    Continuation token.
+  """
+  raw = json.dumps(payload, separators=(',', ':'), sort_keys=True).encode('utf-8')
+  return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token: str) -> dict[str, Any]:
+  """
+  Decode a continuation token created by encode_cursor.
+
+  Raises:
+    ValidationError: If the token is malformed.
+  """
+  padded = token + '=' * (-len(token) % 4)
+  try:
+    payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+  except (binascii.Error, UnicodeError, ValueError) as e:
+    raise ValidationError(INVALID_CURSOR_MESSAGE) from e
+
+  if not isinstance(payload, dict):
+    raise ValidationError(INVALID_CURSOR_MESSAGE)
+
+  return payload
@@ -0,0 +1,120 @@
+from collections.abc import Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+SIMILARITY_DTYPE = np.float32
+
+EmbeddingMatrix = npt.NDArray[np.float32]
+
+
+def normalize_rows(embeddings: Sequence[Sequence[float]] | EmbeddingMatrix) -> EmbeddingMatrix:
+  """
+  Stack embeddings into a float32 matrix with unit-length rows.
+
+  Zero vectors stay zero, so they score 0.0 against everything instead of producing NaNs.
+
+  Args:
+    embeddings: Embedding vectors of equal length
+
+  Returns:
+    Matrix of shape (len(embeddings), dims)
+  """
+  if not len(embeddings):
+    return np.zeros((0, 0), dtype=SIMILARITY_DTYPE)
+
+  matrix = np.array(embeddings, dtype=SIMILARITY_DTYPE, ndmin=2)
+  norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+  np.divide(matrix, norms, out=matrix, where=norms > 0)
+  return matrix
+
+
+def cosine_similarity(vec1: Sequence[float], vec2: Sequence[float]) -> float:
+  """
+  Calculate cosine similarity between two vectors.
+
+  Args:
+    vec1: First vector
+    vec2: Second vector
+
+  Returns:
+    Similarity score between -1.0 and 1.0 (1.0 = identical direction)
+  """
+  if len(vec1) != len(vec2):
+    raise ValueError('Vectors must have the same length')
+  pair = normalize_rows([vec1, vec2])
+  return float(pair[0] @ pair[1])
+
+
+def similarity_matrix(
+  queries: Sequence[Sequence[float]] | EmbeddingMatrix,
+  candidates: Sequence[Sequence[float]] | EmbeddingMatrix,
+) -> EmbeddingMatrix:
+  """
+  Cosine similarity of every query against every candidate in one matrix multiply.
+
+  Args:
+    queries: Query embeddings
+    candidates: Candidate embeddings, with the same dimensionality as the queries
+
+  Returns:
+    Matrix of shape (len(queries), len(candidates))
+  """
+  query_matrix = normalize_rows(queries)
+  candidate_matrix = normalize_rows(candidates)
+  if not len(query_matrix) or not len(candidate_matrix):
+    return np.zeros((len(query_matrix), len(candidate_matrix)), dtype=SIMILARITY_DTYPE)
+  return query_matrix @ candidate_matrix.T
+
+
+def max_similarities(
+  queries: Sequence[Sequence[float]] | EmbeddingMatrix,
+  candidates: Sequence[Sequence[float]] | EmbeddingMatrix,
+) -> list[float]:
+  """
+  Best cosine similarity of each query across all candidates.
+
+  Args:
+    queries: Query embeddings
+    candidates: Candidate embeddings
+
+  Returns:
+    One score per query, in query order; 0.0 for every query when there are no candidates
+  """
+  scores = similarity_matrix(queries, candidates)
+  if not scores.shape[1]:
+    return [0.0] * scores.shape[0]
+  return scores.max(axis=1).tolist()
+
+
+def top_k_similar(
+  query: Sequence[float],
+  candidates: Sequence[Sequence[float]] | EmbeddingMatrix,
+  k: int,
+  threshold: float | None = None,
+) -> list[tuple[int, float]]:
+  """
+  Find the candidates most similar to a query.
+
+  Args:
+    query: Query embedding
+    candidates: Candidate embeddings
+    k: Maximum number of matches to return
+    threshold: Drop matches scoring below this similarity
+
+  Returns:
+    (candidate_index, similarity) tuples, most similar first
+  """
+  scores = similarity_matrix([query], candidates)[0]
+  k = min(k, len(scores))
+  if k <= 0:
+    return []
+
+  # argpartition finds the top k in linear time; only those k are sorted
+  top = np.argpartition(-scores, k - 1)[:k]
+  top = top[np.argsort(-scores[top], kind='stable')]
+  return [
+    (int(index), float(scores[index]))
+    for index in top
+    if threshold is None or scores[index] >= threshold
+  ]
@@ -0,0 +1,48 @@
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+
+from app.managers import task_events
+from app.schemas.task_status import TaskStatus, TaskStatusEntry
+
+# Comment lines keep proxies and browsers from closing an idle stream
+KEEPALIVE_SECONDS = 15.0
+SSE_HEADERS = {'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+FINISHED_STATUSES = (TaskStatus.SUCCEEDED, TaskStatus.FAILED)
+
+
+def format_event(data: str, event: str | None = None) -> str:
+  lines = [f'event: {event}'] if event else []
+  lines.extend(f'data: {line}' for line in data.splitlines() or [''])
+  return '\n'.join(lines) + '\n\n'
+
+
+def _is_finished(entry: TaskStatusEntry | None) -> bool:
+  return entry is None or entry.status in FINISHED_STATUSES
+
+
+async def stream_task_status(
+  namespace: str,
+  key: str,
+  get_current: Callable[[], Awaitable[TaskStatusEntry | None]],
+  is_disconnected: Callable[[], Awaitable[bool]],
+) -> AsyncIterator[str]:
+  """
+  Server-sent events for one task: its current status, then every change until it finishes.
+
+  Each event carries the full status entry as JSON, or `null` if the task is unknown. The
+  stream ends once the task has succeeded or failed, or when the client goes away.
+  """
+  # Subscribe before reading the current status so no change can slip in between
+  with task_events.subscribe(namespace, key) as updates:
+    current = await get_current()
+    yield format_event(current.model_dump_json(by_alias=True) if current else 'null', 'status')
+
+    while not _is_finished(current):
+      try:
+        current = await asyncio.wait_for(updates.get(), KEEPALIVE_SECONDS)
+      except TimeoutError:
+        if await is_disconnected():
+          return
+        yield ': keep-alive\n\n'
+        continue
+      yield format_event(current.model_dump_json(by_alias=True), 'status')
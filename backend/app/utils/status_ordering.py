@@ -8,8 +8,11 @@ def generate_latest_event_sql(
   date_column: str = 'se.date',
   status_column: str = 'se.status',
   stage_expression: str = "COALESCE(json_extract(se.payload, '$.stage'), 0)",
+  listing_filter: str = '',
 ) -> str:
   """Generate complete CTE for finding the latest event per listing."""
+  where_clause = f'WHERE {listing_filter}' if listing_filter else ''
+
   # Generate status priority CASE statement using StatusEnum.priority
   cases = [f"WHEN '{status.value}' THEN {status.priority}" for status in StatusEnum]
   status_case = (
@@ -34,9 +37,28 @@ def generate_latest_event_sql(
         FROM listings l
         LEFT JOIN applications a ON l.id = a.listing_id
         LEFT JOIN status_events se ON a.id = se.application_id
+        {where_clause}
       )"""
 
 
+def generate_latest_status_refresh_sql(listing_filter: str = '') -> str:
+  """
+  Generate an upsert that materializes the latest event per listing into listing_latest_status.
+
+  Pass a `listing_filter` (e.g. `'l.id = ?'`) to refresh a subset of listings. Listings that no
+  longer have any events must be deleted from the table separately.
+  """
+  latest_events_cte = generate_latest_event_sql(listing_filter=listing_filter)
+
+  return f"""
+    INSERT OR REPLACE INTO listing_latest_status (listing_id, application_id, status, date)
+    {latest_events_cte}
+    SELECT listing_id, application_id, status, date
+    FROM latest_events
+    WHERE rn = 1 AND status IS NOT NULL
+  """
+
+
 def create_status_event_sort_key(reverse: bool = False):
   """Create a sort key function for sorting status events in Python."""
 
@@ -48,3 +48,59 @@ def find_phrase_matches(text: str, phrase: str) -> list[str]:
 
 def contains_phrase(text: str, phrase: str) -> bool:
   return len(find_phrase_matches(text, phrase)) > 0
+
+
+# Matches the listing index tokenizer, which keeps + and # inside terms like "C++" and "C#"
+FTS_TERM_PATTERN = re.compile(r'[\w+#]*\w[\w+#]*')
+
+
+def to_fts_prefix_query(search: str) -> str | None:
+  """
+  Convert free-form user input into an FTS5 query that prefix-matches every word.
+
+  Each word is quoted so FTS5 operators and punctuation in the input are treated as text.
+
+  Args:
+    search: Raw search input.
+
+  Returns:
+    FTS5 MATCH expression, or None if the input contains no searchable words.
+  """
+  words = FTS_TERM_PATTERN.findall(search)
+  if not words:
+    return None
+  return ' '.join(f'"{word}"*' for word in words)
+
+
+# Legal suffixes dropped so "Acme, Inc." and "ACME Inc" name the same company
+COMPANY_SUFFIXES = frozenset(
+  {
+    'ag',
+    'co',
+    'company',
+    'corp',
+    'corporation',
+    'gmbh',
+    'inc',
+    'incorporated',
+    'limited',
+    'llc',
+    'ltd',
+    'plc',
+    'pte',
+    'pty',
+    'sa',
+  }
+)
+
+
+def normalize_words(text: str | None) -> list[str]:
+  """Lowercase words with punctuation removed."""
+  return re.sub(r'[^a-z0-9]+', ' ', (text or '').lower()).split()
+
+
+def normalize_company_name(company: str) -> str:
+  words = normalize_words(company)
+  while len(words) > 1 and words[-1] in COMPANY_SUFFIXES:
+    words.pop()
+  return ' '.join(words)
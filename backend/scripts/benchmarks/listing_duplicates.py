@@ -0,0 +1,153 @@
+"""
+Compare heuristic duplicate detection against a naive pairwise scan.
+
+The naive scan scores company and title for every saved listing in a Python loop, which is
+what the repository did before candidates were blocked by company and scored with
+rapidfuzz's cdist.
+"""
+
+import argparse
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+# The script is intentionally outside the backend package; add backend/ for local CLI usage.
+# ruff: noqa: E402
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+if str(BACKEND_DIR) not in sys.path:
+  sys.path.insert(0, str(BACKEND_DIR))
+
+from app.db_init import create_tables
+from app.managers import connection_pools
+from app.repositories import ListingRepository
+from app.schemas.listing import Listing
+from app.services.config.schemas import AppConfig, PathsPrefs
+from app.utils.deduplication import fuzzy_text_similarity
+
+DEFAULT_SIZES = [10_000, 100_000]
+DEFAULT_LOOKUPS = 20
+DEFAULT_COMPANIES = 2_000
+
+TITLES = [
+  'Backend Engineer',
+  'Frontend Engineer',
+  'Data Scientist',
+  'Product Manager',
+  'Site Reliability Engineer',
+  'Machine Learning Engineer',
+  'Designer',
+  'Engineering Manager',
+]
+LEVELS = ['', 'Senior ', 'Staff ', 'Junior ', 'Principal ']
+
+INSERT_LISTING_QUERY = """
+  INSERT INTO listings (id, url, title, company, domain, description)
+  VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+
+def parse_args() -> argparse.Namespace:
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+  parser.add_argument('--lookups', type=int, default=DEFAULT_LOOKUPS)
+  parser.add_argument('--companies', type=int, default=DEFAULT_COMPANIES)
+  parser.add_argument('--skip-naive', action='store_true', help='Only time the blocked engine.')
+  return parser.parse_args()
+
+
+def random_listing_row(rng: random.Random, companies: int) -> tuple[str, ...]:
+  listing_id = str(uuid.uuid4())
+  return (
+    listing_id,
+    f'https://example.com/jobs/{listing_id}',
+    f'{rng.choice(LEVELS)}{rng.choice(TITLES)}',
+    f'Company {rng.randrange(companies)}',
+    'example.com',
+    'Build and operate services.',
+  )
+
+
+def naive_candidates(
+  conn: sqlite3.Connection, new_listing: Listing, settings: AppConfig
+) -> list[tuple[str, float]]:
+  similar = []
+  for row in conn.execute('SELECT id, title, company FROM listings'):
+    title_sim = fuzzy_text_similarity(new_listing.title, row[1])
+    company_sim = fuzzy_text_similarity(new_listing.company, row[2])
+    if (
+      title_sim >= settings.listings.title_threshold
+      and company_sim >= settings.listings.company_threshold
+    ):
+      similar.append((row[0], (title_sim + company_sim) / 2))
+  return sorted(similar, key=lambda x: x[1], reverse=True)
+
+
+def time_lookups(lookup, queries: list[Listing]) -> float:
+  durations = []
+  for query in queries:
+    started = time.perf_counter()
+    lookup(query)
+    durations.append(time.perf_counter() - started)
+  return statistics.median(durations) * 1000
+
+
+def run_size(size: int, args: argparse.Namespace) -> dict[str, float | None]:
+  rng = random.Random(size)
+  with tempfile.TemporaryDirectory() as tmp_dir:
+    db_path = str(Path(tmp_dir) / 'db.sqlite3')
+    create_tables(db_path)
+    settings = AppConfig(paths=PathsPrefs(db_path=db_path))
+
+    with sqlite3.connect(db_path) as conn:
+      conn.executemany(
+        INSERT_LISTING_QUERY, [random_listing_row(rng, args.companies) for _ in range(size)]
+      )
+
+    queries = [
+      Listing(
+        url=f'https://example.com/new/{index}',
+        title=f'{rng.choice(LEVELS)}{rng.choice(TITLES)}',
+        company=f'Company {rng.randrange(args.companies)}',
+        domain='example.com',
+        description='New listing.',
+      )
+      for index in range(args.lookups)
+    ]
+
+    # The model client is only used for semantic search, which this benchmark skips
+    repository = ListingRepository(model_client=None, settings=settings)  # type: ignore[arg-type]
+    blocked_ms = time_lookups(repository.find_heuristic_duplicate_candidates, queries)
+
+    naive_ms = None
+    if not args.skip_naive:
+      with sqlite3.connect(db_path) as conn:
+        naive_ms = time_lookups(lambda query: naive_candidates(conn, query, settings), queries)
+
+    connection_pools.close_pool(db_path)
+
+  return {'blocked_ms': blocked_ms, 'naive_ms': naive_ms}
+
+
+def main() -> None:
+  args = parse_args()
+
+  print(f'{args.companies} companies, median of {args.lookups} lookups per size')
+  print(f'{"listings":>10}{"blocked ms":>14}{"naive ms":>12}{"speedup":>10}')
+  for size in args.sizes:
+    result = run_size(size, args)
+    blocked_ms = result['blocked_ms'] or 0.0
+    naive_ms = result['naive_ms']
+    naive_column = f'{naive_ms:>12.1f}' if naive_ms is not None else f'{"-":>12}'
+    speedup_column = (
+      f'{naive_ms / blocked_ms:>9.1f}x' if naive_ms is not None and blocked_ms else f'{"-":>10}'
+    )
+    print(f'{size:>10}{blocked_ms:>14.1f}{naive_column}{speedup_column}')
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,87 @@
+"""
+Compare the vectorized similarity kernel against the per-pair cosine loop.
+
+The loop is what content quality scoring did before embeddings were stacked into normalized
+matrices: one pure-Python cosine similarity per (unit, requirement) pair, recomputing both norms
+every time.
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# The script is intentionally outside the backend package; add backend/ for local CLI usage.
+# ruff: noqa: E402
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+if str(BACKEND_DIR) not in sys.path:
+  sys.path.insert(0, str(BACKEND_DIR))
+
+from app.utils.similarity import max_similarities
+
+DEFAULT_UNITS = 200
+DEFAULT_REQUIREMENTS = 60
+DEFAULT_DIMS = 1536
+DEFAULT_REPEATS = 5
+
+
+def parse_args() -> argparse.Namespace:
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument('--units', type=int, default=DEFAULT_UNITS)
+  parser.add_argument('--requirements', type=int, default=DEFAULT_REQUIREMENTS)
+  parser.add_argument('--dims', type=int, default=DEFAULT_DIMS)
+  parser.add_argument('--repeats', type=int, default=DEFAULT_REPEATS)
+  return parser.parse_args()
+
+
+def random_embeddings(rng: random.Random, count: int, dims: int) -> list[list[float]]:
+  return [[rng.gauss(0, 1) for _ in range(dims)] for _ in range(count)]
+
+
+def loop_cosine_similarity(vec1: list[float], vec2: list[float]) -> float:
+  dot_product = sum(a * b for a, b in zip(vec1, vec2, strict=True))
+  magnitude1 = sum(a * a for a in vec1) ** 0.5
+  magnitude2 = sum(b * b for b in vec2) ** 0.5
+  if magnitude1 == 0 or magnitude2 == 0:
+    return 0.0
+  return dot_product / (magnitude1 * magnitude2)
+
+
+def loop_max_similarities(units: list[list[float]], requirements: list[list[float]]) -> list[float]:
+  return [
+    max(loop_cosine_similarity(unit, requirement) for requirement in requirements) for unit in units
+  ]
+
+
+def time_runs(fn, repeats: int) -> tuple[float, list[float]]:
+  durations = []
+  result: list[float] = []
+  for _ in range(repeats):
+    started = time.perf_counter()
+    result = fn()
+    durations.append(time.perf_counter() - started)
+  return statistics.median(durations) * 1000, result
+
+
+def main() -> None:
+  args = parse_args()
+  rng = random.Random(0)
+  units = random_embeddings(rng, args.units, args.dims)
+  requirements = random_embeddings(rng, args.requirements, args.dims)
+
+  vectorized_ms, vectorized = time_runs(lambda: max_similarities(units, requirements), args.repeats)
+  loop_ms, looped = time_runs(lambda: loop_max_similarities(units, requirements), args.repeats)
+  max_error = max(abs(a - b) for a, b in zip(vectorized, looped, strict=True))
+
+  print(
+    f'{args.units} units x {args.requirements} requirements x {args.dims} dims, '
+    f'median of {args.repeats} runs'
+  )
+  print(f'{"vectorized ms":>14}{"loop ms":>12}{"speedup":>10}{"max error":>12}')
+  print(f'{vectorized_ms:>14.1f}{loop_ms:>12.1f}{loop_ms / vectorized_ms:>9.1f}x{max_error:>12.2e}')
+
+
+if __name__ == '__main__':
+  main()
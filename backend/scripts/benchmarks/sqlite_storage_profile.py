@@ -0,0 +1,167 @@
+"""
+Compare read/write concurrency of SQLite's default rollback journal with Atto's tuned
+storage profile (WAL, mmap, relaxed synchronous).
+
+One writer thread simulates a background research/analysis task while several reader
+threads simulate UI requests against the same listings table.
+"""
+
+import argparse
+import sqlite3
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from pathlib import Path
+
+# The script is intentionally outside the backend package; add backend/ for local CLI usage.
+# ruff: noqa: E402
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+if str(BACKEND_DIR) not in sys.path:
+  sys.path.insert(0, str(BACKEND_DIR))
+
+from app.db_init import create_tables
+from app.managers import ConnectionPool
+from app.services.config.schemas import DatabasePrefs
+from app.utils.errors import ServiceError
+
+DEFAULT_SEED_ROWS = 5000
+DEFAULT_READERS = 4
+DEFAULT_DURATION_SECONDS = 5.0
+
+PROFILES = {
+  'default': DatabasePrefs(
+    journal_mode='delete',
+    synchronous='full',
+    mmap_size_mb=0,
+    cache_size_mb=2,
+    temp_store='default',
+    checkpoint_interval_seconds=0,
+  ),
+  'tuned': DatabasePrefs(),
+}
+
+INSERT_LISTING_QUERY = """
+  INSERT INTO listings (id, url, title, company, domain, description)
+  VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+READ_QUERY = """
+  SELECT id, title, company FROM listings
+  WHERE company = ?
+  ORDER BY title
+  LIMIT 20
+"""
+
+
+def parse_args() -> argparse.Namespace:
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument('--seed-rows', type=int, default=DEFAULT_SEED_ROWS)
+  parser.add_argument('--readers', type=int, default=DEFAULT_READERS)
+  parser.add_argument('--duration', type=float, default=DEFAULT_DURATION_SECONDS)
+  return parser.parse_args()
+
+
+def listing_row(index: int) -> tuple[str, ...]:
+  listing_id = str(uuid.uuid4())
+  return (
+    listing_id,
+    f'https://example.com/jobs/{listing_id}',
+    f'Engineer {index}',
+    f'Company {index % 100}',
+    'example.com',
+    'Build and operate services. ' * 20,
+  )
+
+
+def run_profile(prefs: DatabasePrefs, args: argparse.Namespace) -> dict[str, float]:
+  with tempfile.TemporaryDirectory() as tmp_dir:
+    db_path = str(Path(tmp_dir) / 'db.sqlite3')
+    create_tables(db_path, prefs)
+    pool = ConnectionPool(db_path, prefs, max_size=args.readers + 1)
+
+    with pool.connection() as conn:
+      conn.executemany(INSERT_LISTING_QUERY, [listing_row(i) for i in range(args.seed_rows)])
+      conn.commit()
+
+    stop = threading.Event()
+    read_latencies: list[float] = []
+    write_count = 0
+    errors = 0
+    lock = threading.Lock()
+
+    def writer() -> None:
+      nonlocal write_count, errors
+      index = args.seed_rows
+      while not stop.is_set():
+        try:
+          with pool.connection() as conn:
+            conn.executemany(INSERT_LISTING_QUERY, [listing_row(index + i) for i in range(10)])
+            conn.commit()
+          index += 10
+          write_count += 1
+        except (ServiceError, sqlite3.Error):
+          with lock:
+            errors += 1
+
+    def reader(seed: int) -> None:
+      nonlocal errors
+      company_index = seed
+      while not stop.is_set():
+        started = time.perf_counter()
+        try:
+          with pool.connection() as conn:
+            conn.execute(READ_QUERY, (f'Company {company_index % 100}',)).fetchall()
+        except (ServiceError, sqlite3.Error):
+          with lock:
+            errors += 1
+          continue
+        with lock:
+          read_latencies.append(time.perf_counter() - started)
+        company_index += 1
+
+    threads = [threading.Thread(target=writer)] + [
+      threading.Thread(target=reader, args=(i,)) for i in range(args.readers)
+    ]
+    for thread in threads:
+      thread.start()
+    time.sleep(args.duration)
+    stop.set()
+    for thread in threads:
+      thread.join()
+    pool.close()
+
+  sorted_latencies = sorted(read_latencies) or [0.0]
+  return {
+    'reads_per_second': len(read_latencies) / args.duration,
+    'writes_per_second': write_count / args.duration,
+    'read_p50_ms': statistics.median(sorted_latencies) * 1000,
+    'read_p95_ms': sorted_latencies[int(len(sorted_latencies) * 0.95)] * 1000,
+    'errors': errors,
+  }
+
+
+def main() -> None:
+  args = parse_args()
+
+  print(
+    f'{args.seed_rows} seed rows, 1 writer, {args.readers} readers, '
+    f'{args.duration:.0f}s per profile'
+  )
+  print(f'{"profile":<10}{"reads/s":>12}{"writes/s":>12}{"p50 ms":>10}{"p95 ms":>10}{"errors":>8}')
+  for name, prefs in PROFILES.items():
+    result = run_profile(prefs, args)
+    print(
+      f'{name:<10}'
+      f'{result["reads_per_second"]:>12.0f}'
+      f'{result["writes_per_second"]:>12.0f}'
+      f'{result["read_p50_ms"]:>10.2f}'
+      f'{result["read_p95_ms"]:>10.2f}'
+      f'{result["errors"]:>8}'
+    )
+
+
+if __name__ == '__main__':
+  main()
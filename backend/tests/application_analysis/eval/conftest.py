@@ -6,13 +6,16 @@ from app.clients.application_analysis.local.client import LocalApplicationAnalys
 from app.clients.model import ModelClient, get_local_model_client
 from shared.schemas.application_analysis import ApplicationAnalysis
 from tests.conftest import build_eval_config
+from tests.fakes.analysis_cache_repository import FakeAnalysisCacheRepository
 
 from .golden_cases import GOLDEN_CASES, GoldenCaseId
 
 
 async def run_application_analysis_eval() -> dict[GoldenCaseId, ApplicationAnalysis]:
   config = build_eval_config()
-  analysis_client = LocalApplicationAnalysisClient(get_local_model_client(config))
+  analysis_client = LocalApplicationAnalysisClient(
+    get_local_model_client(config), config, FakeAnalysisCacheRepository()
+  )
   results: dict[GoldenCaseId, ApplicationAnalysis] = {}
 
   for case_id, case in GOLDEN_CASES.items():
@@ -1,6 +1,8 @@
 import pytest
 
 from app.clients.application_analysis.local.client import LocalApplicationAnalysisClient
+from app.services.config.schemas import AppConfig
+from tests.fakes.analysis_cache_repository import FakeAnalysisCacheRepository
 from tests.fakes.model_client import FakeModelClient
 
 
@@ -8,4 +10,6 @@ from tests.fakes.model_client import FakeModelClient
 def application_analysis_client(
   fake_model_client: FakeModelClient,
 ) -> LocalApplicationAnalysisClient:
-  return LocalApplicationAnalysisClient(fake_model_client)
+  return LocalApplicationAnalysisClient(
+    fake_model_client, AppConfig(), FakeAnalysisCacheRepository()
+  )
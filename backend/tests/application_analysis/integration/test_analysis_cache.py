@@ -0,0 +1,101 @@
+import pytest
+
+from app.clients.application_analysis.local.client import LocalApplicationAnalysisClient
+from app.clients.application_analysis.local.content_quality import build_requirement_texts
+from app.schemas.listing import Listing
+from app.schemas.resume import Resume
+from app.services.config.schemas import AppConfig
+from shared.schemas.application_analysis import ApplicationAnalysis
+from tests.application_analysis.constants import SEMANTIC_MATCH_EMBEDDING
+from tests.fakes.analysis_cache_repository import FakeAnalysisCacheRepository
+from tests.fakes.model_client import FakeModelClient
+
+from ..factories import make_application, make_detailed_section, make_listing, make_resume
+from .test_application_analysis_flow import (
+  configure_requirement_embeddings,
+  configure_unit_embeddings,
+  queue_skill_scores,
+  skill_scores,
+)
+
+pytestmark = pytest.mark.integration
+
+SKILL_SCORE = 90
+
+
+async def analyze(
+  model_client: FakeModelClient,
+  cache_repository: FakeAnalysisCacheRepository,
+  listing: Listing,
+  resume: Resume,
+) -> ApplicationAnalysis:
+  configure_requirement_embeddings(model_client, listing, SEMANTIC_MATCH_EMBEDDING)
+  configure_unit_embeddings(model_client, resume, SEMANTIC_MATCH_EMBEDDING)
+  # A fresh client per analysis, as each request gets, sharing only the durable cache
+  client = LocalApplicationAnalysisClient(model_client, AppConfig(), cache_repository)
+  return await client.generate_analysis(
+    listing=listing,
+    application=make_application(listing_id=listing.id, resume_id=resume.id),
+    resume=resume,
+  )
+
+
+@pytest.mark.anyio
+async def test_reanalysis_only_embeds_changed_units_and_rescores_the_changed_resume():
+  """Editing one bullet should embed just that bullet and keep the listing's skill scores."""
+  cache_repository = FakeAnalysisCacheRepository()
+  listing = make_listing()
+  bullets = ['Built Python APIs backed by SQL.', 'Debugged distributed systems in production.']
+  model_client = FakeModelClient()
+  queue_skill_scores(model_client, required_score=SKILL_SCORE, resume_score=SKILL_SCORE)
+  first = await analyze(
+    model_client,
+    cache_repository,
+    listing,
+    make_resume(sections=[make_detailed_section('Experience', bullets=bullets)]),
+  )
+
+  edited_bullet = 'Built Python APIs backed by PostgreSQL.'
+  model_client = FakeModelClient()
+  model_client.queue_structured(
+    skill_scores(('Python', SKILL_SCORE), ('SQL', SKILL_SCORE), ('APIs', SKILL_SCORE))
+  )
+  second = await analyze(
+    model_client,
+    cache_repository,
+    listing,
+    make_resume(
+      sections=[make_detailed_section('Experience', bullets=[edited_bullet, bullets[1]])]
+    ),
+  )
+
+  embedded_texts = {text for call in model_client.embedding_calls for text in call.texts}
+  assert embedded_texts == {*build_requirement_texts(listing), edited_bullet}
+  assert len(model_client.structured_calls) == 1
+  assert [row.required_score for row in second.skills_comparison] == [
+    row.required_score for row in first.skills_comparison
+  ]
+
+
+@pytest.mark.anyio
+async def test_reanalysis_only_asks_the_model_to_score_new_skills():
+  """Adding a listing skill should request scores for that skill alone."""
+  cache_repository = FakeAnalysisCacheRepository()
+  resume = make_resume()
+  model_client = FakeModelClient()
+  queue_skill_scores(model_client, required_score=SKILL_SCORE, resume_score=SKILL_SCORE)
+  await analyze(model_client, cache_repository, make_listing(), resume)
+
+  model_client = FakeModelClient()
+  model_client.queue_structured(
+    skill_scores(('Docker', SKILL_SCORE)), skill_scores(('Docker', SKILL_SCORE))
+  )
+  analysis = await analyze(
+    model_client,
+    cache_repository,
+    make_listing(skills=['Python', 'SQL', 'APIs', 'Docker']),
+    resume,
+  )
+
+  assert len(model_client.structured_calls) == 2
+  assert [row.skill for row in analysis.skills_comparison] == ['Python', 'SQL', 'APIs', 'Docker']
@@ -0,0 +1,126 @@
+import asyncio
+from dataclasses import dataclass
+from typing import TypeVar
+
+import pytest
+from pydantic import BaseModel
+
+from app.clients.application_analysis.local.client import LocalApplicationAnalysisClient
+from app.services.config.schemas import AppConfig, ModelPrefs
+from shared.schemas.application_analysis import ContentQualitySection, SkillComparisonRow
+from tests.application_analysis.constants import SEMANTIC_MATCH_EMBEDDING
+from tests.fakes.analysis_cache_repository import FakeAnalysisCacheRepository
+from tests.fakes.model_client import FakeModelClient
+
+from ..factories import make_application, make_listing, make_resume
+from .test_application_analysis_flow import (
+  configure_requirement_embeddings,
+  configure_unit_embeddings,
+  queue_skill_scores,
+)
+
+pytestmark = pytest.mark.integration
+
+T = TypeVar('T', bound=BaseModel)
+
+MODEL_CALL_DELAY_SECONDS = 0.02
+SKILL_SCORE = 80
+
+
+@dataclass
+class InFlightModelClient(FakeModelClient):
+  """Fake model client that holds each request open briefly and tracks overlap."""
+
+  in_flight: int = 0
+  peak_in_flight: int = 0
+
+  async def _hold(self) -> None:
+    self.in_flight += 1
+    self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+    try:
+      await asyncio.sleep(MODEL_CALL_DELAY_SECONDS)
+    finally:
+      self.in_flight -= 1
+
+  async def embed(self, texts: list[str]) -> list[list[float]]:
+    await self._hold()
+    return await super().embed(texts)
+
+  async def call_structured(self, input: str, response_model: type[T]) -> T:
+    # Take the queued response before yielding so concurrent calls keep their start order
+    response = await super().call_structured(input, response_model)
+    await self._hold()
+    return response
+
+
+async def run_analysis(concurrency: int) -> tuple[InFlightModelClient, dict[str, float]]:
+  model_client = InFlightModelClient()
+  listing = make_listing()
+  resume = make_resume()
+  configure_requirement_embeddings(model_client, listing, SEMANTIC_MATCH_EMBEDDING)
+  configure_unit_embeddings(model_client, resume, SEMANTIC_MATCH_EMBEDDING)
+  queue_skill_scores(model_client, required_score=SKILL_SCORE, resume_score=SKILL_SCORE)
+  client = LocalApplicationAnalysisClient(
+    model_client,
+    AppConfig(model=ModelPrefs(analysis_concurrency=concurrency)),
+    FakeAnalysisCacheRepository(),
+  )
+
+  analysis = await client.generate_analysis(
+    listing=listing,
+    application=make_application(listing_id=listing.id, resume_id=resume.id),
+    resume=resume,
+  )
+  return model_client, analysis.stage_timings
+
+
+@pytest.mark.anyio
+async def test_generate_analysis_runs_independent_stages_concurrently():
+  """Both skill scorings and the content embeddings should be in flight together."""
+  model_client, stage_timings = await run_analysis(concurrency=3)
+
+  assert model_client.peak_in_flight == 3
+  assert set(stage_timings) == {'skills_comparison', 'content_quality', 'ai_suggestions'}
+  assert stage_timings['skills_comparison'] >= MODEL_CALL_DELAY_SECONDS
+
+
+@pytest.mark.anyio
+async def test_generate_analysis_respects_the_shared_model_concurrency_limit():
+  """Concurrent stages should never exceed the configured number of model requests."""
+  model_client, _ = await run_analysis(concurrency=1)
+
+  assert model_client.peak_in_flight == 1
+
+
+class FailingSkillsAnalysisClient(LocalApplicationAnalysisClient):
+  """Analysis client whose skills stage fails while content quality is still running."""
+
+  content_quality_unwound = False
+
+  async def get_skills_comparison(self, *args, **kwargs) -> list[SkillComparisonRow]:
+    raise RuntimeError('skills comparison failed')
+
+  async def get_content_quality(self, *args, **kwargs) -> list[ContentQualitySection]:
+    try:
+      await asyncio.sleep(1)
+      return []
+    finally:
+      self.content_quality_unwound = True
+
+
+@pytest.mark.anyio
+async def test_failed_stage_waits_for_its_cancelled_sibling():
+  """A failing stage should cancel the other and let it unwind before the error propagates."""
+  listing = make_listing()
+  client = FailingSkillsAnalysisClient(
+    FakeModelClient(), AppConfig(), FakeAnalysisCacheRepository()
+  )
+
+  with pytest.raises(RuntimeError):
+    await client.generate_analysis(
+      listing=listing,
+      application=make_application(listing_id=listing.id, resume_id=make_resume().id),
+      resume=make_resume(),
+    )
+
+  assert client.content_quality_unwound
@@ -38,7 +38,8 @@ STRONG_RESUME_SKILL_SCORE = 80
 STRONG_RESUME_ACCEPTANCE_THRESHOLD = 0.8
 WEAK_RESUME_REJECTION_THRESHOLD = 0.35
 SKILL_SCORE_MODEL_CALL_COUNT = 2
-CACHED_CONTENT_QUALITY_EMBEDDING_CALL_COUNT = 3
+# Requirements and every resume section are embedded in a single batched request
+CACHED_CONTENT_QUALITY_EMBEDDING_CALL_COUNT = 1
 ANALYSIS_WITHOUT_SUGGESTION_MODEL_CALL_COUNT = 2
 ANALYSIS_WITH_SUGGESTION_MODEL_CALL_COUNT = 3
 
@@ -105,7 +106,7 @@ async def test_generate_analysis_scores_strong_relevant_resume_above_acceptance_
   assert analysis.ai_suggestions is not None
   assert not analysis.ai_suggestions.suggestions
   assert len(fake_model_client.structured_calls) == SKILL_SCORE_MODEL_CALL_COUNT
-  assert len(fake_model_client.embedding_calls) >= SKILL_SCORE_MODEL_CALL_COUNT
+  assert len(fake_model_client.embedding_calls) == CACHED_CONTENT_QUALITY_EMBEDDING_CALL_COUNT
 
 
 @pytest.mark.anyio
@@ -154,7 +155,7 @@ async def test_generate_analysis_reuses_content_quality_scores_for_suggestions(
   fake_model_client: FakeModelClient,
   application_analysis_client: LocalApplicationAnalysisClient,
 ):
-  """Content quality embeddings should be cached and reused when suggestions run."""
+  """Suggestions should reuse the content quality computed earlier in the same analysis."""
   listing = make_listing()
   resume = make_resume()
   application = make_application(listing_id=listing.id, resume_id=resume.id)
@@ -187,6 +188,9 @@ async def test_generate_analysis_rejects_incomplete_model_skill_scores(
   listing = make_listing()
   resume = make_resume()
   application = make_application(listing_id=listing.id, resume_id=resume.id)
+  # Content quality runs alongside skill scoring, so it needs embeddings to reach the failure
+  configure_requirement_embeddings(fake_model_client, listing, SEMANTIC_MATCH_EMBEDDING)
+  configure_unit_embeddings(fake_model_client, resume, SEMANTIC_MATCH_EMBEDDING)
   fake_model_client.queue_structured(
     skill_scores(('Python', HIGH_REQUIRED_SKILL_SCORE), ('SQL', HIGH_REQUIRED_SKILL_SCORE))
   )
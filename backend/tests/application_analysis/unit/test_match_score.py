@@ -54,6 +54,7 @@ class StubApplicationAnalysisClient(ApplicationAnalysisClient):
     application: Application,
     resume: Resume,
     match_score: float,
+    content_quality: list[ContentQualitySection],
   ) -> AISuggestions:
     raise NotImplementedError
 
@@ -0,0 +1,83 @@
+import pytest
+from crawl4ai import BrowserConfig
+
+from app.managers import BrowserPool
+from app.managers import browser_pool as browser_pool_module
+from app.utils.errors import ServiceError
+
+pytestmark = pytest.mark.unit
+
+
+class FakeCrawler:
+  def __init__(self, config: BrowserConfig, fail_start: bool = False) -> None:
+    self.config = config
+    self.fail_start = fail_start
+    self.started = False
+    self.closed = False
+
+  async def start(self) -> None:
+    if self.fail_start:
+      raise RuntimeError('Executable does not exist')
+    self.started = True
+
+  async def close(self) -> None:
+    self.closed = True
+
+
+@pytest.fixture
+def crawlers(monkeypatch: pytest.MonkeyPatch) -> list[FakeCrawler]:
+  created: list[FakeCrawler] = []
+
+  def factory(config: BrowserConfig) -> FakeCrawler:
+    crawler = FakeCrawler(config)
+    created.append(crawler)
+    return crawler
+
+  monkeypatch.setattr(browser_pool_module, 'AsyncWebCrawler', factory)
+  return created
+
+
+@pytest.mark.anyio
+async def test_browsers_are_reused_then_recycled(crawlers: list[FakeCrawler]):
+  """Consecutive crawls should share one browser until it reaches its page budget."""
+  pool = BrowserPool(BrowserConfig(), size=2, recycle_after_pages=3)
+
+  for _ in range(3):
+    async with pool.lease() as lease:
+      lease.record_pages()
+
+  assert len(crawlers) == 1
+  assert crawlers[0].closed
+
+  async with pool.lease() as lease:
+    assert lease.crawler is crawlers[1]
+  assert pool.idle == 1
+
+
+@pytest.mark.anyio
+async def test_crashed_browsers_are_replaced(crawlers: list[FakeCrawler]):
+  """A browser that dies mid-crawl should be shut down and a fresh one started next time."""
+  pool = BrowserPool(BrowserConfig(), size=1, recycle_after_pages=50)
+
+  with pytest.raises(RuntimeError):
+    async with pool.lease():
+      raise RuntimeError('Target page, context or browser has been closed')
+
+  async with pool.lease() as lease:
+    assert lease.crawler is crawlers[1]
+  assert crawlers[0].closed
+  assert not crawlers[1].closed
+
+
+@pytest.mark.anyio
+async def test_launch_failures_surface_as_service_errors(monkeypatch: pytest.MonkeyPatch):
+  """A browser that cannot start should raise a user-facing error and leave the pool usable."""
+  monkeypatch.setattr(
+    browser_pool_module, 'AsyncWebCrawler', lambda config: FakeCrawler(config, fail_start=True)
+  )
+  pool = BrowserPool(BrowserConfig(), size=1, recycle_after_pages=50)
+
+  with pytest.raises(ServiceError):
+    async with pool.lease():
+      pass
+  assert pool.idle == 0
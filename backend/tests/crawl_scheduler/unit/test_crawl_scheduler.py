@@ -0,0 +1,154 @@
+import asyncio
+import itertools
+
+import pytest
+from pydantic import HttpUrl
+
+from app.clients.scraping import LocalScrapingClient
+from app.clients.scraping.schemas import CrawlResult, SearchResult
+from app.managers import CrawlScheduler
+from app.services.config.schemas import AppConfig, IngestionPrefs
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.anyio
+async def test_concurrency_is_capped_globally_and_per_host():
+  """No more than the global and per-host limits should ever run at once."""
+  scheduler = CrawlScheduler(concurrency=3, per_host_concurrency=1, per_host_delay=0.0)
+  running: dict[str, int] = {}
+  peaks = {'total': 0, 'host': 0}
+
+  async def fetch(host: str) -> None:
+    running[host] = running.get(host, 0) + 1
+    peaks['total'] = max(peaks['total'], sum(running.values()))
+    peaks['host'] = max(peaks['host'], running[host])
+    await asyncio.sleep(0.01)
+    running[host] -= 1
+
+  await asyncio.gather(
+    *[
+      scheduler.run(f'https://{host}.example.com/{index}', lambda host=host: fetch(host))
+      for host in ['a', 'b', 'c', 'd']
+      for index in range(3)
+    ]
+  )
+
+  assert peaks == {'total': 3, 'host': 1}
+
+
+@pytest.mark.anyio
+async def test_queued_crawls_start_in_priority_order():
+  """Once the scheduler is saturated, better-ranked crawls should be admitted first."""
+  scheduler = CrawlScheduler(concurrency=1, per_host_concurrency=8, per_host_delay=0.0)
+  started: list[int] = []
+
+  async def fetch(priority: int) -> None:
+    started.append(priority)
+    await asyncio.sleep(0.01)
+
+  await asyncio.gather(
+    *[
+      scheduler.run(f'https://site{priority}.example.com', lambda p=priority: fetch(p), priority)
+      for priority in [5, 3, 4, 1, 2]
+    ]
+  )
+
+  assert started == [5, 1, 2, 3, 4]
+
+
+@pytest.mark.anyio
+async def test_requests_to_one_host_are_spaced_by_the_delay():
+  """Consecutive requests to the same host should start at least the delay apart."""
+  scheduler = CrawlScheduler(concurrency=4, per_host_concurrency=4, per_host_delay=0.05)
+  loop = asyncio.get_running_loop()
+  started: list[float] = []
+
+  async def fetch() -> None:
+    started.append(loop.time())
+
+  await asyncio.gather(*[scheduler.run('https://example.com/', fetch) for _ in range(3)])
+
+  gaps = [later - earlier for earlier, later in itertools.pairwise(started)]
+  assert all(gap >= 0.045 for gap in gaps)
+
+
+@pytest.mark.anyio
+async def test_host_spacing_holds_when_crawls_queue_for_a_global_slot():
+  """Crawls to one host that wait behind a saturated pool should still start spaced out."""
+  scheduler = CrawlScheduler(concurrency=1, per_host_concurrency=3, per_host_delay=0.05)
+  loop = asyncio.get_running_loop()
+  started: list[float] = []
+
+  async def block() -> None:
+    await asyncio.sleep(0.2)
+
+  async def fetch() -> None:
+    started.append(loop.time())
+
+  await asyncio.gather(
+    scheduler.run('https://other.example.com/', block),
+    *[scheduler.run('https://example.com/', fetch) for _ in range(3)],
+  )
+
+  gaps = [later - earlier for earlier, later in itertools.pairwise(started)]
+  assert all(gap >= 0.045 for gap in gaps)
+
+
+@pytest.mark.anyio
+async def test_search_and_crawl_stops_once_enough_pages_arrive():
+  """Crawls still queued once max_results pages arrive should be cancelled."""
+  config = AppConfig(
+    ingestion=IngestionPrefs(crawl_concurrency=2, crawl_per_host_delay_seconds=0.0)
+  )
+  client = LocalScrapingClient(config)
+  search_results = [
+    SearchResult(title=f'Result {index}', url=HttpUrl(f'https://site{index}.example.com/'))
+    for index in range(10)
+  ]
+  crawled: list[str] = []
+
+  async def search() -> list[SearchResult]:
+    return search_results
+
+  async def crawl(url: HttpUrl) -> CrawlResult:
+    crawled.append(str(url))
+    await asyncio.sleep(0.01)
+    return CrawlResult(url=url, content=f'Page at {url}')
+
+  results = await client.search_and_crawl(search, crawl, max_results=3)
+
+  assert [str(result.url) for result in results] == crawled[:3]
+  assert crawled[:3] == [str(result.url) for result in search_results[:3]]
+  assert len(crawled) < len(search_results)
+
+
+@pytest.mark.anyio
+async def test_cancelled_crawls_have_unwound_when_search_and_crawl_returns():
+  """Crawls cut short after max_results should release their resources before returning."""
+  config = AppConfig(
+    ingestion=IngestionPrefs(crawl_concurrency=2, crawl_per_host_delay_seconds=0.0)
+  )
+  client = LocalScrapingClient(config)
+  search_results = [
+    SearchResult(title=f'Result {index}', url=HttpUrl(f'https://site{index}.example.com/'))
+    for index in range(6)
+  ]
+  in_flight = 0
+
+  async def search() -> list[SearchResult]:
+    return search_results
+
+  async def crawl(url: HttpUrl) -> CrawlResult:
+    nonlocal in_flight
+    in_flight += 1
+    try:
+      await asyncio.sleep(0.01 if url == search_results[0].url else 0.05)
+      return CrawlResult(url=url, content=f'Page at {url}')
+    finally:
+      in_flight -= 1
+
+  results = await client.search_and_crawl(search, crawl, max_results=1)
+
+  assert len(results) == 1
+  assert in_flight == 0
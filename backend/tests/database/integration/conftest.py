@@ -0,0 +1,17 @@
+from collections.abc import Iterator
+
+import pytest
+
+from app.db_init import create_tables
+from app.managers import connection_pools
+from app.services.config.schemas import AppConfig, PathsPrefs
+
+
+@pytest.fixture
+def database_settings(tmp_path) -> Iterator[AppConfig]:
+  db_path = str(tmp_path / 'db.sqlite3')
+  create_tables(db_path)
+
+  yield AppConfig(paths=PathsPrefs(db_path=db_path))
+
+  connection_pools.close_pool(db_path)
@@ -0,0 +1,40 @@
+import pytest
+
+from app.repositories import AnalysisCacheRepository
+from app.repositories.analysis_cache_repository import ANALYSIS_CACHE_MAX_AGE_SECONDS
+from app.services.config.schemas import AppConfig
+
+pytestmark = pytest.mark.integration
+
+
+def test_analysis_cache_returns_scores_only_for_the_same_kind_model_and_scope(
+  database_settings: AppConfig,
+) -> None:
+  """Scores are looked up per item and never leak across models or listing content."""
+  repository = AnalysisCacheRepository(database_settings)
+  repository.put_scores('content_quality', 'openai:small', 'listing-a', {'unit-1': 0.75})
+
+  assert repository.get_scores(
+    'content_quality', 'openai:small', 'listing-a', ['unit-1', 'unit-2']
+  ) == {'unit-1': 0.75}
+  assert repository.get_scores('content_quality', 'openai:large', 'listing-a', ['unit-1']) == {}
+  assert repository.get_scores('content_quality', 'openai:small', 'listing-b', ['unit-1']) == {}
+  assert repository.get_scores('required_skill', 'openai:small', 'listing-a', ['unit-1']) == {}
+
+
+def test_analysis_cache_drops_stale_scores_when_new_scores_are_stored(
+  database_settings: AppConfig,
+) -> None:
+  """Scores older than the retention window are pruned on the next write."""
+  repository = AnalysisCacheRepository(database_settings)
+  repository.put_scores('resume_skill', 'openai:mini', 'resume-a', {'python': 80})
+  repository.execute(
+    'UPDATE analysis_cache SET updated_at = updated_at - ?', (ANALYSIS_CACHE_MAX_AGE_SECONDS + 1,)
+  )
+
+  repository.put_scores('resume_skill', 'openai:mini', 'resume-b', {'python': 60})
+
+  assert repository.get_scores('resume_skill', 'openai:mini', 'resume-a', ['python']) == {}
+  assert repository.get_scores('resume_skill', 'openai:mini', 'resume-b', ['python']) == {
+    'python': 60
+  }
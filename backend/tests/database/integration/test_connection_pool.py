@@ -0,0 +1,75 @@
+import pytest
+
+from app.managers import ConnectionPool
+from app.repositories import ResumeRepository
+from app.schemas.resume import Resume
+from app.schemas.template import DEFAULT_TEMPLATE_ID
+from app.services.config.schemas import AppConfig
+from app.utils.errors import ServiceError
+
+pytestmark = pytest.mark.integration
+
+
+def make_resume() -> Resume:
+  return Resume(template_id=DEFAULT_TEMPLATE_ID, sections=[])
+
+
+def test_one_off_queries_reuse_a_single_pooled_connection(database_settings: AppConfig):
+  """Sequential one-off queries should lease the same warm connection instead of reconnecting."""
+  repository = ResumeRepository(settings=database_settings)
+
+  resume = repository.create(make_resume())
+  repository.get(resume.id)
+  repository.get(resume.id)
+
+  assert repository.connection_pool.size == 1
+  assert repository.connection_pool.idle == 1
+
+
+def test_nested_transactions_share_the_leased_connection(database_settings: AppConfig):
+  """Nested transaction blocks should reuse the outer lease rather than opening another."""
+  repository = ResumeRepository(settings=database_settings)
+
+  with repository.transaction() as outer, repository.transaction() as inner:
+    assert outer is inner
+    repository.create(make_resume())
+    assert repository.connection_pool.idle == 0
+
+  assert repository.connection_pool.idle == 1
+
+
+def test_failed_transaction_rolls_back_and_returns_the_connection(database_settings: AppConfig):
+  """A failed transaction should discard its writes and leave the pool usable."""
+  repository = ResumeRepository(settings=database_settings)
+  resume = make_resume()
+
+  with pytest.raises(RuntimeError), repository.transaction():
+    repository.create(resume)
+    raise RuntimeError('boom')
+
+  with pytest.raises(Exception, match='Resume not found'):
+    repository.get(resume.id)
+  assert repository.connection_pool.idle == 1
+
+
+def test_acquire_times_out_when_every_connection_is_leased(tmp_path):
+  """Callers should get a service error instead of blocking forever on an exhausted pool."""
+  pool = ConnectionPool(str(tmp_path / 'db.sqlite3'), max_size=1, acquire_timeout=0.01)
+
+  with pool.connection(), pytest.raises(ServiceError):
+    pool.acquire()
+
+  pool.close()
+
+
+def test_health_check_reports_closed_pool_as_unhealthy(tmp_path):
+  """The health check should fail once the pool has been shut down."""
+  pool = ConnectionPool(str(tmp_path / 'db.sqlite3'))
+  pool.warm_up()
+
+  assert pool.health_check()
+
+  pool.close()
+
+  assert not pool.health_check()
+  assert pool.size == 0
@@ -0,0 +1,124 @@
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+from pydantic import HttpUrl
+
+from app.clients.scraping import LocalScrapingClient
+from app.clients.scraping.fetch_tiers import fetch_tier_stats
+from app.managers import CrawlCache, crawl_cache_stats, get_connection_pool
+from app.routers.diagnostics_router import get_crawl_diagnostics
+from app.services.config.schemas import AppConfig
+
+pytestmark = pytest.mark.integration
+
+ETAG = '"v1"'
+
+
+class ConditionalHandler(BaseHTTPRequestHandler):
+  def do_GET(self) -> None:
+    status = 304 if self.headers.get('If-None-Match') == ETAG else 200
+    self.send_response(status)
+    self.send_header('ETag', ETAG)
+    self.end_headers()
+
+  def log_message(self, format: str, *args) -> None:
+    pass
+
+
+@pytest.fixture
+def origin_url() -> Iterator[str]:
+  server = ThreadingHTTPServer(('127.0.0.1', 0), ConditionalHandler)
+  thread = threading.Thread(target=server.serve_forever, daemon=True)
+  thread.start()
+  yield f'http://127.0.0.1:{server.server_port}/jobs/1'
+  server.shutdown()
+
+
+@pytest.fixture
+def scraping_client(
+  database_settings: AppConfig, monkeypatch: pytest.MonkeyPatch
+) -> LocalScrapingClient:
+  # Exercise the cache through the browser tier only
+  database_settings.ingestion.http_first_fetch = False
+  client = LocalScrapingClient(database_settings)
+  client.crawled = []  # type: ignore[attr-defined]
+
+  async def fake_crawl(url: HttpUrl, config) -> SimpleNamespace:
+    client.crawled.append(str(url))  # type: ignore[attr-defined]
+    return SimpleNamespace(
+      success=True,
+      markdown=SimpleNamespace(fit_markdown=f'Content of {url}'),
+      screenshot=None,
+      response_headers={'ETag': ETAG},
+    )
+
+  monkeypatch.setattr(client, '_crawl', fake_crawl)
+  crawl_cache_stats.reset()
+  fetch_tier_stats.reset()
+  return client
+
+
+@pytest.mark.anyio
+async def test_equivalent_urls_are_served_from_the_cache(scraping_client: LocalScrapingClient):
+  """A repeat crawl of the same normalized URL should not reach the browser."""
+  first = await scraping_client.crawl(HttpUrl('https://www.example.com/jobs/1?utm_source=x'))
+  second = await scraping_client.crawl(HttpUrl('https://example.com/jobs/1/'))
+
+  assert len(scraping_client.crawled) == 1  # type: ignore[attr-defined]
+  assert second.content == first.content
+  assert (crawl_cache_stats.hits, crawl_cache_stats.misses) == (1, 1)
+
+
+@pytest.mark.anyio
+async def test_crawl_counters_are_reported_by_the_diagnostics_endpoint(
+  scraping_client: LocalScrapingClient, database_settings: AppConfig
+):
+  """The diagnostics route should report cache lookups, what the cache holds and tier wins."""
+  await scraping_client.crawl(HttpUrl('https://example.com/jobs/1'))
+  await scraping_client.crawl(HttpUrl('https://example.com/jobs/1'))
+
+  diagnostics = await get_crawl_diagnostics(database_settings)
+
+  assert (diagnostics.cache.hits, diagnostics.cache.misses) == (1, 1)
+  assert diagnostics.cache.hit_rate == 0.5
+  assert diagnostics.cache.entries == 1
+  assert (diagnostics.fetch_tiers.http, diagnostics.fetch_tiers.browser) == (0, 1)
+
+
+@pytest.mark.anyio
+async def test_expired_pages_are_revalidated_with_their_etag(
+  scraping_client: LocalScrapingClient, origin_url: str, database_settings: AppConfig
+):
+  """An expired entry whose origin answers 304 should be renewed instead of re-crawled."""
+  url = HttpUrl(origin_url)
+  await scraping_client.crawl(url)
+
+  pool = get_connection_pool(database_settings.paths.db_path, database_settings.database)
+  with pool.connection() as conn:
+    conn.execute('UPDATE crawl_cache SET expires_at = 0')
+    conn.commit()
+  await scraping_client.crawl(url)
+
+  assert len(scraping_client.crawled) == 1  # type: ignore[attr-defined]
+  assert crawl_cache_stats.revalidated == 1
+
+
+def test_least_recently_used_pages_are_evicted_past_the_size_budget(
+  database_settings: AppConfig,
+):
+  """Storing past max_bytes should drop the entries read longest ago."""
+  pool = get_connection_pool(database_settings.paths.db_path, database_settings.database)
+  cache = CrawlCache(pool, max_bytes=250)
+  page = [{'url': 'https://example.com', 'content': 'x' * 50, 'screenshot': None}]
+
+  cache.put('https://example.com/a', 'page', page, ttl_seconds=60)
+  cache.put('https://example.com/b', 'page', page, ttl_seconds=60)
+  cache.get('https://example.com/a', 'page')
+  cache.put('https://example.com/c', 'page', page, ttl_seconds=60)
+
+  assert cache.get('https://example.com/b', 'page') is None
+  assert cache.get('https://example.com/a', 'page') is not None
+  assert cache.stats()['entries'] == 2
@@ -0,0 +1,71 @@
+import threading
+
+import pytest
+
+from app.managers import run_in_db_thread
+from app.repositories import ResearchCacheRepository, ResumeRepository
+from app.schemas.resume import Resume
+from app.schemas.template import DEFAULT_TEMPLATE_ID
+from app.services.config.schemas import AppConfig
+from app.utils.errors import NotFoundError
+
+pytestmark = pytest.mark.integration
+
+
+def make_resume() -> Resume:
+  return Resume(template_id=DEFAULT_TEMPLATE_ID, sections=[])
+
+
+@pytest.mark.anyio
+async def test_repository_calls_run_off_the_event_loop_thread(database_settings: AppConfig):
+  """Blocking repository work should execute on a database thread, not the loop thread."""
+  repository = ResumeRepository(settings=database_settings)
+
+  def create_and_report_thread() -> tuple[Resume, str]:
+    return repository.create(make_resume()), threading.current_thread().name
+
+  resume, thread_name = await run_in_db_thread(create_and_report_thread)
+
+  assert thread_name.startswith('atto-db')
+  assert (await run_in_db_thread(repository.get, resume.id)).id == resume.id
+
+
+@pytest.mark.anyio
+async def test_run_in_transaction_commits_writes_across_repositories(database_settings: AppConfig):
+  """Writes to several repositories in one transactional call should share one connection."""
+  resumes = ResumeRepository(settings=database_settings)
+  research_cache = ResearchCacheRepository(database_settings)
+
+  def create_resume_and_cache_entry() -> Resume:
+    resume = resumes.create(make_resume())
+    research_cache.put('salary', resume.id.hex, '{}')
+    assert resumes.connection_pool.idle == resumes.connection_pool.size - 1
+    return resume
+
+  resume = await resumes.run_in_transaction(create_resume_and_cache_entry)
+
+  assert (await run_in_db_thread(resumes.get, resume.id)).id == resume.id
+  assert await run_in_db_thread(research_cache.get, 'salary', resume.id.hex, 60) == '{}'
+
+
+@pytest.mark.anyio
+async def test_run_in_transaction_rolls_back_every_repository_on_error(
+  database_settings: AppConfig,
+):
+  """An exception inside the callable should discard the writes made through each repository."""
+  resumes = ResumeRepository(settings=database_settings)
+  research_cache = ResearchCacheRepository(database_settings)
+  created: list[Resume] = []
+
+  def create_then_fail() -> None:
+    created.append(resumes.create(make_resume()))
+    research_cache.put('salary', created[0].id.hex, '{}')
+    raise RuntimeError('boom')
+
+  with pytest.raises(RuntimeError):
+    await resumes.run_in_transaction(create_then_fail)
+
+  with pytest.raises(NotFoundError):
+    await run_in_db_thread(resumes.get, created[0].id)
+  assert await run_in_db_thread(research_cache.get, 'salary', created[0].id.hex, 60) is None
+  assert resumes.connection_pool.idle == resumes.connection_pool.size
@@ -0,0 +1,92 @@
+import pytest
+
+from app.clients.model import CachedModelClient
+from app.managers import EmbeddingCache, embedding_text_hash, get_connection_pool
+from app.managers.embedding_cache import TOUCH_INTERVAL_SECONDS
+from app.services.config.schemas import AppConfig
+from app.utils.errors import ServiceError
+from tests.fakes.model_client import FakeModelClient
+
+pytestmark = pytest.mark.integration
+
+MODEL_KEY = 'openai:text-embedding-3-small'
+
+
+@pytest.fixture
+def embedding_cache(database_settings: AppConfig) -> EmbeddingCache:
+  pool = get_connection_pool(database_settings.paths.db_path, database_settings.database)
+  return EmbeddingCache(pool, max_entries=3)
+
+
+@pytest.fixture
+def model_client() -> FakeModelClient:
+  client = FakeModelClient()
+  for index, text in enumerate(['alpha', 'beta', 'gamma', 'delta']):
+    client.set_embedding(text, [float(index), 0.5])
+  return client
+
+
+@pytest.mark.anyio
+async def test_repeat_embeddings_are_served_without_calling_the_provider(
+  embedding_cache: EmbeddingCache, model_client: FakeModelClient
+):
+  """Only texts missing from the cache should reach the provider, each exactly once."""
+  client = CachedModelClient(model_client, embedding_cache, MODEL_KEY)
+
+  first = await client.embed(['alpha', 'beta', 'alpha'])
+  second = await client.embed(['beta', 'gamma', 'alpha'])
+  third = await client.embed(['gamma', 'alpha'])
+
+  assert [call.texts for call in model_client.embedding_calls] == [['alpha', 'beta'], ['gamma']]
+  assert first == [[0.0, 0.5], [1.0, 0.5], [0.0, 0.5]]
+  assert second == [[1.0, 0.5], [2.0, 0.5], [0.0, 0.5]]
+  assert third == [[2.0, 0.5], [0.0, 0.5]]
+
+
+@pytest.mark.anyio
+async def test_cache_entries_are_scoped_to_the_embedding_model(
+  embedding_cache: EmbeddingCache, model_client: FakeModelClient
+):
+  """Switching embedding models should not reuse vectors from the previous model."""
+  await CachedModelClient(model_client, embedding_cache, MODEL_KEY).embed(['alpha'])
+  await CachedModelClient(model_client, embedding_cache, 'gemini:other').embed(['alpha'])
+
+  assert len(model_client.embedding_calls) == 2
+
+
+def test_least_recently_used_entries_are_evicted(embedding_cache: EmbeddingCache):
+  """Growing past max_entries should drop the entries read longest ago."""
+  hashes = {text: embedding_text_hash(text) for text in ['alpha', 'beta', 'gamma', 'delta']}
+  embedding_cache.put_many(MODEL_KEY, {hashes['alpha']: [0.0], hashes['beta']: [1.0]})
+  embedding_cache.put_many(MODEL_KEY, {hashes['gamma']: [2.0]})
+  # Recency is only refreshed for entries not read within the touch interval
+  with embedding_cache.pool.connection() as conn:
+    conn.execute(
+      'UPDATE embedding_cache SET last_used_at = last_used_at - ?', (TOUCH_INTERVAL_SECONDS,)
+    )
+    conn.commit()
+  embedding_cache.get_many(MODEL_KEY, [hashes['alpha']])
+
+  embedding_cache.put_many(MODEL_KEY, {hashes['delta']: [3.0]})
+
+  cached = embedding_cache.get_many(MODEL_KEY, list(hashes.values()))
+  assert set(cached) == {hashes['alpha'], hashes['gamma'], hashes['delta']}
+
+
+class BrokenEmbeddingCache(EmbeddingCache):
+  def get_many(self, model_key: str, text_hashes: list[str]) -> dict[str, list[float]]:
+    raise ServiceError()
+
+  def put_many(self, model_key: str, embeddings: dict[str, list[float]]) -> None:
+    raise ServiceError()
+
+
+@pytest.mark.anyio
+async def test_cache_failures_fall_back_to_the_provider(
+  embedding_cache: EmbeddingCache, model_client: FakeModelClient
+):
+  """A cache that cannot be read or written should not fail the embedding call."""
+  client = CachedModelClient(model_client, BrokenEmbeddingCache(embedding_cache.pool), MODEL_KEY)
+
+  assert await client.embed(['alpha', 'beta']) == [[0.0, 0.5], [1.0, 0.5]]
+  assert [call.texts for call in model_client.embedding_calls] == [['alpha', 'beta']]
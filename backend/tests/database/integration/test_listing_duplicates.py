@@ -0,0 +1,49 @@
+import pytest
+
+from app.repositories import ListingRepository
+from app.services.config.schemas import AppConfig
+from app.utils.deduplication import fuzzy_text_similarities, fuzzy_text_similarity
+from tests.fakes.model_client import FakeModelClient
+from tests.listing_draft.factories import make_listing
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture
+def listing_repository(database_settings: AppConfig) -> ListingRepository:
+  return ListingRepository(model_client=FakeModelClient(), settings=database_settings)
+
+
+def test_bulk_similarities_match_pairwise_similarity():
+  """The vectorized scorer should agree with the pairwise scorer it replaces."""
+  candidates = ['Backend  Engineer', 'backend engineer II', 'Designer', '']
+
+  assert fuzzy_text_similarities('Backend Engineer', candidates) == pytest.approx(
+    [fuzzy_text_similarity('Backend Engineer', candidate) for candidate in candidates]
+  )
+
+
+def test_heuristic_candidates_are_blocked_by_company_and_ranked(
+  listing_repository: ListingRepository,
+):
+  """Only listings at a similar company should match, best combined score first."""
+  exact = listing_repository.seed(
+    make_listing(url='https://example.com/jobs/1', title='Backend Engineer', company='Example Co')
+  )
+  close = listing_repository.seed(
+    make_listing(url='https://example.com/jobs/2', title='Backend Engineers', company='Example Co.')
+  )
+  listing_repository.seed(
+    make_listing(url='https://other.com/jobs/1', title='Backend Engineer', company='Other Corp')
+  )
+  listing_repository.seed(
+    make_listing(url='https://example.com/jobs/3', title='Office Manager', company='Example Co')
+  )
+
+  matches = listing_repository.find_heuristic_duplicate_candidates(
+    make_listing(title='Backend Engineer', company='Example Co')
+  )
+
+  assert [listing.id for listing, _ in matches] == [exact.id, close.id]
+  assert matches[0][1] == pytest.approx(1.0)
+  assert matches[0][0].description == exact.description
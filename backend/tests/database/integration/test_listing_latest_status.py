@@ -0,0 +1,82 @@
+import sqlite3
+from datetime import date
+from uuid import uuid4
+
+import pytest
+
+from app.db_init import create_tables
+from app.repositories import ApplicationRepository, ListingRepository
+from app.schemas.application import (
+  Application,
+  StatusEnum,
+  StatusEventApplied,
+  StatusEventRejected,
+)
+from app.services.config.schemas import AppConfig
+from tests.fakes.model_client import FakeModelClient
+from tests.listing_draft.factories import make_listing
+
+pytestmark = pytest.mark.integration
+
+
+def latest_status_rows(db_path: str) -> list[tuple[str, str, str]]:
+  with sqlite3.connect(db_path) as db:
+    return db.execute(
+      'SELECT listing_id, status, date FROM listing_latest_status ORDER BY listing_id'
+    ).fetchall()
+
+
+def test_status_event_changes_update_the_listing_summary(database_settings: AppConfig):
+  """Creating, editing and deleting events should keep list_all status filters current."""
+  listing_repository = ListingRepository(model_client=FakeModelClient(), settings=database_settings)
+  application_repository = ApplicationRepository(settings=database_settings)
+  listing = listing_repository.seed(make_listing())
+  application = application_repository.create(
+    Application(listing_id=listing.id, resume_id=uuid4(), name='Backend Engineer')
+  )
+
+  def summary_status(status: list[StatusEnum] | None = None) -> list[StatusEnum | None]:
+    page = listing_repository.list_all(1, 10, status=status)
+    return [item.current_status for item in page.items]
+
+  assert summary_status() == [StatusEnum.SAVED]
+
+  applied = StatusEventApplied(date=date(2030, 1, 1))
+  application_repository.create_event(applied, application.id)
+  assert summary_status([StatusEnum.APPLIED]) == [StatusEnum.APPLIED]
+  assert summary_status([StatusEnum.SAVED]) == []
+
+  application_repository.update_event(StatusEventRejected(id=applied.id, date=date(2030, 1, 2)))
+  assert summary_status([StatusEnum.REJECTED]) == [StatusEnum.REJECTED]
+
+  application_repository.delete_event(applied.id)
+  assert summary_status() == [StatusEnum.SAVED]
+
+
+def test_migration_backfills_latest_status_for_existing_events(tmp_path):
+  """Upgrading should materialize the latest event for listings saved before the table existed."""
+  db_path = str(tmp_path / 'db.sqlite3')
+  create_tables(db_path)
+  with sqlite3.connect(db_path) as db:
+    db.execute('DROP TABLE listing_latest_status')
+    db.execute('PRAGMA user_version = 3')
+    db.execute(
+      'INSERT INTO listings (id, url, title, company, domain, description) '
+      "VALUES ('listing', 'https://example.com/jobs/1', 'Engineer', 'Co', 'co.com', 'Desc')"
+    )
+    db.execute(
+      'INSERT INTO applications (id, listing_id, name, resume_id, current_status, '
+      "last_status_at) VALUES ('application', 'listing', 'Engineer', 'resume', 'applied', "
+      "'2030-01-02')"
+    )
+    db.executemany(
+      'INSERT INTO status_events (id, application_id, status, date) VALUES (?, ?, ?, ?)',
+      [
+        ('saved', 'application', 'saved', '2030-01-01'),
+        ('applied', 'application', 'applied', '2030-01-02'),
+      ],
+    )
+
+  create_tables(db_path)
+
+  assert latest_status_rows(db_path) == [('listing', 'applied', '2030-01-02')]
@@ -0,0 +1,89 @@
+import sqlite3
+from datetime import date
+from uuid import uuid4
+
+import pytest
+
+from app.repositories import ApplicationRepository, ListingRepository
+from app.schemas.application import Application
+from app.services.config.schemas import AppConfig
+from app.utils.errors import ValidationError
+from tests.fakes.model_client import FakeModelClient
+from tests.listing_draft.factories import make_listing
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture
+def listing_repository(database_settings: AppConfig) -> ListingRepository:
+  repository = ListingRepository(model_client=FakeModelClient(), settings=database_settings)
+  application_repository = ApplicationRepository(settings=database_settings)
+
+  for index in range(7):
+    listing = make_listing(
+      url=f'https://example.com/jobs/{index}',
+      # Repeated titles and companies exercise the id tiebreaker
+      title=f'Engineer {index % 3}',
+      company=f'Company {index % 2}',
+    )
+    # Leave some posted dates and statuses empty to cover NULL sort keys
+    if index % 3:
+      listing.posted_date = date(2030, 1, index)
+    repository.seed(listing)
+    if index % 2:
+      application_repository.create(
+        Application(listing_id=listing.id, resume_id=uuid4(), name=listing.title)
+      )
+
+  return repository
+
+
+@pytest.mark.parametrize('sort_by', [None, 'title', 'company', 'posted_at', 'last_status_at'])
+@pytest.mark.parametrize('sort_dir', ['asc', 'desc'])
+def test_cursor_pages_match_offset_order(listing_repository: ListingRepository, sort_by, sort_dir):
+  """Walking every cursor page should yield the offset ordering with no gaps or repeats."""
+  expected = [
+    item.id
+    for item in listing_repository.list_all(1, 100, sort_by=sort_by, sort_dir=sort_dir).items
+  ]
+
+  seen = []
+  cursor = None
+  while True:
+    page = listing_repository.list_all_by_cursor(3, cursor, sort_by=sort_by, sort_dir=sort_dir)
+    seen.extend(item.id for item in page.items)
+    cursor = page.next_cursor
+    if cursor is None:
+      break
+
+  assert seen == expected
+
+
+def test_cursor_total_is_only_counted_on_request(listing_repository: ListingRepository):
+  """The total count should be skipped unless include_total is set."""
+  assert listing_repository.list_all_by_cursor(3).total is None
+  assert listing_repository.list_all_by_cursor(3, include_total=True).total == 7
+
+
+def test_cursor_from_another_query_is_rejected(listing_repository: ListingRepository):
+  """A cursor issued for one sort order should not be accepted for another."""
+  cursor = listing_repository.list_all_by_cursor(3, sort_by='title').next_cursor
+
+  with pytest.raises(ValidationError):
+    listing_repository.list_all_by_cursor(3, cursor, sort_by='company')
+  with pytest.raises(ValidationError):
+    listing_repository.list_all_by_cursor(3, 'not-a-cursor')
+
+
+def test_title_sort_is_served_by_the_composite_index(database_settings: AppConfig):
+  """Seeking by title should walk the (title, id) index instead of sorting the table."""
+  with sqlite3.connect(database_settings.paths.db_path) as db:
+    plan = db.execute(
+      'EXPLAIN QUERY PLAN SELECT id FROM listings l '
+      'WHERE (l.title, l.id) > (?, ?) ORDER BY l.title, l.id LIMIT 10',
+      ('Engineer', ''),
+    ).fetchall()
+
+  details = ' '.join(row[-1] for row in plan)
+  assert 'idx_listings_title_id' in details
+  assert 'TEMP B-TREE' not in details
@@ -0,0 +1,113 @@
+import sqlite3
+
+import pytest
+
+from app.db_init import rebuild_search_index
+from app.repositories import ListingRepository
+from app.services.config.schemas import AppConfig
+from tests.fakes.model_client import FakeModelClient
+from tests.listing_draft.factories import make_listing
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture
+def listing_repository(database_settings: AppConfig) -> ListingRepository:
+  return ListingRepository(model_client=FakeModelClient(), settings=database_settings)
+
+
+def search_titles(repository: ListingRepository, search: str) -> list[str]:
+  page = repository.list_all(1, 10, search=search)
+  return [listing.title for listing in page.items]
+
+
+def test_search_prefix_matches_description_skills_and_requirements(
+  listing_repository: ListingRepository,
+):
+  """Search should prefix-match every text field, not only title, company and domain."""
+  listing_repository.seed(
+    make_listing(
+      url='https://example.com/jobs/1',
+      title='Platform Engineer',
+      description='Own our Kubernetes clusters.',
+      skills=['Terraform'],
+      requirements=['On-call rotation experience.'],
+    )
+  )
+  listing_repository.seed(make_listing(url='https://example.com/jobs/2', title='Designer'))
+
+  assert search_titles(listing_repository, 'kube') == ['Platform Engineer']
+  assert search_titles(listing_repository, 'terra') == ['Platform Engineer']
+  assert search_titles(listing_repository, 'on-call rot') == ['Platform Engineer']
+  assert listing_repository.list_all(1, 10, search='kube').total == 1
+
+
+def test_search_ranks_title_matches_above_description_matches(
+  listing_repository: ListingRepository,
+):
+  """Without an explicit sort, results should be ordered by weighted bm25 relevance."""
+  listing_repository.seed(
+    make_listing(
+      url='https://example.com/jobs/1',
+      title='Backend Engineer',
+      description='Work alongside the data team on pipelines.',
+    )
+  )
+  listing_repository.seed(
+    make_listing(
+      url='https://example.com/jobs/2',
+      title='Data Engineer',
+      description='Build backend services.',
+    )
+  )
+
+  assert search_titles(listing_repository, 'data') == ['Data Engineer', 'Backend Engineer']
+
+
+def test_search_index_follows_updates_and_deletes(listing_repository: ListingRepository):
+  """Triggers should keep the index in sync when listings are edited or removed."""
+  listing = listing_repository.seed(make_listing(title='Platform Engineer'))
+
+  listing_repository.execute(
+    'UPDATE listings SET title = ? WHERE id = ?', ('Frontend Engineer', str(listing.id))
+  )
+  assert search_titles(listing_repository, 'platform') == []
+  assert search_titles(listing_repository, 'frontend') == ['Frontend Engineer']
+
+  listing_repository.execute('DELETE FROM listings WHERE id = ?', (str(listing.id),))
+  assert search_titles(listing_repository, 'frontend') == []
+
+
+def test_rebuild_search_index_restores_an_out_of_sync_index(
+  listing_repository: ListingRepository, database_settings: AppConfig
+):
+  """The rebuild command should repopulate the index from the listings table."""
+  listing_repository.seed(make_listing(title='Backend Engineer'))
+  conn = sqlite3.connect(database_settings.paths.db_path)
+  with conn:
+    conn.execute("INSERT INTO listings_fts (listings_fts) VALUES ('delete-all')")
+  conn.close()
+  assert search_titles(listing_repository, 'backend') == []
+
+  rebuild_search_index(database_settings.paths.db_path)
+
+  assert search_titles(listing_repository, 'backend') == ['Backend Engineer']
+
+
+def test_search_keeps_plus_and_hash_in_terms(listing_repository: ListingRepository):
+  """Language names like C++ and C# should not be searched as the bare letter C."""
+  listing_repository.seed(make_listing(url='https://example.com/jobs/1', title='C++ Engineer'))
+  listing_repository.seed(make_listing(url='https://example.com/jobs/2', title='C# Developer'))
+  listing_repository.seed(make_listing(url='https://example.com/jobs/3', title='C Developer'))
+
+  assert search_titles(listing_repository, 'c++') == ['C++ Engineer']
+  assert search_titles(listing_repository, 'C#') == ['C# Developer']
+
+
+def test_search_without_words_matches_literally(listing_repository: ListingRepository):
+  """Input made only of punctuation should fall back to a literal match, not to no filter."""
+  listing_repository.seed(make_listing(url='https://example.com/jobs/1', title='C++ Engineer'))
+  listing_repository.seed(make_listing(url='https://example.com/jobs/2', title='Designer'))
+
+  assert search_titles(listing_repository, '++') == ['C++ Engineer']
+  assert listing_repository.list_all(1, 10, search='"*(').total == 0
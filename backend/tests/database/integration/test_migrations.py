@@ -0,0 +1,132 @@
+import sqlite3
+
+import pytest
+
+from app.db_init import create_tables
+from app.migrations import LATEST_SCHEMA_VERSION, Migration, get_schema_version, run_migrations
+from app.repositories.application_repository import APPLICATION_WITH_EVENTS_QUERY
+from app.utils.errors import ConfigurationError
+
+pytestmark = pytest.mark.integration
+
+LEGACY_LISTING_ID = 'legacy-listing'
+
+
+def create_legacy_database(db_path: str) -> None:
+  """Recreate a database written before migrations existed (user_version 0, no indexes)."""
+  with sqlite3.connect(db_path) as db:
+    db.execute(
+      'CREATE TABLE listings (id TEXT PRIMARY KEY, url TEXT NOT NULL UNIQUE, '
+      'title TEXT NOT NULL, company TEXT NOT NULL, domain TEXT NOT NULL, location TEXT, '
+      'description TEXT NOT NULL, notes TEXT, research JSON, posted_date TEXT, salary JSON, '
+      'skills TEXT, requirements TEXT, keywords JSON)'
+    )
+    db.execute(
+      'CREATE TABLE applications (id TEXT PRIMARY KEY, listing_id TEXT NOT NULL, '
+      'name TEXT NOT NULL, resume_id TEXT NOT NULL, analysis JSON, '
+      'current_status TEXT NOT NULL, last_status_at TEXT NOT NULL)'
+    )
+    db.execute(
+      'INSERT INTO listings (id, url, title, company, domain, description) '
+      "VALUES (?, 'https://example.com/jobs/1', 'Engineer', 'Example Co', 'example.com', 'Desc')",
+      (LEGACY_LISTING_ID,),
+    )
+
+
+def index_names(db_path: str) -> set[str]:
+  with sqlite3.connect(db_path) as db:
+    rows = db.execute("SELECT name FROM sqlite_master WHERE type = 'index'").fetchall()
+  return {row[0] for row in rows}
+
+
+def test_fresh_database_is_created_at_the_latest_version(tmp_path):
+  """A new database should get every table and index and record the latest version."""
+  db_path = str(tmp_path / 'db.sqlite3')
+
+  create_tables(db_path)
+
+  with sqlite3.connect(db_path) as db:
+    assert get_schema_version(db) == LATEST_SCHEMA_VERSION
+  assert 'idx_applications_listing_id' in index_names(db_path)
+
+
+def test_legacy_database_is_upgraded_in_place(tmp_path):
+  """Databases from before the migration engine should keep their rows and gain indexes."""
+  db_path = str(tmp_path / 'db.sqlite3')
+  create_legacy_database(db_path)
+
+  create_tables(db_path)
+
+  with sqlite3.connect(db_path) as db:
+    assert get_schema_version(db) == LATEST_SCHEMA_VERSION
+    assert db.execute('SELECT id FROM listings').fetchall() == [(LEGACY_LISTING_ID,)]
+    assert db.execute('SELECT COUNT(*) FROM status_events').fetchone() == (0,)
+  assert {'idx_applications_resume_id', 'idx_status_events_application_id_date'} <= index_names(
+    db_path
+  )
+
+
+def test_application_lookup_by_listing_uses_the_listing_index(tmp_path):
+  """get_by_listing_id should search the index instead of scanning every application."""
+  db_path = str(tmp_path / 'db.sqlite3')
+  create_tables(db_path)
+
+  with sqlite3.connect(db_path) as db:
+    plan = db.execute(
+      f'EXPLAIN QUERY PLAN {APPLICATION_WITH_EVENTS_QUERY} WHERE a.listing_id = ? GROUP BY a.id',
+      ('listing',),
+    ).fetchall()
+
+  details = ' '.join(row[-1] for row in plan)
+  assert 'idx_applications_listing_id' in details
+
+
+def test_migrations_only_apply_pending_versions(tmp_path):
+  """Re-running migrations should skip versions that were already recorded."""
+  applied: list[int] = []
+  migrations = [
+    Migration(version=1, description='one', apply=lambda _conn: applied.append(1)),
+    Migration(version=2, description='two', apply=lambda _conn: applied.append(2)),
+  ]
+  db = sqlite3.connect(tmp_path / 'db.sqlite3')
+
+  run_migrations(db, migrations[:1])
+  run_migrations(db, migrations)
+  run_migrations(db, migrations)
+
+  assert applied == [1, 2]
+  assert get_schema_version(db) == 2
+  db.close()
+
+
+def test_failed_migration_rolls_back_and_keeps_the_previous_version(tmp_path):
+  """A failing step should leave neither partial schema changes nor a bumped version."""
+
+  def fail(_conn: sqlite3.Connection) -> None:
+    raise RuntimeError('boom')
+
+  migrations = [
+    Migration(version=1, description='create', statements=('CREATE TABLE a (id TEXT)',)),
+    Migration(
+      version=2, description='broken', statements=('CREATE TABLE b (id TEXT)',), apply=fail
+    ),
+  ]
+  db = sqlite3.connect(tmp_path / 'db.sqlite3')
+
+  with pytest.raises(RuntimeError):
+    run_migrations(db, migrations)
+
+  tables = {row[0] for row in db.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+  assert tables == {'a'}
+  assert get_schema_version(db) == 1
+  db.close()
+
+
+def test_database_from_a_newer_version_is_rejected(tmp_path):
+  """Atto should refuse to run against a schema it does not know how to read."""
+  db = sqlite3.connect(tmp_path / 'db.sqlite3')
+  db.execute(f'PRAGMA user_version = {LATEST_SCHEMA_VERSION + 1}')
+
+  with pytest.raises(ConfigurationError):
+    run_migrations(db)
+  db.close()
@@ -0,0 +1,34 @@
+import pytest
+
+from app.repositories import ResearchCacheRepository
+from app.services.config.schemas import AppConfig
+from app.services.listing.research_keys import research_cache_key
+from tests.listing_draft.factories import make_listing
+
+pytestmark = pytest.mark.integration
+
+HOUR = 3600
+
+
+def test_research_cache_only_returns_results_within_the_staleness_window(
+  database_settings: AppConfig,
+) -> None:
+  """Stored research is returned while fresh and ignored once older than the window."""
+  repository = ResearchCacheRepository(database_settings)
+  repository.put('sentiment', 'example co', '{"value": 0.7}')
+
+  assert repository.get('sentiment', 'example co', max_age_seconds=HOUR) == '{"value": 0.7}'
+  assert repository.get('salary', 'example co', max_age_seconds=HOUR) is None
+
+  repository.execute('UPDATE research_cache SET generated_at = generated_at - ?', (2 * HOUR,))
+  assert repository.get('sentiment', 'example co', max_age_seconds=HOUR) is None
+
+
+def test_research_cache_keys_normalize_company_and_depend_on_stage_inputs() -> None:
+  """Company suffixes and casing are ignored; salary also keys on title and location."""
+  listing = make_listing(company='ACME, Inc.', title='Backend Engineer')
+  other_role = make_listing(company='Acme', title='Data Engineer')
+
+  assert research_cache_key('sentiment', listing) == research_cache_key('sentiment', other_role)
+  assert research_cache_key('salary', listing) != research_cache_key('salary', other_role)
+  assert research_cache_key('salary', listing) == 'acme|backend engineer|'
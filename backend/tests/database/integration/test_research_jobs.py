@@ -0,0 +1,158 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.repositories import ResearchJobRepository
+from app.schemas.task_status import TaskStatus
+from app.services.config.schemas import AppConfig, IngestionPrefs
+from app.services.listing import ResearchQueue
+from tests.fakes import FakeListingRepository
+
+pytestmark = pytest.mark.integration
+
+
+def insert_listing(repository: ResearchJobRepository, company: str) -> UUID:
+  listing_id = uuid4()
+  repository.execute(
+    """
+    INSERT INTO listings (id, url, title, company, domain, description)
+    VALUES (?, ?, 'Backend Engineer', ?, 'example.com', 'Build APIs.')
+    """,
+    (str(listing_id), f'https://example.com/jobs/{listing_id}', company),
+  )
+  return listing_id
+
+
+@dataclass
+class RecordingListingService:
+  listing_repository: FakeListingRepository = field(default_factory=FakeListingRepository)
+  companies: dict[UUID, str] = field(default_factory=dict)
+  running: list[str] = field(default_factory=list)
+  overlapping_companies: bool = False
+  researched: list[UUID] = field(default_factory=list)
+  session_tokens: dict[UUID, str | None] = field(default_factory=dict)
+
+  async def generate_research_task(self, listing_id: UUID, session_token: str | None = None):
+    self.session_tokens[listing_id] = session_token
+    company = self.companies[listing_id]
+    self.overlapping_companies |= company in self.running
+    self.running.append(company)
+    await asyncio.sleep(0.02)
+    self.running.remove(company)
+    self.researched.append(listing_id)
+    self.listing_repository.set_research_status(listing_id, TaskStatus.SUCCEEDED)
+
+
+def test_jobs_are_claimed_by_priority_one_company_at_a_time(database_settings: AppConfig):
+  """Lower priorities go first, and a company's second job waits for its first to finish."""
+  repository = ResearchJobRepository(database_settings)
+  acme_one, acme_two, globex = (
+    insert_listing(repository, 'Acme Inc.'),
+    insert_listing(repository, 'ACME'),
+    insert_listing(repository, 'Globex'),
+  )
+  repository.enqueue([acme_one, acme_two], priority=0)
+  repository.enqueue([globex], priority=5)
+
+  first = repository.claim_next()
+  second = repository.claim_next()
+
+  assert first is not None and first.listing_id == acme_one
+  assert second is not None and second.listing_id == globex
+  assert repository.claim_next() is None
+
+  repository.finish(acme_one, TaskStatus.SUCCEEDED)
+  third = repository.claim_next()
+  assert third is not None and third.listing_id == acme_two
+
+  # Re-queueing leaves the running job alone and only reports the others as pending
+  _, queued = repository.enqueue([acme_one, acme_two])
+  assert queued == [acme_one]
+
+
+def test_concurrent_claims_never_start_two_jobs_for_one_company(database_settings: AppConfig):
+  """Workers claiming at once on separate connections still respect one job per company."""
+  repository = ResearchJobRepository(database_settings)
+  repository.enqueue([insert_listing(repository, 'Acme') for _ in range(8)])
+
+  with ThreadPoolExecutor(max_workers=8) as executor:
+    claims = list(executor.map(lambda _: repository.claim_next(), range(8)))
+
+  assert sum(claim is not None for claim in claims) == 1
+
+
+def test_interrupted_jobs_are_requeued_until_they_run_out_of_attempts(
+  database_settings: AppConfig,
+):
+  """Jobs left running by a restart go back to the queue, but not forever."""
+  repository = ResearchJobRepository(database_settings)
+  listing_id = insert_listing(repository, 'Initech')
+  batch_id, _ = repository.enqueue([listing_id])
+
+  for _ in range(3):
+    assert repository.claim_next() is not None
+    assert repository.requeue_interrupted() == 1
+
+  progress = repository.get_progress(batch_id)
+  assert (progress.total, progress.failed, progress.pending) == (1, 1, 0)
+
+
+@pytest.mark.anyio
+async def test_research_queue_drains_a_batch_and_reports_progress(database_settings: AppConfig):
+  """Queued listings are all researched, never two from one company at once."""
+  settings = database_settings.model_copy(
+    update={'ingestion': IngestionPrefs(research_queue_concurrency=3)}
+  )
+  repository = ResearchJobRepository(settings)
+  service = RecordingListingService()
+  for company in ('Acme', 'Acme, Inc.', 'Globex', 'Initech'):
+    service.companies[insert_listing(repository, company)] = company.split(',')[0].lower()
+  batch_id, _ = repository.enqueue(list(service.companies))
+  queue = ResearchQueue(build_service=lambda _: service)  # type: ignore[arg-type, return-value]
+
+  queue.wake(settings, batch_id)
+  await queue.join()
+
+  progress = repository.get_progress(batch_id)
+  assert (progress.total, progress.succeeded) == (4, 4)
+  assert sorted(map(str, service.researched)) == sorted(map(str, service.companies))
+  assert not service.overlapping_companies
+  assert queue.active_workers == 0
+
+
+@pytest.mark.anyio
+async def test_batch_queued_while_the_last_worker_finds_the_queue_empty_still_runs(
+  database_settings: AppConfig, monkeypatch: pytest.MonkeyPatch
+):
+  """A wake that lands during a worker's empty claim keeps it working, with the new session."""
+  repository = ResearchJobRepository(database_settings)
+  service = RecordingListingService()
+  first, second = insert_listing(repository, 'Acme'), insert_listing(repository, 'Globex')
+  service.companies.update({first: 'acme', second: 'globex'})
+  first_batch, _ = repository.enqueue([first])
+  queue = ResearchQueue(build_service=lambda _: service)  # type: ignore[arg-type, return-value]
+  loop = asyncio.get_running_loop()
+  claim_next = ResearchJobRepository.claim_next
+  queued_during_claim = False
+
+  def claim_then_queue_another_batch(self: ResearchJobRepository):
+    nonlocal queued_during_claim
+    job = claim_next(self)
+    if job is None and not queued_during_claim:
+      # The router commits a batch and wakes the queue while this claim is coming back empty
+      queued_during_claim = True
+      second_batch, _ = self.enqueue([second])
+      loop.call_soon_threadsafe(queue.wake, database_settings, second_batch, 'second-token')
+    return job
+
+  monkeypatch.setattr(ResearchJobRepository, 'claim_next', claim_then_queue_another_batch)
+
+  queue.wake(database_settings, first_batch, 'first-token')
+  await queue.join()
+
+  assert service.session_tokens == {first: 'first-token', second: 'second-token'}
+  assert not repository.has_pending()
+  assert queue.active_workers == 0
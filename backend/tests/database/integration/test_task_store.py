@@ -0,0 +1,41 @@
+from uuid import uuid4
+
+import pytest
+
+from app.managers import SQLiteTaskStore, get_connection_pool, task_stores
+from app.repositories import ListingRepository
+from app.schemas.task_status import TaskStatus, TaskStatusEntry
+from app.services.config.schemas import AppConfig, DatabasePrefs
+from tests.fakes.model_client import FakeModelClient
+
+pytestmark = pytest.mark.integration
+
+
+def test_sqlite_task_store_round_trips_entries_within_its_limit(database_settings: AppConfig):
+  """Statuses are read back from the database, keeping only the newest past the limit."""
+  pool = get_connection_pool(database_settings.paths.db_path, database_settings.database)
+  store = SQLiteTaskStore(pool, ttl_seconds=3600, max_entries=2)
+
+  for key in ('a', 'b', 'c'):
+    store.set(
+      'research', key, TaskStatusEntry(status=TaskStatus.RUNNING, stages={'market': 'running'})
+    )
+
+  assert store.get('research', 'a') is None
+  entry = store.get('research', 'c')
+  assert entry is not None and entry.stages == {'market': TaskStatus.RUNNING}
+
+
+def test_repositories_share_task_state_through_the_sqlite_store(
+  database_settings: AppConfig, fake_model_client: FakeModelClient
+):
+  """A status written by one repository instance is visible to a fresh one."""
+  settings = database_settings.model_copy(update={'database': DatabasePrefs(task_store='sqlite')})
+  listing_id = uuid4()
+  ListingRepository(fake_model_client, settings).set_research_status(listing_id, TaskStatus.PENDING)
+
+  entry = ListingRepository(fake_model_client, settings).get_research_status(listing_id)
+
+  assert isinstance(task_stores.get_store(settings), SQLiteTaskStore)
+  assert entry is not None and entry.status == TaskStatus.PENDING
+  assert entry.created_at is not None
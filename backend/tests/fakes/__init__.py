@@ -1,3 +1,4 @@
+from .analysis_cache_repository import FakeAnalysisCacheRepository
 from .application_repository import FakeApplicationRepository
 from .listing_repository import FakeListingRepository
 from .listing_research_client import FakeListingResearchClient
@@ -7,15 +8,20 @@ from .model_client import (
   StructuredModelCall,
   UnstructuredModelCall,
 )
+from .research_cache_repository import FakeResearchCacheRepository
 from .scraping_client import FakeScrapingClient
+from .screenshot_repository import FakeScreenshotRepository
 
 __all__ = [
   'EmbeddingModelCall',
+  'FakeAnalysisCacheRepository',
   'FakeApplicationRepository',
-  'FakeModelClient',
   'FakeListingRepository',
   'FakeListingResearchClient',
+  'FakeModelClient',
+  'FakeResearchCacheRepository',
   'FakeScrapingClient',
+  'FakeScreenshotRepository',
   'StructuredModelCall',
   'UnstructuredModelCall',
 ]
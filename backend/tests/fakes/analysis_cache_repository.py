@@ -0,0 +1,32 @@
+from dataclasses import dataclass, field
+
+from app.repositories import AnalysisCacheRepository
+from app.repositories.analysis_cache_repository import AnalysisCacheKind
+
+
+@dataclass
+class FakeAnalysisCacheRepository(AnalysisCacheRepository):
+  entries: dict[tuple[str, str, str, str], float] = field(default_factory=dict)
+
+  def get_scores(
+    self,
+    kind: AnalysisCacheKind,
+    model_id: str,
+    scope_hash: str,
+    item_keys: list[str],
+  ) -> dict[str, float]:
+    return {
+      key: self.entries[(kind, model_id, scope_hash, key)]
+      for key in item_keys
+      if (kind, model_id, scope_hash, key) in self.entries
+    }
+
+  def put_scores(
+    self,
+    kind: AnalysisCacheKind,
+    model_id: str,
+    scope_hash: str,
+    scores: dict[str, float],
+  ) -> None:
+    for key, score in scores.items():
+      self.entries[(kind, model_id, scope_hash, key)] = score
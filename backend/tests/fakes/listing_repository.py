@@ -1,19 +1,31 @@
 from dataclasses import dataclass, field
+from uuid import UUID
 
 from pydantic import HttpUrl
 
 from app.repositories import ListingRepository
 from app.schemas.listing import Listing
+from app.services.config.schemas import AppConfig
 
 
 @dataclass
 class FakeListingRepository(ListingRepository):
+  settings: AppConfig = field(default_factory=AppConfig)
   listings_by_url: dict[str, Listing] = field(default_factory=dict)
   semantic_candidates: list[tuple[Listing, float]] = field(default_factory=list)
   heuristic_candidates: list[tuple[Listing, float]] = field(default_factory=list)
   get_by_url_calls: list[HttpUrl] = field(default_factory=list)
   semantic_duplicate_calls: list[Listing] = field(default_factory=list)
   heuristic_duplicate_calls: list[Listing] = field(default_factory=list)
+  listings_by_id: dict[UUID, Listing] = field(default_factory=dict)
+  research_updates: dict[UUID, str | None] = field(default_factory=dict)
+
+  def get(self, listing_id: UUID) -> Listing:
+    return self.listings_by_id[listing_id]
+
+  def update_research(self, listing_id: UUID, research_json: str | None) -> Listing:
+    self.research_updates[listing_id] = research_json
+    return self.listings_by_id[listing_id]
 
   def get_by_url(self, url: HttpUrl) -> Listing | None:
     self.get_by_url_calls.append(url)
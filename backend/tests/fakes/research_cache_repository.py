@@ -0,0 +1,14 @@
+from dataclasses import dataclass, field
+
+from app.repositories import ResearchCacheRepository
+
+
+@dataclass
+class FakeResearchCacheRepository(ResearchCacheRepository):
+  entries: dict[tuple[str, str], str] = field(default_factory=dict)
+
+  def get(self, stage: str, cache_key: str, max_age_seconds: float) -> str | None:
+    return self.entries.get((stage, cache_key))
+
+  def put(self, stage: str, cache_key: str, payload: str) -> None:
+    self.entries[(stage, cache_key)] = payload
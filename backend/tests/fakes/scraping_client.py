@@ -11,7 +11,7 @@ class FakeScrapingClient(ScrapingClient):
   crawl_responses: list[CrawlResult | Exception] = field(default_factory=list)
   crawl_calls: list[HttpUrl] = field(default_factory=list)
 
-  async def crawl(self, url: HttpUrl) -> CrawlResult:
+  async def crawl(self, url: HttpUrl, screenshot: bool = False) -> CrawlResult:
     self.crawl_calls.append(url)
     if not self.crawl_responses:
       raise AssertionError('No fake crawl response queued.')
@@ -0,0 +1,13 @@
+from dataclasses import dataclass, field
+
+from app.repositories import ScreenshotRepository
+
+
+@dataclass
+class FakeScreenshotRepository(ScreenshotRepository):
+  saved: dict[str, str] = field(default_factory=dict)
+
+  def save(self, image: str) -> str:
+    id = f'screenshot-{len(self.saved) + 1}'
+    self.saved[id] = image
+    return id
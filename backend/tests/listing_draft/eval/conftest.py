@@ -11,7 +11,9 @@ from tests.fakes import (
   FakeApplicationRepository,
   FakeListingRepository,
   FakeListingResearchClient,
+  FakeResearchCacheRepository,
   FakeScrapingClient,
+  FakeScreenshotRepository,
 )
 
 from .golden_cases import GOLDEN_CASES, GoldenCaseId
@@ -26,6 +28,9 @@ async def run_listing_draft_eval() -> dict[GoldenCaseId, ListingDraft]:
     listing_research_client=FakeListingResearchClient(),
     llm_client=model_client,
     scraping_client=FakeScrapingClient(),
+    screenshot_repository=FakeScreenshotRepository(),
+    research_cache_repository=FakeResearchCacheRepository(),
+    settings=config,
   )
   results: dict[GoldenCaseId, ListingDraft] = {}
 
@@ -1,11 +1,14 @@
 import pytest
 
+from app.services.config.schemas import AppConfig
 from app.services.listing.service import ListingService
 from tests.fakes import (
   FakeApplicationRepository,
   FakeListingRepository,
   FakeListingResearchClient,
+  FakeResearchCacheRepository,
   FakeScrapingClient,
+  FakeScreenshotRepository,
 )
 from tests.fakes.model_client import FakeModelClient
 
@@ -20,11 +23,17 @@ def fake_scraping_client() -> FakeScrapingClient:
   return FakeScrapingClient()
 
 
+@pytest.fixture
+def fake_screenshot_repository() -> FakeScreenshotRepository:
+  return FakeScreenshotRepository()
+
+
 @pytest.fixture
 def listing_service(
   fake_listing_repository: FakeListingRepository,
   fake_model_client: FakeModelClient,
   fake_scraping_client: FakeScrapingClient,
+  fake_screenshot_repository: FakeScreenshotRepository,
 ) -> ListingService:
   return ListingService(
     listing_repository=fake_listing_repository,
@@ -32,4 +41,7 @@ def listing_service(
     listing_research_client=FakeListingResearchClient(),
     llm_client=fake_model_client,
     scraping_client=fake_scraping_client,
+    screenshot_repository=fake_screenshot_repository,
+    research_cache_repository=FakeResearchCacheRepository(),
+    settings=AppConfig(),
   )
@@ -0,0 +1,199 @@
+import threading
+from collections.abc import Iterator
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from pydantic import HttpUrl
+
+from app.schemas.listing import Money
+from app.schemas.listing_draft import ListingDraftUnique
+from app.services.listing import service as listing_service_module
+from app.services.listing.ats import (
+  AshbyExtractor,
+  AtsExtractorRegistry,
+  GreenhouseExtractor,
+  LeverExtractor,
+  WorkdayExtractor,
+)
+from app.services.listing.service import ListingService
+from tests.fakes import FakeScrapingClient
+from tests.fakes.model_client import FakeModelClient
+
+from ..factories import make_extraction_response
+
+pytestmark = pytest.mark.integration
+
+FIXTURES_DIR = Path(__file__).parents[1] / 'fixtures' / 'ats'
+GREENHOUSE_URL = 'https://job-boards.greenhouse.io/examplelabs/jobs/4012345'
+LEVER_URL = 'https://jobs.lever.co/northwind/5c3a1b2e-8f4d-4e7a-9c1b-2d3e4f5a6b7c'
+ASHBY_URL = 'https://jobs.ashbyhq.com/acme-finance/9a8b7c6d-5e4f-4a3b-2c1d-0e9f8a7b6c5d'
+WORKDAY_URL = 'https://contoso.wd5.myworkdayjobs.com/en-US/Careers/job/Toronto/Site-Reliability-Engineer_R-10422'
+
+# API paths the extractors request, relative to each stub base, mapped to recorded responses
+RECORDED_RESPONSES = {
+  '/greenhouse/examplelabs/jobs/4012345': 'greenhouse.json',
+  '/lever/northwind/5c3a1b2e-8f4d-4e7a-9c1b-2d3e4f5a6b7c': 'lever.json',
+  '/ashby/acme-finance': 'ashby.json',
+  '/ashby/reshaped-board': 'ashby_unexpected_shape.json',
+  '/workday/wday/cxs/contoso/Careers/job/Toronto/Site-Reliability-Engineer_R-10422': (
+    'workday.json'
+  ),
+}
+
+
+class RecordedApiHandler(BaseHTTPRequestHandler):
+  def do_GET(self) -> None:
+    fixture = RECORDED_RESPONSES.get(self.path)
+    body = (FIXTURES_DIR / fixture).read_bytes() if fixture else b'{}'
+    self.send_response(200 if fixture else 404)
+    self.send_header('Content-Type', 'application/json')
+    self.end_headers()
+    self.wfile.write(body)
+
+  def log_message(self, format: str, *args) -> None:
+    pass
+
+
+@pytest.fixture
+def registry() -> Iterator[AtsExtractorRegistry]:
+  server = ThreadingHTTPServer(('127.0.0.1', 0), RecordedApiHandler)
+  threading.Thread(target=server.serve_forever, daemon=True).start()
+  base = f'http://127.0.0.1:{server.server_port}'
+  yield AtsExtractorRegistry(
+    [
+      GreenhouseExtractor(api_base=f'{base}/greenhouse'),
+      LeverExtractor(api_base=f'{base}/lever'),
+      AshbyExtractor(api_base=f'{base}/ashby'),
+      WorkdayExtractor(api_base=f'{base}/workday'),
+    ]
+  )
+  server.shutdown()
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+  ('url', 'title', 'company', 'location', 'posted_date', 'description_fragment'),
+  [
+    (
+      GREENHOUSE_URL,
+      'Senior Backend Engineer, Payments',
+      'Example Labs',
+      'Singapore',
+      date(2026, 4, 20),
+      '5+ years building production backend systems.',
+    ),
+    (
+      LEVER_URL,
+      'Platform Engineer',
+      'Northwind',
+      'London, United Kingdom',
+      date(2025, 4, 19),
+      'Experience operating Kubernetes in production.',
+    ),
+    (
+      ASHBY_URL,
+      'Data Engineer',
+      'Acme Finance',
+      'New York, NY',
+      date(2026, 4, 15),
+      'Own data quality end to end.',
+    ),
+    (
+      WORKDAY_URL,
+      'Site Reliability Engineer',
+      'Contoso Financial',
+      'Toronto, Canada',
+      date(2026, 4, 25),
+      'Automate incident response.',
+    ),
+  ],
+)
+async def test_postings_are_read_from_recorded_ats_responses(
+  registry: AtsExtractorRegistry,
+  url: str,
+  title: str,
+  company: str,
+  location: str,
+  posted_date: date,
+  description_fragment: str,
+):
+  """Each extractor should map its ATS's JSON into a posting with plain-text description."""
+  posting = await registry.extract(HttpUrl(url))
+
+  assert posting is not None
+  assert (posting.title, posting.company, posting.location, posting.posted_date) == (
+    title,
+    company,
+    location,
+    posted_date,
+  )
+  assert description_fragment in posting.description
+  assert '<' not in posting.description
+
+
+@pytest.mark.anyio
+async def test_unknown_hosts_and_non_posting_paths_are_not_matched(
+  registry: AtsExtractorRegistry,
+):
+  """Only posting URLs on registered ATS hosts should be handled by an extractor."""
+  assert await registry.extract(HttpUrl('https://example.com/jobs/1')) is None
+  assert await registry.extract(HttpUrl('https://jobs.lever.co/northwind')) is None
+
+
+@pytest.mark.anyio
+async def test_unexpected_api_responses_fall_back_to_crawling(registry: AtsExtractorRegistry):
+  """A response shaped differently than the extractor expects should not raise."""
+  url = HttpUrl('https://jobs.ashbyhq.com/reshaped-board/9a8b7c6d-5e4f-4a3b-2c1d-0e9f8a7b6c5d')
+
+  assert await registry.extract(url) is None
+
+
+@pytest.fixture
+def ats_listing_service(
+  registry: AtsExtractorRegistry,
+  fake_model_client: FakeModelClient,
+  listing_service: ListingService,
+  monkeypatch: pytest.MonkeyPatch,
+) -> ListingService:
+  monkeypatch.setattr(listing_service_module, 'ats_extractors', registry)
+  return listing_service
+
+
+@pytest.mark.anyio
+async def test_ats_postings_skip_crawling_and_keep_authoritative_fields(
+  ats_listing_service: ListingService,
+  fake_scraping_client: FakeScrapingClient,
+  fake_model_client: FakeModelClient,
+):
+  """ATS postings should be extracted from the trimmed API description, not a crawl."""
+  fake_model_client.queue_structured(
+    make_extraction_response(title='Backend Engineer', company='Northwind', salary=None)
+  )
+
+  draft = await ats_listing_service.generate_listing_draft(url=HttpUrl(LEVER_URL), id=uuid4())
+
+  assert isinstance(draft, ListingDraftUnique)
+  assert fake_scraping_client.crawl_calls == []
+  assert 'Fluency with Terraform.' in fake_model_client.structured_calls[0].input
+  assert draft.listing.title == 'Platform Engineer'
+  assert draft.listing.salary == Money(value=80000, currency='GBP')
+
+
+@pytest.mark.anyio
+async def test_ats_postings_still_draft_when_the_llm_pass_fails(
+  ats_listing_service: ListingService, fake_model_client: FakeModelClient
+):
+  """A failed LLM pass should fall back to the posting rather than an error draft."""
+  fake_model_client.queue_structured(
+    make_extraction_response(title=None, company=None, domain=None, error='Not a listing')
+  )
+
+  draft = await ats_listing_service.generate_listing_draft(url=HttpUrl(GREENHOUSE_URL), id=uuid4())
+
+  assert isinstance(draft, ListingDraftUnique)
+  assert draft.listing.title == 'Senior Backend Engineer, Payments'
+  assert draft.listing.company == 'Example Labs'
+  assert draft.listing.domain == ''
@@ -10,7 +10,7 @@ from app.schemas.listing_draft import (
   ListingDraftUnique,
 )
 from app.services.listing.service import ListingService
-from tests.fakes import FakeListingRepository, FakeScrapingClient
+from tests.fakes import FakeListingRepository, FakeScrapingClient, FakeScreenshotRepository
 from tests.fakes.model_client import FakeModelClient
 
 from ..factories import (
@@ -78,7 +78,7 @@ async def test_generate_listing_draft_uses_pasted_content_without_scraping(
 
   assert isinstance(draft, ListingDraftUnique)
   assert draft.id == draft_id
-  assert draft.screenshot is None
+  assert draft.screenshot_id is None
   assert draft.listing.skills == ['Python', 'PostgreSQL', 'REST APIs']
   assert [keyword.word for keyword in draft.listing.keywords] == ['Python', 'PostgreSQL']
   assert fake_scraping_client.crawl_calls == []
@@ -93,8 +93,9 @@ async def test_generate_listing_draft_crawls_when_content_is_missing(
   listing_service: ListingService,
   fake_scraping_client: FakeScrapingClient,
   fake_model_client: FakeModelClient,
+  fake_screenshot_repository: FakeScreenshotRepository,
 ):
-  """URL-only ingestion should crawl the page and preserve the screenshot on the draft."""
+  """URL-only ingestion should crawl the page and store its screenshot for the draft."""
   fake_scraping_client.crawl_responses.append(make_crawl_result())
   fake_model_client.queue_structured(make_extraction_response())
 
@@ -104,7 +105,8 @@ async def test_generate_listing_draft_crawls_when_content_is_missing(
   )
 
   assert isinstance(draft, ListingDraftUnique)
-  assert draft.screenshot == 'base64-png'
+  assert draft.screenshot_id is not None
+  assert fake_screenshot_repository.saved[draft.screenshot_id] == 'base64-png'
   assert fake_scraping_client.crawl_calls == [NORMALIZED_JOB_URL]
   assert VALID_LISTING_CONTENT in fake_model_client.structured_calls[0].input
 
@@ -133,6 +135,7 @@ async def test_generate_listing_draft_returns_error_when_model_marks_page_invali
   listing_service: ListingService,
   fake_scraping_client: FakeScrapingClient,
   fake_model_client: FakeModelClient,
+  fake_screenshot_repository: FakeScreenshotRepository,
 ):
   """Model-detected non-listing pages should produce an editable draft error with context."""
   fake_scraping_client.crawl_responses.append(make_crawl_result(screenshot='shot'))
@@ -155,7 +158,8 @@ async def test_generate_listing_draft_returns_error_when_model_marks_page_invali
 
   assert isinstance(draft, ListingDraftError)
   assert draft.error == MODEL_INVALID_LISTING_ERROR
-  assert draft.screenshot == 'shot'
+  assert draft.screenshot_id is not None
+  assert fake_screenshot_repository.saved[draft.screenshot_id] == 'shot'
 
 
 @pytest.mark.anyio
@@ -195,6 +199,7 @@ async def test_generate_listing_draft_returns_duplicate_content_after_successful
   fake_listing_repository: FakeListingRepository,
   fake_scraping_client: FakeScrapingClient,
   fake_model_client: FakeModelClient,
+  fake_screenshot_repository: FakeScreenshotRepository,
 ):
   """Content duplicates should surface the extracted draft alongside the matched listing."""
   draft_id = uuid4()
@@ -212,7 +217,8 @@ async def test_generate_listing_draft_returns_duplicate_content_after_successful
   assert draft.id == draft_id
   assert draft.duplicate_of == duplicate
   assert draft.listing.title == 'Backend Engineer'
-  assert draft.screenshot == 'shot'
+  assert draft.screenshot_id is not None
+  assert fake_screenshot_repository.saved[draft.screenshot_id] == 'shot'
 
 
 @pytest.mark.anyio
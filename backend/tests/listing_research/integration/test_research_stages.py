@@ -0,0 +1,218 @@
+import asyncio
+from dataclasses import dataclass, field
+
+import pytest
+
+from app.schemas.listing import (
+  ApplicantInsightsResult,
+  Listing,
+  ListingResearch,
+  MarketContextResult,
+  SalaryRangeResult,
+  SentimentAnalysisResult,
+)
+from app.schemas.task_status import TaskStatus
+from app.services.config.schemas import AppConfig, IngestionPrefs
+from app.services.listing.service import ListingService
+from tests.fakes import (
+  FakeApplicationRepository,
+  FakeListingRepository,
+  FakeListingResearchClient,
+  FakeResearchCacheRepository,
+  FakeScrapingClient,
+  FakeScreenshotRepository,
+)
+from tests.fakes.model_client import FakeModelClient
+from tests.listing_draft.factories import make_listing
+
+pytestmark = pytest.mark.integration
+
+STAGE_SECONDS = 0.05
+
+
+@dataclass
+class StagedResearchClient(FakeListingResearchClient):
+  running: int = 0
+  max_running: int = 0
+  failing_stage: str | None = None
+  fail_immediately: bool = False
+  finished: list[str] = field(default_factory=list)
+
+  async def _stage(self, stage: str) -> None:
+    if stage == self.failing_stage and self.fail_immediately:
+      raise RuntimeError(f'{stage} failed')
+    self.running += 1
+    self.max_running = max(self.max_running, self.running)
+    try:
+      await asyncio.sleep(STAGE_SECONDS)
+      if stage == self.failing_stage:
+        raise RuntimeError(f'{stage} failed')
+      self.finished.append(stage)
+    finally:
+      self.running -= 1
+
+  async def get_sentiment_analysis(self, listing: Listing) -> SentimentAnalysisResult:
+    await self._stage('sentiment')
+    return SentimentAnalysisResult(value=0.7)
+
+  async def get_salary_range(self, listing: Listing) -> SalaryRangeResult:
+    await self._stage('salary')
+    return SalaryRangeResult(
+      industry_min=90_000,
+      industry_q1=110_000,
+      industry_median=125_000,
+      industry_q3=140_000,
+      industry_max=170_000,
+    )
+
+  async def get_market_context(self, listing: Listing) -> MarketContextResult:
+    await self._stage('market')
+    return MarketContextResult(summary='Hiring is steady.')
+
+  async def get_applicant_insights(
+    self,
+    listing: Listing,
+    sentiment: SentimentAnalysisResult,
+    salary: SalaryRangeResult,
+    market: MarketContextResult,
+  ) -> ApplicantInsightsResult:
+    return ApplicantInsightsResult(insights=['Highlight API design work.'])
+
+
+def make_service(
+  listing_repository: FakeListingRepository,
+  research_client: StagedResearchClient,
+  fake_model_client: FakeModelClient,
+  parallelism: int,
+) -> ListingService:
+  return ListingService(
+    listing_repository=listing_repository,
+    application_repository=FakeApplicationRepository(),
+    listing_research_client=research_client,
+    llm_client=fake_model_client,
+    scraping_client=FakeScrapingClient(),
+    screenshot_repository=FakeScreenshotRepository(),
+    research_cache_repository=FakeResearchCacheRepository(),
+    settings=AppConfig(ingestion=IngestionPrefs(research_parallelism=parallelism)),
+  )
+
+
+@pytest.mark.anyio
+async def test_research_stages_run_concurrently_and_report_partial_results(
+  fake_model_client: FakeModelClient,
+) -> None:
+  """Research stages overlap and each finished stage's result lands in the task status."""
+  listing = make_listing()
+  repository = FakeListingRepository(listings_by_id={listing.id: listing})
+  research_client = StagedResearchClient()
+  service = make_service(repository, research_client, fake_model_client, parallelism=3)
+
+  await service.generate_research_task(listing.id)
+
+  status = repository.get_research_status(listing.id)
+  assert research_client.max_running == 3
+  assert status is not None
+  assert status.status == TaskStatus.SUCCEEDED
+  assert status.stages == dict.fromkeys(('sentiment', 'salary', 'market'), TaskStatus.SUCCEEDED)
+  assert status.results['salary']['industryMedian'] == 125_000
+  research = ListingResearch.model_validate_json(repository.research_updates[listing.id])
+  assert research.market.summary == 'Hiring is steady.'
+
+
+@pytest.mark.anyio
+async def test_research_parallelism_budget_bounds_running_stages(
+  fake_model_client: FakeModelClient,
+) -> None:
+  """A parallelism budget of one runs the stages one at a time."""
+  listing = make_listing()
+  repository = FakeListingRepository(listings_by_id={listing.id: listing})
+  research_client = StagedResearchClient()
+  service = make_service(repository, research_client, fake_model_client, parallelism=1)
+
+  await service.generate_research_task(listing.id)
+
+  assert research_client.max_running == 1
+  assert sorted(research_client.finished) == ['market', 'salary', 'sentiment']
+
+
+@pytest.mark.anyio
+async def test_failed_research_stage_keeps_finished_results(
+  fake_model_client: FakeModelClient,
+) -> None:
+  """A failing stage fails the task but leaves the other stages' results in its status."""
+  listing = make_listing()
+  repository = FakeListingRepository(listings_by_id={listing.id: listing})
+  research_client = StagedResearchClient(failing_stage='market')
+  service = make_service(repository, research_client, fake_model_client, parallelism=3)
+
+  await service.generate_research_task(listing.id)
+
+  status = repository.get_research_status(listing.id)
+  assert status is not None
+  assert status.status == TaskStatus.FAILED
+  assert status.stages['market'] == TaskStatus.FAILED
+  assert status.results['sentiment']['value'] == 0.7
+  assert listing.id not in repository.research_updates
+
+
+@pytest.mark.anyio
+async def test_stages_cancelled_by_a_failure_are_marked_failed(
+  fake_model_client: FakeModelClient,
+) -> None:
+  """Stages still running or waiting when a sibling fails should not stay in progress."""
+  listing = make_listing()
+  repository = FakeListingRepository(listings_by_id={listing.id: listing})
+  research_client = StagedResearchClient(failing_stage='sentiment', fail_immediately=True)
+  service = make_service(repository, research_client, fake_model_client, parallelism=2)
+
+  await service.generate_research_task(listing.id)
+
+  status = repository.get_research_status(listing.id)
+  assert status is not None
+  assert status.status == TaskStatus.FAILED
+  assert status.stages == dict.fromkeys(('sentiment', 'salary', 'market'), TaskStatus.FAILED)
+  assert research_client.finished == []
+
+
+@pytest.mark.anyio
+async def test_fresh_company_research_is_reused_for_another_listing(
+  fake_model_client: FakeModelClient,
+) -> None:
+  """A second listing at the same company reuses sentiment but researches its own salary."""
+  first = make_listing(company='Example Co, Inc.', title='Backend Engineer')
+  second = make_listing(company='example co', title='Data Engineer')
+  repository = FakeListingRepository(listings_by_id={first.id: first, second.id: second})
+  research_client = StagedResearchClient()
+  service = make_service(repository, research_client, fake_model_client, parallelism=3)
+
+  await service.generate_research_task(first.id)
+  research_client.finished.clear()
+  await service.generate_research_task(second.id)
+
+  status = repository.get_research_status(second.id)
+  assert status is not None
+  assert status.status == TaskStatus.SUCCEEDED
+  assert sorted(research_client.finished) == ['market', 'salary']
+  assert status.results['sentiment']['value'] == 0.7
+
+
+@pytest.mark.anyio
+async def test_cached_research_that_no_longer_validates_is_researched_again(
+  fake_model_client: FakeModelClient,
+) -> None:
+  """Cached results from an older schema are treated as misses instead of failing research."""
+  listing = make_listing()
+  repository = FakeListingRepository(listings_by_id={listing.id: listing})
+  research_client = StagedResearchClient()
+  service = make_service(repository, research_client, fake_model_client, parallelism=3)
+  await service.generate_research_task(listing.id)
+  cache = service.research_cache_repository
+  cache.entries = dict.fromkeys(cache.entries, '{"legacyScore": "high"}')  # type: ignore[attr-defined]
+  research_client.finished.clear()
+
+  await service.generate_research_task(listing.id)
+
+  status = repository.get_research_status(listing.id)
+  assert status is not None
+  assert status.status == TaskStatus.SUCCEEDED
+  assert sorted(research_client.finished) == ['market', 'salary', 'sentiment']
@@ -0,0 +1,36 @@
+import asyncio
+from dataclasses import dataclass
+
+import pytest
+
+from tests.fakes.model_client import FakeModelClient
+
+pytestmark = pytest.mark.unit
+
+
+@dataclass
+class SlowBatchingModelClient(FakeModelClient):
+  max_embedding_batch_size = 2
+  running: int = 0
+  max_running: int = 0
+
+  async def embed(self, texts: list[str]) -> list[list[float]]:
+    self.running += 1
+    self.max_running = max(self.max_running, self.running)
+    await asyncio.sleep(0.01)
+    self.running -= 1
+    return await super().embed(texts)
+
+
+@pytest.mark.anyio
+async def test_embedding_groups_are_split_into_concurrent_provider_sized_batches() -> None:
+  """Distinct texts are sent in provider-sized batches at once and scattered back per group."""
+  client = SlowBatchingModelClient()
+  for index, text in enumerate(['a', 'b', 'c', 'd', 'e']):
+    client.set_embedding(text, [float(index)])
+
+  groups = await client.embed_groups([['a', 'b'], ['c', 'a'], [], ['d', 'e', 'b']])
+
+  assert groups == [[[0.0], [1.0]], [[2.0], [0.0]], [], [[3.0], [4.0], [1.0]]]
+  assert [call.texts for call in client.embedding_calls] == [['a', 'b'], ['c', 'd'], ['e']]
+  assert client.max_running == 3
@@ -0,0 +1,73 @@
+import asyncio
+import importlib
+
+import pytest
+
+from app.managers import ModelClientRegistry, model_clients
+from app.services.config import ConfigService
+from app.services.config.schemas import ModelPrefs
+
+pytestmark = pytest.mark.unit
+
+# The package re-exports the registry instance under the module's own name
+model_clients_module = importlib.import_module('app.managers.model_clients')
+
+
+def test_clients_are_shared_per_provider_and_api_key():
+  """Repeat lookups should reuse one SDK client until the key or pool settings change."""
+  registry = ModelClientRegistry()
+  prefs = ModelPrefs()
+
+  assert registry.openai('sk-one', prefs) is registry.openai('sk-one', prefs)
+  assert registry.openai('sk-one', prefs) is not registry.openai('sk-two', prefs)
+  assert registry.gemini('key', prefs) is registry.gemini('key', prefs)
+  assert registry.openai('sk-one', prefs) is not registry.openai(
+    'sk-one', ModelPrefs(max_connections=5)
+  )
+
+
+@pytest.mark.anyio
+async def test_invalidated_clients_are_rebuilt_and_closed_on_shutdown():
+  """Invalidation should hand out fresh clients and defer closing the old ones to aclose()."""
+  registry = ModelClientRegistry()
+  prefs = ModelPrefs()
+  stale = registry.http('https://cloud.example.com', 10.0, prefs)
+
+  registry.invalidate()
+  fresh = registry.http('https://cloud.example.com', 10.0, prefs)
+
+  assert fresh is not stale
+  assert not stale.is_closed
+  await registry.aclose()
+  assert stale.is_closed
+  assert fresh.is_closed
+
+
+@pytest.mark.anyio
+async def test_retired_clients_are_closed_after_their_grace_period(monkeypatch):
+  """A lookup after the grace period should close retired clients and stop tracking them."""
+  monkeypatch.setattr(model_clients_module, 'RETIRED_CLIENT_GRACE_SECONDS', 0)
+  registry = ModelClientRegistry()
+  prefs = ModelPrefs()
+  stale = registry.http('https://cloud.example.com', 10.0, prefs)
+
+  registry.invalidate()
+  fresh = registry.http('https://cloud.example.com', 10.0, prefs)
+  await asyncio.sleep(0.01)
+
+  assert stale.is_closed
+  assert not fresh.is_closed
+  await registry.aclose()
+
+
+def test_saving_model_settings_invalidates_shared_clients(tmp_path):
+  """Changing model settings should drop clients; unrelated settings should keep them warm."""
+  config_service = ConfigService(data_dir=tmp_path)
+  prefs = ModelPrefs()
+  client = model_clients.openai('sk-test', prefs)
+
+  config_service.save({'listings': {'search_k': 7}})
+  assert model_clients.openai('sk-test', prefs) is client
+
+  config_service.save({'model': {'temperature': 0.5}})
+  assert model_clients.openai('sk-test', prefs) is not client
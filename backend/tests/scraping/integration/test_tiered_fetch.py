@@ -0,0 +1,134 @@
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+from pydantic import HttpUrl
+
+from app.clients.scraping import LocalScrapingClient
+from app.clients.scraping.fetch_tiers import fetch_tier_stats
+from app.services.config.schemas import AppConfig, IngestionPrefs
+
+pytestmark = pytest.mark.integration
+
+PARAGRAPH = (
+  '<p>We are hiring a backend engineer to design, build and operate distributed services in '
+  'Python and Go. You will own features end to end, from design reviews to on-call.</p>'
+)
+PAGES = {
+  '/server-rendered': (
+    f'<html><body><main><h1>Backend Engineer</h1>{PARAGRAPH * 12}</main></body></html>'
+  ),
+  '/client-rendered': (
+    '<html><body><noscript>You need to enable JavaScript to run this app.</noscript>'
+    '<div id="root"></div><script src="/bundle.js"></script></body></html>'
+  ),
+}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+  def do_GET(self) -> None:
+    body = PAGES.get(self.path)
+    self.send_response(200 if body else 404)
+    self.send_header('Content-Type', 'text/html; charset=utf-8')
+    self.end_headers()
+    self.wfile.write((body or '').encode())
+
+  def log_message(self, format: str, *args) -> None:
+    pass
+
+
+@pytest.fixture
+def base_url() -> Iterator[str]:
+  server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+  threading.Thread(target=server.serve_forever, daemon=True).start()
+  yield f'http://127.0.0.1:{server.server_port}'
+  server.shutdown()
+
+
+@pytest.fixture
+def browser_calls(monkeypatch: pytest.MonkeyPatch) -> tuple[LocalScrapingClient, list[str]]:
+  # The crawl cache is off so every crawl reaches a fetch tier
+  config = AppConfig(
+    ingestion=IngestionPrefs(web_respect_level='optional', crawl_cache_ttl_hours=0)
+  )
+  client = LocalScrapingClient(config)
+  calls: list[str] = []
+
+  async def fake_browser_crawl(url: HttpUrl, config) -> SimpleNamespace:
+    calls.append(str(url))
+    return SimpleNamespace(
+      success=True,
+      markdown=SimpleNamespace(fit_markdown='Rendered by the browser'),
+      screenshot=None,
+      response_headers={},
+    )
+
+  monkeypatch.setattr(client, '_crawl', fake_browser_crawl)
+  fetch_tier_stats.reset()
+  return client, calls
+
+
+@pytest.mark.anyio
+async def test_server_rendered_pages_skip_the_browser(browser_calls, base_url: str):
+  """A page with enough server-rendered text should be served by the HTTP tier."""
+  client, calls = browser_calls
+
+  result = await client.crawl(HttpUrl(f'{base_url}/server-rendered'))
+
+  assert calls == []
+  assert 'distributed services' in result.content
+  assert (fetch_tier_stats.http, fetch_tier_stats.browser) == (1, 0)
+
+
+@pytest.mark.anyio
+async def test_javascript_shells_escalate_to_the_browser(browser_calls, base_url: str):
+  """An empty client-rendered shell should fall back to the browser and be counted."""
+  client, calls = browser_calls
+
+  result = await client.crawl(HttpUrl(f'{base_url}/client-rendered'))
+
+  assert len(calls) == 1
+  assert result.content == 'Rendered by the browser'
+  assert fetch_tier_stats.escalations == {'js_shell': 1}
+
+
+@pytest.mark.anyio
+async def test_tier_wins_and_escalations_are_summarized_together(browser_calls, base_url: str):
+  """The snapshot reported by the diagnostics route should cover wins and escalation reasons."""
+  client, _ = browser_calls
+  await client.crawl(HttpUrl(f'{base_url}/server-rendered'))
+  await client.crawl(HttpUrl(f'{base_url}/client-rendered'))
+
+  assert fetch_tier_stats.snapshot() == {
+    'http': 1,
+    'browser': 1,
+    'http_win_rate': 0.5,
+    'escalations': {'js_shell': 1},
+  }
+
+
+@pytest.mark.anyio
+async def test_screenshot_crawls_of_server_rendered_pages_skip_the_browser(
+  browser_calls, base_url: str
+):
+  """Asking for a screenshot should not turn the HTTP tier off; the page comes back without one."""
+  client, calls = browser_calls
+
+  result = await client.crawl(HttpUrl(f'{base_url}/server-rendered'), screenshot=True)
+
+  assert calls == []
+  assert 'distributed services' in result.content
+  assert result.screenshot is None
+
+
+@pytest.mark.anyio
+async def test_screenshot_crawls_of_javascript_shells_use_the_browser(browser_calls, base_url: str):
+  """Pages that need the browser are still rendered there, screenshot included."""
+  client, calls = browser_calls
+
+  await client.crawl(HttpUrl(f'{base_url}/client-rendered'), screenshot=True)
+
+  assert len(calls) == 1
+  assert fetch_tier_stats.http == 0
@@ -0,0 +1,70 @@
+import base64
+import io
+import os
+import time
+
+import pytest
+from PIL import Image
+
+from app.repositories import ScreenshotRepository
+from app.repositories.screenshot_repository import SCREENSHOT_RETENTION_SECONDS
+from app.services.config.schemas import AppConfig, PathsPrefs
+from app.utils.errors import NotFoundError, ValidationError
+from app.utils.images import compress_base64_image
+
+pytestmark = pytest.mark.unit
+
+
+def make_png(width: int, height: int) -> str:
+  output = io.BytesIO()
+  Image.new('RGBA', (width, height), (40, 120, 200, 255)).save(output, format='PNG')
+  return base64.b64encode(output.getvalue()).decode('ascii')
+
+
+def test_screenshots_are_downscaled_and_reencoded():
+  """Wide PNG screenshots should become narrower WebP images with the aspect ratio kept."""
+  compressed = compress_base64_image(
+    make_png(2560, 1600), image_format='webp', quality=60, max_width=1280
+  )
+
+  with Image.open(io.BytesIO(base64.b64decode(compressed))) as image:
+    assert image.format == 'WEBP'
+    assert image.size == (1280, 800)
+
+
+def test_identical_screenshots_are_stored_once(tmp_path):
+  """Saving the same image twice should return the same id and write one file."""
+  repository = ScreenshotRepository(AppConfig(paths=PathsPrefs(screenshots_dir=str(tmp_path))))
+  screenshot = compress_base64_image(make_png(100, 100), 'jpeg', 60, 1280)
+
+  first_id = repository.save(screenshot)
+  second_id = repository.save(screenshot)
+
+  assert first_id == second_id
+  assert repository.get_path(first_id).suffix == '.jpeg'
+  assert len(list(tmp_path.iterdir())) == 1
+
+
+def test_saving_an_existing_screenshot_keeps_it_from_being_pruned(tmp_path):
+  """Re-saving an old screenshot should restart its retention window before the next prune."""
+  repository = ScreenshotRepository(AppConfig(paths=PathsPrefs(screenshots_dir=str(tmp_path))))
+  screenshot = compress_base64_image(make_png(100, 100), 'jpeg', 60, 1280)
+  screenshot_id = repository.save(screenshot)
+  expired = time.time() - SCREENSHOT_RETENTION_SECONDS - 60
+  os.utime(repository.get_path(screenshot_id), (expired, expired))
+
+  repository.save(screenshot)
+  repository.save(compress_base64_image(make_png(120, 80), 'jpeg', 60, 1280))
+
+  assert repository.get_path(screenshot_id).exists()
+  assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_invalid_screenshots_and_unknown_ids_are_rejected(tmp_path):
+  """Non-image data should not be stored and unknown ids should not resolve to files."""
+  repository = ScreenshotRepository(AppConfig(paths=PathsPrefs(screenshots_dir=str(tmp_path))))
+
+  with pytest.raises(ValidationError):
+    repository.save(base64.b64encode(b'<html></html>').decode('ascii'))
+  with pytest.raises(NotFoundError):
+    repository.get_path('../db.sqlite3')
@@ -0,0 +1,37 @@
+import pytest
+
+from app.utils.similarity import cosine_similarity, max_similarities, top_k_similar
+
+pytestmark = pytest.mark.unit
+
+
+def test_max_similarities_takes_the_best_candidate_for_each_query():
+  """Each query should score its closest candidate, ignoring vector magnitude."""
+  scores = max_similarities(
+    [[2.0, 0.0], [0.0, 3.0], [1.0, 1.0]],
+    [[1.0, 0.0], [-1.0, 0.0]],
+  )
+
+  assert scores == pytest.approx([1.0, 0.0, 2**-0.5])
+
+
+def test_max_similarities_scores_zero_vectors_and_missing_candidates_as_zero():
+  """Zero vectors and an empty candidate list should score 0.0 rather than NaN."""
+  assert max_similarities([[0.0, 0.0]], [[1.0, 0.0]]) == [0.0]
+  assert max_similarities([[1.0, 0.0], [0.0, 1.0]], []) == [0.0, 0.0]
+  assert cosine_similarity([0.0, 0.0], [1.0, 0.0]) == 0.0
+
+
+def test_top_k_similar_returns_the_closest_candidates_in_order():
+  """Top-k should rank candidates by similarity and drop those under the threshold."""
+  candidates = [[0.0, 1.0], [1.0, 0.1], [1.0, 0.0], [1.0, 1.0]]
+
+  matches = top_k_similar([1.0, 0.0], candidates, k=3)
+  assert [index for index, _ in matches] == [2, 1, 3]
+  assert matches[0][1] == pytest.approx(1.0)
+
+  assert [index for index, _ in top_k_similar([1.0, 0.0], candidates, k=3, threshold=0.9)] == [
+    2,
+    1,
+  ]
+  assert top_k_similar([1.0, 0.0], [], k=3) == []
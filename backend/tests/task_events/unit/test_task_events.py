@@ -0,0 +1,57 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+from app.managers import TaskEventBroker, task_events
+from app.schemas.task_status import TaskStatus, TaskStatusEntry
+from app.utils.sse import stream_task_status
+
+pytestmark = pytest.mark.unit
+
+
+async def never_disconnected() -> bool:
+  return False
+
+
+@pytest.mark.anyio
+async def test_statuses_published_from_another_thread_reach_subscribers() -> None:
+  """Publishing from a worker thread hands the status to the subscriber's event loop."""
+  broker = TaskEventBroker()
+
+  with broker.subscribe('research', 'listing-1') as updates:
+    publisher = threading.Thread(
+      target=broker.publish,
+      args=('research', 'listing-1', TaskStatusEntry(status=TaskStatus.RUNNING)),
+    )
+    publisher.start()
+    entry = await asyncio.wait_for(updates.get(), timeout=1)
+    publisher.join()
+
+  assert entry.status == TaskStatus.RUNNING
+  assert broker.subscriber_count('research', 'listing-1') == 0
+
+
+@pytest.mark.anyio
+async def test_status_stream_sends_changes_until_the_task_finishes() -> None:
+  """The stream starts with the current status and ends after the task succeeds."""
+
+  async def get_current() -> TaskStatusEntry:
+    return TaskStatusEntry(status=TaskStatus.PENDING)
+
+  stream = stream_task_status('research', 'listing-2', get_current, never_disconnected)
+
+  events = [await anext(stream)]
+  task_events.publish(
+    'research',
+    'listing-2',
+    TaskStatusEntry(status=TaskStatus.RUNNING, stages={'salary': 'running'}),
+  )
+  task_events.publish('research', 'listing-2', TaskStatusEntry(status=TaskStatus.SUCCEEDED))
+  events.extend([event async for event in stream])
+
+  payloads = [json.loads(event.split('data: ', 1)[1]) for event in events]
+  assert [payload['status'] for payload in payloads] == ['pending', 'running', 'succeeded']
+  assert payloads[1]['stages'] == {'salary': 'running'}
+  assert all(event.startswith('event: status\n') for event in events)
@@ -0,0 +1,42 @@
+import pytest
+
+from app.managers import MemoryTaskStore
+from app.managers import task_store as task_store_module
+from app.schemas.task_status import TaskStatus, TaskStatusEntry, advance_task_status
+
+pytestmark = pytest.mark.unit
+
+
+def test_memory_task_store_drops_expired_and_least_recently_updated_entries(
+  monkeypatch: pytest.MonkeyPatch,
+) -> None:
+  """Entries expire after the TTL, and the oldest updates go once the store is full."""
+  now = [1000.0]
+  monkeypatch.setattr(task_store_module.time, 'monotonic', lambda: now[0])
+  store = MemoryTaskStore(ttl_seconds=60, max_entries=2)
+
+  store.set('research', 'a', TaskStatusEntry(status=TaskStatus.RUNNING))
+  store.set('research', 'b', TaskStatusEntry(status=TaskStatus.RUNNING))
+  store.set('research', 'a', TaskStatusEntry(status=TaskStatus.SUCCEEDED))
+  store.set('research', 'c', TaskStatusEntry(status=TaskStatus.PENDING))
+
+  assert store.get('research', 'b') is None
+  assert len(store) == 2
+
+  now[0] += 61
+  assert store.get('research', 'a') is None
+
+
+def test_task_status_transitions_record_timestamps() -> None:
+  """Queuing, starting and finishing a task stamp its timestamps and keep stage progress."""
+  queued = advance_task_status(None, TaskStatus.PENDING)
+  running = advance_task_status(queued, TaskStatus.RUNNING)
+  running = running.model_copy(update={'stages': {'salary': TaskStatus.SUCCEEDED}})
+  finished = advance_task_status(running, TaskStatus.FAILED, 'Search failed.')
+
+  assert queued.created_at is not None and queued.started_at is None
+  assert finished.created_at == queued.created_at
+  assert finished.started_at == running.started_at
+  assert finished.duration_seconds is not None and finished.duration_seconds >= 0
+  assert (finished.error, finished.stages) == ('Search failed.', {'salary': TaskStatus.SUCCEEDED})
+  assert advance_task_status(finished, TaskStatus.PENDING).stages == {}
@@ -0,0 +1,64 @@
+import { type QueryKey, useQueryClient } from '@tanstack/react-query';
+import { useEffect } from 'react';
+
+import type { TaskStatusEntry } from '@/types/task-status.types';
+
+const RECONNECT_BASE_DELAY_MS = 1_000;
+const RECONNECT_MAX_DELAY_MS = 30_000;
+
+function isFinished(entry: TaskStatusEntry | undefined): boolean {
+  return entry === null || entry?.status === 'succeeded' || entry?.status === 'failed';
+}
+
+/**
+ * Keeps a task status query up to date from a server-sent event stream while `enabled`,
+ * instead of polling. The server closes the stream once the task finishes; if the stream drops
+ * first, it is reopened with backoff for as long as the task is still in progress.
+ */
+export function useTaskStatusStream(url: string, queryKey: QueryKey, enabled: boolean) {
+  const queryClient = useQueryClient();
+
+  useEffect(() => {
+    if (!enabled) {
+      return;
+    }
+
+    let source: EventSource | undefined;
+    let reconnectTimer: ReturnType<typeof setTimeout> | undefined;
+    let attempts = 0;
+
+    const connect = () => {
+      if (isFinished(queryClient.getQueryData<TaskStatusEntry>(queryKey))) {
+        return;
+      }
+
+      const current = new EventSource(url);
+      source = current;
+      current.addEventListener('status', (event) => {
+        attempts = 0;
+        const entry = JSON.parse((event as MessageEvent<string>).data) as TaskStatusEntry;
+        queryClient.setQueryData(queryKey, entry);
+        if (isFinished(entry)) {
+          current.close();
+        }
+      });
+      current.onerror = () => {
+        // Close rather than let EventSource retry at its own fixed rate, refresh the last known
+        // status, and reopen the stream with backoff while the task is still running
+        current.close();
+        queryClient.invalidateQueries({ queryKey });
+        const delay = Math.min(RECONNECT_BASE_DELAY_MS * 2 ** attempts, RECONNECT_MAX_DELAY_MS);
+        attempts += 1;
+        reconnectTimer = setTimeout(connect, delay);
+      };
+    };
+
+    connect();
+
+    return () => {
+      clearTimeout(reconnectTimer);
+      source?.close();
+    };
+    // eslint-disable-next-line react-hooks/exhaustive-deps -- the key is derived from the url
+  }, [url, enabled, queryClient]);
+}
@@ -4,13 +4,12 @@ import { useEffect } from 'react';
 import { LuCopy, LuRefreshCw } from 'react-icons/lu';
 
 import { FeatureTooltip } from '@/components/custom/feature-tooltip';
+import { useTaskStatusStream } from '@/hooks/use-task-status-stream.hooks';
 import { useGenerateListingResearch } from '@/mutations/listing.mutations';
 import { listingsQueries } from '@/queries/listing.queries';
 import type { ListingResearch } from '@/types/listing.types';
 import type { TaskStatus } from '@/types/task-status.types';
 
-const RESEARCH_POLLING_INTERVAL = 2000;
-
 function buildClipboardText(research: ListingResearch | null): string {
   if (!research) return '';
 
@@ -39,15 +38,15 @@ export function ResearchFooter({
 }) {
   const { mutate: generateResearch } = useGenerateListingResearch();
 
-  const { data: statusData } = useQuery({
-    ...listingsQueries.researchStatus(listingId),
-    refetchInterval: (query) => {
-      const status = query.state.data?.status;
-      return isResearchInProgress(status) ? RESEARCH_POLLING_INTERVAL : false;
-    },
-  });
+  const statusQuery = listingsQueries.researchStatus(listingId);
+  const { data: statusData } = useQuery(statusQuery);
 
   const isResearching = isResearchInProgress(statusData?.status);
+  useTaskStatusStream(
+    `/api/listings/${listingId}/research/events`,
+    statusQuery.queryKey,
+    isResearching
+  );
 
   useEffect(() => {
     if (!isResearching) {
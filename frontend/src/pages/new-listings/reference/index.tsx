@@ -8,7 +8,7 @@ import { Info } from './Info';
 import { Source } from './source';
 
 export function Reference({ listing }: { listing: ListingDraft | null }) {
-  const hasScreenshot = !!listing && 'screenshot' in listing && !!listing.screenshot;
+  const hasScreenshot = !!listing && 'screenshotId' in listing && !!listing.screenshotId;
 
   const showSource = hasScreenshot;
   const showInfo = listing && listing.status !== 'pending';
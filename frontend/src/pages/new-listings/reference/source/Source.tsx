@@ -3,10 +3,9 @@ import { Box, Image, Text, VStack } from '@chakra-ui/react';
 import type { ListingDraft } from '@/types/listing-draft.types';
 
 export function Source({ listing }: { listing: ListingDraft }) {
-  // Get screenshot from listing (base64-encoded PNG)
-  const screenshot = (listing as { screenshot?: string }).screenshot;
+  const screenshotId = 'screenshotId' in listing ? listing.screenshotId : null;
 
-  if (!screenshot) {
+  if (!screenshotId) {
     return (
       <Box w="full" h="full" display="flex" alignItems="center" justifyContent="center">
         <VStack>
@@ -19,7 +18,7 @@ export function Source({ listing }: { listing: ListingDraft }) {
   return (
     <Box w="full" minW="0" h="full" overflowY="auto" overflowX="hidden" p={4}>
       <Image
-        src={`data:image/png;base64,${screenshot}`}
+        src={`/api/screenshots/${screenshotId}`}
         alt="Listing page screenshot"
         w="full"
         maxW="full"
@@ -4,13 +4,12 @@ import { useEffect } from 'react';
 import { LuRefreshCw } from 'react-icons/lu';
 
 import { FeatureTooltip } from '@/components/custom/feature-tooltip';
+import { useTaskStatusStream } from '@/hooks/use-task-status-stream.hooks';
 import { useGenerateApplicationAnalysis } from '@/mutations/application.mutations';
 import { applicationQueries } from '@/queries/application.queries';
 import type { ApplicationAnalysis } from '@/types/application.types';
 import type { TaskStatus } from '@/types/task-status.types';
 
-const ANALYSIS_POLLING_INTERVAL = 2000;
-
 function isAnalysisInProgress(status: TaskStatus | undefined): boolean {
   return status === 'pending' || status === 'running';
 }
@@ -26,15 +25,15 @@ export function AnalysisFooter({
 }) {
   const { mutate: generateAnalysis } = useGenerateApplicationAnalysis();
 
-  const { data: statusData } = useQuery({
-    ...applicationQueries.analysisStatus(applicationId),
-    refetchInterval: (query) => {
-      const status = query.state.data?.status;
-      return isAnalysisInProgress(status) ? ANALYSIS_POLLING_INTERVAL : false;
-    },
-  });
+  const statusQuery = applicationQueries.analysisStatus(applicationId);
+  const { data: statusData } = useQuery(statusQuery);
 
   const isAnalyzing = isAnalysisInProgress(statusData?.status);
+  useTaskStatusStream(
+    `/api/applications/${applicationId}/analysis/events`,
+    statusQuery.queryKey,
+    isAnalyzing
+  );
 
   useEffect(() => {
     if (!isAnalyzing) {
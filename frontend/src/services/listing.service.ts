@@ -2,7 +2,7 @@ import type { StatusEnum } from '@/types/application.types';
 import type { Page } from '@/types/common.types';
 import type { Listing, ListingSummary } from '@/types/listing.types';
 import type { ListingDraft } from '@/types/listing-draft.types';
-import type { TaskStatusEntry } from '@/types/task-status.types';
+import type { ResearchQueueProgress, TaskStatusEntry } from '@/types/task-status.types';
 
 export async function ingestListing(
   url: string,
@@ -140,6 +140,34 @@ export async function generateListingResearch(listingId: string): Promise<TaskSt
   return await response.json();
 }
 
+export async function queueListingResearch(
+  ids: string[],
+  priority = 0
+): Promise<ResearchQueueProgress> {
+  const response = await fetch('/api/listings/research', {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ ids, priority }),
+  });
+
+  if (!response.ok) {
+    throw response;
+  }
+
+  return await response.json();
+}
+
+export async function getResearchQueueProgress(batchId?: string): Promise<ResearchQueueProgress> {
+  const query = batchId ? `?batch-id=${encodeURIComponent(batchId)}` : '';
+  const response = await fetch(`/api/listings/research/progress${query}`);
+
+  if (!response.ok) {
+    throw response;
+  }
+
+  return await response.json();
+}
+
 export async function getListingResearchStatus(listingId: string): Promise<TaskStatusEntry | null> {
   const response = await fetch(`/api/listings/${listingId}/research/status`);
 
@@ -130,6 +130,7 @@ export type ApplicationAnalysis = {
   skillsComparison: SkillComparisonRow[];
   contentQuality: ContentQualitySection[];
   aiSuggestions: AISuggestions | null;
+  stageTimings: Record<string, number>;
 };
 
 export type Application = {
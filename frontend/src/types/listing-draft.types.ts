@@ -34,6 +34,7 @@ export type ListingDraftUnique = BaseListingDraft & {
   status: 'unique';
   listing: ListingExtraction;
   html: string | null;
+  screenshotId: string | null;
 };
 
 export type ListingDraftDuplicateUrl = BaseListingDraft & {
@@ -46,12 +47,14 @@ export type ListingDraftDuplicateContent = BaseListingDraft & {
   listing: ListingExtraction;
   duplicateOf: Listing;
   html: string | null;
+  screenshotId: string | null;
 };
 
 export type ListingDraftError = BaseListingDraft & {
   status: 'error';
   error: string;
   html: string | null;
+  screenshotId: string | null;
 };
 
 export type ListingDraftPending = BaseListingDraft & {
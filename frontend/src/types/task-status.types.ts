@@ -3,4 +3,18 @@ export type TaskStatus = 'pending' | 'running' | 'succeeded' | 'failed' | null;
 export type TaskStatusEntry = {
   status: TaskStatus;
   error: string | null;
+  stages: Record<string, TaskStatus>;
+  results: Record<string, unknown>;
+  createdAt: string | null;
+  startedAt: string | null;
+  finishedAt: string | null;
 } | null;
+
+export type ResearchQueueProgress = {
+  batchId: string | null;
+  total: number;
+  pending: number;
+  running: number;
+  succeeded: number;
+  failed: number;
+};
@@ -52,3 +52,5 @@ class ApplicationAnalysis(CamelModel):
   skills_comparison: list[SkillComparisonRow] = Field(default_factory=list)
   content_quality: list[ContentQualitySection] = Field(default_factory=list)
   ai_suggestions: AISuggestions | None = None
+  # Seconds each analysis stage took, keyed by stage name
+  stage_timings: dict[str, float] = Field(default_factory=dict)